@@ -0,0 +1,236 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+import os
+import re
+import sys
+from collections.abc import Iterable
+from itertools import chain
+from core.instruction import Instruction, LOAD_OPCODES, STORE_OPCODES
+from core.rv32i import store_instruction
+
+VALID_EXTENSIONS = {'.s', '.asm'}
+BRANCH_OPCODES = {"beq", "bne", "blt", "bge", "bltu", "bgeu"}
+# Instrucciones que pueden llevar una etiqueta como destino o desplazamiento
+LABEL_OPCODES = BRANCH_OPCODES | {"jal", "jalr"} | LOAD_OPCODES | STORE_OPCODES
+
+# Comentarios tipo # o //: se descarta desde el primero
+_COMMENT = re.compile(r"#|//")
+# Una etiqueta al inicio de la línea ("loop:"), con los espacios que la siguen
+_LABEL = re.compile(r"([^:]*):\s*")
+# Tokens separados por comas o espacios; un operando de memoria "off(rs1)" es un solo token
+_TOKEN = re.compile(r"[^\s,(]*\([^)]*\)|[^\s,]+")
+# Operando de memoria con desplazamiento numérico o etiqueta
+_MEM_OPERAND = re.compile(r"(-?\w+)\((\w+)\)")
+_NUMBER = re.compile(r"[+-]?(?:0[xX][0-9a-fA-F]+|0[bB][01]+|0[oO][0-7]+|\d+)")
+
+"""
+Class: Assembler
+Ensamblador de dos pasadas. La fuente se recorre una sola vez, línea por línea, con un generador
+(_statements):
+
+- Pasada 1 (scan): registra la dirección de cada etiqueta y, por cada instrucción, su texto con el
+  mnemónico y los operandos ya separados.
+- Pasada 2 (instructions): resuelve las etiquetas (saltos tipo B, jal, jalr y desplazamientos de
+  loads/stores) sobre esos operandos y crea cada Instruction con Instruction.from_operands, sin
+  volver a leer ni a dividir el texto.
+
+assemble() escribe las instrucciones directamente en la memoria de instrucciones como código
+máquina RV32I (y en la caché de decodificación), sin pasar por la lista de textos de load_program.
+La fuente puede ser la ruta de un archivo .s/.asm o cualquier iterable de líneas (lista, generador
+o archivo abierto).
+
+Attributes:
+- base_address: int - dirección de la primera instrucción.
+- labels: dict - etiqueta → dirección (después de scan).
+- count: int - instrucciones del programa (después de scan).
+- _fields: list - (texto, (mnemónico, operandos...)) de cada instrucción, en orden (después de scan).
+
+Methods:
+- scan: Primera pasada (etiquetas y cantidad de instrucciones).
+- instructions: Segunda pasada; genera las instrucciones.
+- assemble: Ensambla directamente en una memoria de instrucciones.
+
+Example:
+    asm = Assembler()
+    total = asm.assemble("programa.s", cpu.instr_mem, cpu.decode_cache)
+"""
+
+class Assembler:
+    def __init__(self, base_address: int = 0):
+        self.base_address = base_address
+        self.labels = {}
+        self.count = 0
+        self._fields = []
+
+    @staticmethod
+    def _source_lines(source):
+        """
+        Function: _source_lines
+        Genera las líneas de la fuente: abre el archivo si source es una ruta.
+        Restriction:
+        Lanza TypeError si source no es una ruta ni un iterable de líneas.
+        """
+        if not isinstance(source, str):
+            if not isinstance(source, Iterable):
+                raise TypeError(f"Fuente inválida ({type(source).__name__}): se requiere una ruta o una lista de líneas")
+            yield from source
+            return
+        if not os.path.isfile(source):
+            raise FileNotFoundError(f"Archivo no encontrado: {source}")
+        _, ext = os.path.splitext(source)
+        if ext not in VALID_EXTENSIONS:
+            raise ValueError(f"Extensión inválida: '{ext}'. Se requiere .s o .asm")
+        with open(source, 'r') as file:
+            yield from file
+
+    def _statements(self, source):
+        """
+        Function: _statements
+        Genera (etiquetas, instrucción) por cada línea con contenido, sin comentarios.
+        La instrucción es "" si la línea solo tenía etiquetas.
+        """
+        split_comment = _COMMENT.split
+        match_label = _LABEL.match
+        for line in self._source_lines(source):
+            text = split_comment(line, 1)[0].strip()
+            if not text:
+                continue
+            labels = []
+            match = match_label(text) if ':' in text else None
+            while match:
+                labels.append(match.group(1).strip())
+                text = text[match.end():]
+                match = match_label(text)
+            yield labels, text
+
+    def scan(self, source) -> int:
+        """
+        Function: scan
+        Primera pasada: dirección de cada etiqueta y campos (mnemónico y operandos) de cada instrucción.
+        Returns:
+        - int: cantidad de instrucciones.
+        """
+        labels = {}
+        fields = []
+        append = fields.append
+        tokens = self._tokens
+        address = self.base_address
+        for line_labels, text in self._statements(source):
+            for label in line_labels:
+                labels[label] = address
+            if text:
+                append((text, tokens(text)))
+                address += 4
+        self.labels = labels
+        self._fields = fields
+        self.count = len(fields)
+        return self.count
+
+    @staticmethod
+    def _tokens(text: str) -> tuple:
+        """
+        Function: _tokens
+        Separa el mnemónico y los operandos igual que Instruction. Las instrucciones que aceptan
+        etiquetas usan _TOKEN, que deja "etiqueta(rs1)" como un solo operando. Con cientos de miles
+        de instrucciones guardadas, la tupla evita que el recolector de basura las recorra y
+        sys.intern comparte los mnemónicos y registros repetidos.
+        Returns:
+        - tuple[str]: (mnemónico, operando1, ...).
+        """
+        tokens = text.replace(',', '').split()
+        if tokens[0] in LABEL_OPCODES:
+            tokens = _TOKEN.findall(text)
+        return tuple(map(sys.intern, tokens))
+
+    def instructions(self, source):
+        """
+        Function: instructions
+        Segunda pasada (hace scan antes): genera las instrucciones con las etiquetas resueltas.
+        Params:
+        - source: str o Sequence[str] - ruta de un archivo .s/.asm o líneas del programa.
+        Returns:
+        - generador de Instruction, en orden de dirección.
+        Example:
+            lineas = [instr.raw_text for instr in Assembler().instructions("programa.s")]
+        """
+        self.scan(source)
+        fields, self._fields = self._fields, []
+        address = self.base_address
+        for text, tokens in fields:
+            opcode = tokens[0]
+            operands = list(tokens[1:])
+            if opcode in LABEL_OPCODES and self._resolve(opcode, operands, address):
+                text = f"{opcode} {', '.join(operands)}"  # Texto con el offset, para mostrarlo
+            try:
+                instr = Instruction.from_operands(text, address, opcode, operands)
+                if not instr.is_valid():
+                    raise ValueError(f"Instrucción inválida o no soportada: '{text}' en PC={address}")
+            except Exception as e:
+                raise ValueError(f"Error al parsear instrucción en PC={address}: {e}")
+            yield instr
+            address += 4
+
+    def _resolve(self, opcode: str, operands: list, address: int) -> bool:
+        """
+        Function: _resolve
+        Reemplaza en operands una etiqueta usada como destino o desplazamiento por su offset
+        relativo a address.
+        Returns:
+        - bool: True si había una etiqueta (operands cambió).
+        """
+        if not operands:
+            return False
+        if opcode in BRANCH_OPCODES or (opcode == "jal" and len(operands) <= 2):
+            index = len(operands) - 1  # beq rs1, rs2, label;  jal label  o  jal rd, label
+        elif len(operands) == 2:  # jalr, loads y stores: rd, etiqueta(rs1)
+            match = _MEM_OPERAND.match(operands[1])
+            if match is None:
+                return False
+            label, rs1 = match.groups()
+            if _NUMBER.fullmatch(label):
+                return False
+            operands[1] = f"{self._offset(label, address)}({rs1})"
+            return True
+        else:
+            return False
+        if _NUMBER.fullmatch(operands[index]):
+            return False
+        operands[index] = str(self._offset(operands[index], address))
+        return True
+
+    def _offset(self, label: str, address: int) -> int:
+        if label not in self.labels:
+            raise ValueError(f"Etiqueta no encontrada: {label}")
+        return self.labels[label] - address
+
+    def assemble(self, source, instr_mem, decode_cache=None) -> int:
+        """
+        Function: assemble
+        Ensambla la fuente directamente en la memoria de instrucciones: la pasada 1 dimensiona la
+        memoria y la pasada 2 guarda cada instrucción codificada (core/rv32i.py) en su dirección.
+        Params:
+        - source: str o Sequence[str] - ruta de un archivo .s/.asm o líneas del programa.
+        - instr_mem: InstructionMemory - memoria destino.
+        - decode_cache: DecodeCache o None - se llena con la micro-op de cada instrucción.
+        Returns:
+        - int: cantidad de instrucciones ensambladas.
+        Una instrucción cuyo inmediato no cabe en su formato RV32I (por ejemplo un salto a una etiqueta
+        lejana) se guarda como Instruction, igual que en load_program (ver core/rv32i.to_memory_word).
+        """
+        instructions = self.instructions(source)
+        first = next(instructions, None)  # La pasada 1 ya corrió: se conoce el tamaño
+        instr_mem.ensure_words((self.base_address >> 2) + self.count)
+        if first is None:
+            return 0
+        for instr in chain((first,), instructions):
+            store_instruction(instr, instr_mem, decode_cache)
+        return self.count
@@ -1,6 +1,7 @@
 import os
 import json
 from typing import Any
+from InOut.metrics import METRIC_KEYS
 
 class ExecutionHistory:
     """
@@ -43,20 +44,10 @@ class ExecutionHistory:
         self._save_history()
 
     def _metrics_to_dict(self, metrics):
-        # Convierte el objeto Metrics a dict serializable
-        return {
-            "name": getattr(metrics, "name", ""),
-            "ciclos_totales": getattr(metrics, "ciclos_totales", 0),
-            "instrucciones_retiradas": getattr(metrics, "instrucciones_retiradas", 0),
-            "branches_totales": getattr(metrics, "branches_totales", 0),
-            "branches_acertados": getattr(metrics, "branches_acertados", 0),
-            "cpi": (metrics.ciclos_totales / metrics.instrucciones_retiradas)
-                if getattr(metrics, "instrucciones_retiradas", 0) else 0.0,
-            "branch_accuracy": (
-                (metrics.branches_acertados / metrics.branches_totales) * 100
-                if getattr(metrics, "branches_totales", 0) else None
-            )
-        }
+        # Convierte el objeto Metrics (o un registro de simulate_job) a dict serializable
+        if isinstance(metrics, dict):
+            return {key: metrics[key] for key in METRIC_KEYS if key in metrics}
+        return metrics.to_dict()
 
     def _save_history(self):
         try:
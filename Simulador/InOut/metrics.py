@@ -1,9 +1,10 @@
-from core.instruction import Instruction
 import time
 
 class Metrics:
     def __init__(self, name=""):
         self.name = name
+        self.caches = None  # CacheHierarchy del procesador, si modela cachés
+        self.profile = None  # StageProfiler (core/profiler.py), si se midió el tiempo por etapa
         self.reset()
 
     def reset(self):
@@ -11,8 +12,10 @@ class Metrics:
         self.instrucciones_retiradas = 0
         self.branches_totales = 0
         self.branches_acertados = 0
+        self.ciclos_stall_memoria = 0
         self.start_time = None
         self.end_time = None
+        self.simulated_time = 0.0
 
     def start_timer(self):
         self.start_time = time.perf_counter()
@@ -25,21 +28,65 @@ class Metrics:
             return self.end_time - self.start_time
         return 0.0
 
+    def snapshot(self) -> tuple:
+        """Devuelve los contadores de la simulación (historial inverso); no incluye los tiempos reales."""
+        return (self.ciclos_totales, self.instrucciones_retiradas, self.branches_totales,
+                self.branches_acertados, self.ciclos_stall_memoria, self.simulated_time)
+
+    def restore(self, snapshot: tuple):
+        """Restaura los contadores tomados con snapshot(); la ejecución vuelve a estar en curso."""
+        (self.ciclos_totales, self.instrucciones_retiradas, self.branches_totales,
+         self.branches_acertados, self.ciclos_stall_memoria, self.simulated_time) = snapshot
+        self.end_time = None
+
     def tick(self):
         """Incrementa el conteo de ciclos."""
         self.ciclos_totales += 1
 
-    def track_writeback(self, instr: Instruction):
+    def track_simulated_time(self, simulated_time: float):
+        """Registra el tiempo simulado acumulado (segundos) según el reloj virtual del procesador."""
+        self.simulated_time = simulated_time
+
+    def track_writeback(self, instr):
         """Se llama cuando una instrucción alcanza WB (retirada)."""
         if instr.opcode != "nop":
             self.instrucciones_retiradas += 1
 
-    def track_branch(self, predicted: bool, actual: bool):
-        """Se llama para cada instrucción tipo branch para comparar predicción vs resultado real."""
+    def track_branch(self, predicted: bool, actual: bool, mispredicted: bool = None):
+        """
+        Se llama para cada instrucción tipo branch para comparar predicción vs resultado real.
+        mispredicted permite contar como fallo un destino mal predicho (BTB) aunque la dirección coincida.
+        """
         self.branches_totales += 1
-        if predicted == actual:
+        if mispredicted is None:
+            mispredicted = predicted != actual
+        if not mispredicted:
             self.branches_acertados += 1
 
+    def to_dict(self) -> dict:
+        """Devuelve las métricas como diccionario serializable (JSON/CSV, historial, procesos)."""
+        result = {
+            "name": self.name,
+            "ciclos_totales": self.ciclos_totales,
+            "instrucciones_retiradas": self.instrucciones_retiradas,
+            "branches_totales": self.branches_totales,
+            "branches_acertados": self.branches_acertados,
+            "tiempo_simulado": self.simulated_time,
+            "tiempo_ejecucion": self.get_elapsed_time(),
+            "cpi": (self.ciclos_totales / self.instrucciones_retiradas)
+                if self.instrucciones_retiradas else 0.0,
+            "branch_accuracy": (
+                (self.branches_acertados / self.branches_totales) * 100
+                if self.branches_totales else None
+            ),
+            "ciclos_stall_memoria": self.ciclos_stall_memoria,
+        }
+        if self.caches is not None:
+            result["caches"] = self.caches.stats()
+        if self.profile is not None:
+            result["perfil"] = self.profile.report()
+        return result
+
     def display(self, pipeline=None):
         """
         Imprime las métricas recolectadas.
@@ -69,6 +116,27 @@ class Metrics:
         else:
             print("  No se ejecutaron instrucciones de salto.")
 
+        if self.caches is not None:
+            print(f"  Ciclos de stall por memoria : {self.ciclos_stall_memoria}")
+            for cache_name, stats in self.caches.stats().items():
+                rate = stats["tasa_aciertos"]
+                rate_text = f"{rate:.2f}%" if rate is not None else "-"
+                print(f"  {cache_name:<4} aciertos/fallos      : {stats['aciertos']}/{stats['fallos']} ({rate_text})")
+
+        if self.profile is not None:
+            print("  Tiempo del host por sección :")
+            for section, entry in self.profile.report().items():
+                share = entry["porcentaje"]
+                share_text = f"{share:.1f}%" if share is not None else "-"
+                print(f"    {section:<10} {entry['ns'] / 1e6:10.3f} ms  {share_text:>6}")
+
         # --- Nueva métrica: tiempo de ejecución ---
         elapsed = self.get_elapsed_time()
         print(f"  Tiempo de ejecución (s)     : {elapsed:.6f}")
+        print(f"  Tiempo simulado (ns)        : {self.simulated_time * 1e9:.2f}")
+
+
+# Claves de Metrics.to_dict(), para extraer las métricas de un registro de resultados
+METRIC_KEYS = ("name", "ciclos_totales", "instrucciones_retiradas", "branches_totales",
+               "branches_acertados", "tiempo_simulado", "tiempo_ejecucion", "cpi", "branch_accuracy",
+               "ciclos_stall_memoria", "caches", "perfil")
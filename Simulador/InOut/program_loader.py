@@ -1,7 +1,9 @@
 import os
+import struct
 
 class ProgramLoader:
     VALID_EXTENSIONS = {'.s', '.asm'}
+    BINARY_EXTENSIONS = {'.bin'}
 
     @staticmethod
     def load_program(filepath: str) -> list[str]:
@@ -30,6 +32,45 @@ class ProgramLoader:
                     lines.append(clean)
         return lines
 
+    @staticmethod
+    def load_binary(filepath: str) -> list[int]:
+        """
+        Carga una imagen plana de código máquina RV32I (.bin): palabras de 32 bits
+        little-endian a partir de la dirección 0.
+
+        Params:
+            filepath (str): Ruta del archivo
+
+        Returns:
+            list[int]: Palabras de la imagen
+        """
+        if not os.path.isfile(filepath):
+            raise FileNotFoundError(f"Archivo no encontrado: {filepath}")
+
+        _, ext = os.path.splitext(filepath)
+        if ext not in ProgramLoader.BINARY_EXTENSIONS:
+            raise ValueError(f"Extensión inválida: '{ext}'. Se requiere .bin")
+
+        with open(filepath, 'rb') as file:
+            data = file.read()
+        if len(data) % 4:
+            raise ValueError(f"La imagen {filepath} no tiene un número entero de palabras de 32 bits")
+        # '<I': 4 bytes little-endian en cualquier plataforma (array('I') depende del compilador de C)
+        return list(struct.unpack(f"<{len(data) // 4}I", data))
+
+    @staticmethod
+    def save_binary(filepath: str, words: list[int]):
+        """
+        Guarda palabras de 32 bits como imagen .bin little-endian (el formato de load_binary).
+
+        Params:
+            filepath (str): Ruta del archivo
+            words (list[int]): Palabras RV32I (por ejemplo, de core.rv32i.encode)
+        """
+        image = struct.pack(f"<{len(words)}I", *(word & 0xFFFFFFFF for word in words))
+        with open(filepath, 'wb') as file:
+            file.write(image)
+
     @staticmethod
     def _clean_line(line: str) -> str:
         """
@@ -0,0 +1,283 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+"""
+Module: trace
+Traza binaria ciclo a ciclo del pipeline. Cada ciclo se guarda como un registro de ancho fijo
+(RECORD, 36 bytes) y los registros se escriben al archivo por bloques, así que grabar millones de
+ciclos cuesta un pack_into por ciclo y ocupa ~36 MB por millón de ciclos.
+
+Formato del archivo:
+- Cabecera (HEADER, 16 bytes): magic b"RVTR", versión (uint16), tamaño de registro (uint16), reservado (uint64).
+- Registros (RECORD, little-endian):
+    cycle     uint32  número de ciclo (desde 1)
+    pc_if     int32   PC en IF/ID  (-1 si el latch no tiene PC)
+    pc_id     int32   PC en ID/EX
+    pc_ex     int32   PC en EX/MEM
+    pc_mem    int32   PC en MEM/WB
+    flags     uint8   FLAG_* (stall, flush, mala predicción, forwarding, escritura/lectura)
+    rd        uint8   registro escrito en WB (si FLAG_REG_WRITE)
+    mem_width uint8   ancho del acceso a memoria en bytes (si FLAG_MEM_READ/FLAG_MEM_WRITE)
+    (relleno) 1 byte
+    reg_value uint32  valor escrito en rd
+    mem_addr  uint32  dirección del acceso a memoria
+    mem_value uint32  valor leído o escrito
+
+Classes:
+- TraceRecord: registro decodificado.
+- TraceRecorder: escribe la traza (lo usa PipelineEngine.start_trace).
+- TraceReader: lee la traza con mmap; permite iterar, indexar y buscar por ciclo.
+
+Example:
+    cpu.start_trace("run.rvtrace")
+    cpu.run()
+    cpu.stop_trace()
+    with TraceReader("run.rvtrace") as trace:
+        for record in trace.from_cycle(100):
+            if record.flags & FLAG_STALL: ...
+"""
+
+import mmap
+import struct
+from typing import NamedTuple
+from config import TRACE_CHUNK_RECORDS
+
+MAGIC = b"RVTR"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQ")
+RECORD = struct.Struct("<IiiiiBBBxIII")
+
+FLAG_STALL = 0x01        # se insertó una burbuja (load-use)
+FLAG_FLUSH = 0x02        # se vaciaron IF/ID e ID/EX al inicio del ciclo
+FLAG_MISPREDICT = 0x04   # EX detectó una predicción errónea
+FLAG_FORWARD_A = 0x08    # rs1 habría llegado por bypass (ForwardingUnit solo lo reporta)
+FLAG_FORWARD_B = 0x10    # rs2 habría llegado por bypass (ForwardingUnit solo lo reporta)
+FLAG_REG_WRITE = 0x20    # WB escribió rd
+FLAG_MEM_READ = 0x40     # MEM leyó memoria
+FLAG_MEM_WRITE = 0x80    # MEM escribió memoria
+
+_MASK32 = 0xFFFFFFFF
+
+
+class TraceRecord(NamedTuple):
+    cycle: int
+    pc_if: int
+    pc_id: int
+    pc_ex: int
+    pc_mem: int
+    flags: int
+    rd: int
+    mem_width: int
+    reg_value: int
+    mem_addr: int
+    mem_value: int
+
+
+"""
+Class: TraceRecorder
+Escribe registros de traza en un bytearray preasignado de chunk_records registros y lo vuelca al
+archivo cuando se llena (y al cerrar).
+
+Attributes:
+- path: str - archivo de salida.
+- chunk_records: int - registros por bloque escrito.
+- records: int - registros escritos en total.
+
+Methods:
+- record_cycle: Registra el ciclo que acaba de ejecutar un PipelineEngine (suscrito al evento "cycle").
+- write: Escribe un registro a partir de sus campos.
+- close: Vuelca el último bloque y cierra el archivo.
+"""
+
+class TraceRecorder:
+    def __init__(self, path: str, chunk_records: int = None):
+        self.path = path
+        self.chunk_records = max(1, chunk_records or TRACE_CHUNK_RECORDS)
+        self.records = 0
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0))
+        self._buffer = bytearray(RECORD.size * self.chunk_records)
+        self._offset = 0
+
+    def write(self, cycle, pc_if, pc_id, pc_ex, pc_mem, flags, rd=0, mem_width=0,
+              reg_value=0, mem_addr=0, mem_value=0):
+        """
+        Function: write
+        Agrega un registro al bloque actual, volcándolo si se llenó.
+        """
+        RECORD.pack_into(self._buffer, self._offset, cycle, pc_if, pc_id, pc_ex, pc_mem, flags,
+                         rd, mem_width, reg_value & _MASK32, mem_addr & _MASK32, mem_value & _MASK32)
+        self._offset += RECORD.size
+        self.records += 1
+        if self._offset == len(self._buffer):
+            self._file.write(self._buffer)
+            self._offset = 0
+
+    def record_cycle(self, cpu, stalled: bool, flushed: bool, forwarded: int):
+        """
+        Function: record_cycle
+        Registra el ciclo que acaba de terminar en cpu (latches, eventos y accesos).
+        Params:
+        - cpu: PipelineEngine - procesador al final del ciclo.
+        - stalled: bool - se insertó un stall.
+        - flushed: bool - la política de saltos vació el pipeline.
+        - forwarded: int - FLAG_FORWARD_A / FLAG_FORWARD_B reportados por la política de forwarding.
+        """
+        pipeline = cpu.pipeline
+        flags = forwarded
+        if stalled:
+            flags |= FLAG_STALL
+        if flushed:
+            flags |= FLAG_FLUSH
+
+        ex_mem = cpu.last_ex_mem
+        if ex_mem.flush_required:
+            flags |= FLAG_MISPREDICT
+
+        rd = reg_value = 0
+        mem_wb = cpu.mem_stage.out
+        control = mem_wb.control_signals
+        if control.RegWrite and mem_wb.rd:
+            flags |= FLAG_REG_WRITE
+            rd = mem_wb.rd
+            reg_value = cpu.registers.values[rd]
+
+        mem_width = mem_addr = mem_value = 0
+        control = ex_mem.control_signals
+        if control.MemRead:
+            flags |= FLAG_MEM_READ
+            mem_width, mem_addr, mem_value = control.MemWidth, ex_mem.alu_result, mem_wb.mem_data
+        elif control.MemWrite:
+            flags |= FLAG_MEM_WRITE
+            mem_width, mem_addr, mem_value = control.MemWidth, ex_mem.alu_result, ex_mem.rs2_val
+
+        pc_if = pipeline.IF_ID.pc
+        pc_id = pipeline.ID_EX.pc
+        pc_ex = pipeline.EX_MEM.pc
+        pc_mem = pipeline.MEM_WB.pc
+        self.write(cpu.metrics.ciclos_totales,
+                   -1 if pc_if is None else pc_if, -1 if pc_id is None else pc_id,
+                   -1 if pc_ex is None else pc_ex, -1 if pc_mem is None else pc_mem,
+                   flags, rd, mem_width, reg_value, mem_addr, mem_value)
+
+    def close(self):
+        """
+        Function: close
+        Vuelca el bloque pendiente y cierra el archivo.
+        """
+        if self._file is None:
+            return
+        if self._offset:
+            self._file.write(memoryview(self._buffer)[:self._offset])
+            self._offset = 0
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+"""
+Class: TraceReader
+Lee una traza con mmap, sin cargarla completa en memoria.
+
+Methods:
+- __len__ / __getitem__ / __iter__: acceso por índice de registro.
+- index_of: Índice del registro de un ciclo (búsqueda binaria; los ciclos son crecientes).
+- from_cycle: Itera desde un ciclo dado.
+- close: Libera el mmap y el archivo.
+
+Example:
+    with TraceReader("run.rvtrace") as trace:
+        print(len(trace), trace[trace.index_of(5000)])
+"""
+
+class TraceReader:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Traza vacía o inválida: {path}")
+        magic, version, record_size, _ = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"Formato de traza no soportado: {path}")
+        self._records = memoryview(self._mmap)[HEADER.size:]
+        self._count = len(self._records) // RECORD.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> TraceRecord:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return TraceRecord._make(RECORD.unpack_from(self._records, index * RECORD.size))
+
+    def __iter__(self):
+        return self._iter_from(0)
+
+    def _iter_from(self, index: int):
+        make = TraceRecord._make
+        for values in RECORD.iter_unpack(self._records[index * RECORD.size:self._count * RECORD.size]):
+            yield make(values)
+
+    def cycle_at(self, index: int) -> int:
+        return struct.unpack_from("<I", self._records, index * RECORD.size)[0]
+
+    def index_of(self, cycle: int) -> int:
+        """
+        Function: index_of
+        Devuelve el índice del primer registro con ciclo >= cycle (len(self) si no hay).
+        Prueba primero la posición directa (ciclos consecutivos) y si no, búsqueda binaria.
+        """
+        if self._count == 0:
+            return 0
+        guess = cycle - self.cycle_at(0)
+        if 0 <= guess < self._count and self.cycle_at(guess) == cycle:
+            return guess
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self.cycle_at(mid) < cycle:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def from_cycle(self, cycle: int):
+        """
+        Function: from_cycle
+        Itera los registros a partir del ciclo indicado.
+        """
+        return self._iter_from(self.index_of(cycle))
+
+    def close(self):
+        if self._mmap is not None:
+            self._records = None
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
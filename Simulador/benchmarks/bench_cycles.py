@@ -0,0 +1,55 @@
+"""
+Benchmark de ciclos por segundo del ciclo interno de los procesadores.
+Ejecuta un programa (por defecto programa.s) varias veces en cada procesador
+y reporta los ciclos simulados por segundo de tiempo real.
+
+Uso (desde la carpeta Simulador):
+    python benchmarks/bench_cycles.py [programa.s] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+SIM_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SIM_ROOT not in sys.path:
+    sys.path.insert(0, SIM_ROOT)
+
+from InOut.parser import Parser
+from core.simulator_manager import SimulatorManager
+
+
+def bench_processor(cpu_class, program_lines, repeat):
+    """Ejecuta el programa `repeat` veces y devuelve (ciclos totales, segundos)."""
+    total_cycles = 0
+    total_time = 0.0
+    for _ in range(repeat):
+        cpu = cpu_class()
+        cpu.load_program(program_lines)
+        start = time.perf_counter()
+        while not cpu.run_one_cycle():
+            pass
+        total_time += time.perf_counter() - start
+        total_cycles += cpu.metrics.ciclos_totales
+    return total_cycles, total_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ciclos/segundo por procesador")
+    parser.add_argument("program", nargs="?", default=os.path.join(SIM_ROOT, "programa.s"))
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with open(args.program, "r") as f:
+        instructions = Parser().parse(f.read().splitlines())
+    program_lines = [instr.raw_text for instr in instructions]
+
+    manager = SimulatorManager(program_lines, active_indices=[])
+    for idx, cpu_class in enumerate(manager.cpu_classes):
+        cycles, seconds = bench_processor(cpu_class, program_lines, args.repeat)
+        print(f"{manager.cpu_names[idx]:<48} {cycles:>9} ciclos  {seconds:8.3f} s  {cycles / seconds:>10.0f} ciclos/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""
+Suite de benchmarks con programas de referencia (benchmarks/programs): memcpy, multiplicación de
+matrices, bubble sort, fibonacci, recorrido de lista enlazada y máquina de estados.
+
+Cada programa se ejecuta por tres rutas:
+- engine: cada configuración de SimulatorManager (CPU_CLASSES) con PipelineEngine.run().
+- headless: SimulatorManager.run_batch en este proceso (la ruta de cli.py, con armado de registros).
+- functional: FunctionalSimulator (core/functional.py), sin pipeline.
+Las tres cargan el .s con load_program_file (ensamblado directo a la memoria de instrucciones), como cli.py.
+
+Por combinación reporta ciclos/s e instrucciones/s del host (mejor de --repeat corridas), RSS pico,
+CPI simulado y si los registros finales coinciden con los esperados. La velocidad se compara
+normalizada por un lazo de calibración (calibrate), así que la línea base sirve entre máquinas.
+Cada combinación corre en un proceso nuevo para que el RSS pico sea propio. El RSS pico se lee con
+el módulo resource, que no existe en Windows: ahí se reporta como None y no se compara.
+
+Los resultados se comparan con una línea base JSON. Por combinación se marcan como regresión los
+registros finales incorrectos, los ciclos o instrucciones simulados distintos y el RSS pico por
+encima de --rss-tolerance. La velocidad de una sola combinación es demasiado ruidosa para decidir:
+su Δ se muestra, pero solo se marca regresión si la media geométrica de todas (al final del reporte)
+cae más que la tolerancia de velocidad. La línea base guarda repeat, min_time y esa tolerancia; al
+comparar nunca se mide con menos corridas ni menos tiempo que los de la línea base.
+
+Uso (desde la carpeta Simulador):
+    python benchmarks/bench_suite.py                          # compara con benchmarks/baseline.json
+    python benchmarks/bench_suite.py --save-baseline          # guarda una nueva línea base
+    python benchmarks/bench_suite.py --kernel matmul --path engine --repeat 5
+    python benchmarks/bench_suite.py -o resultados.json       # resultados completos en JSON
+
+Códigos de salida:
+- 0: sin regresiones.
+- 1: alguna combinación es incorrecta o se marcó como regresión.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource  # Solo en sistemas POSIX
+except ImportError:
+    resource = None
+
+SIM_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SIM_ROOT not in sys.path:
+    sys.path.insert(0, SIM_ROOT)
+
+from core.functional import FunctionalSimulator
+from core.simulator_manager import SimulatorManager, CPU_CLASSES
+from components.register_file import register_index
+
+PROGRAMS_DIR = os.path.join(SIM_ROOT, "benchmarks", "programs")
+DEFAULT_BASELINE = os.path.join(SIM_ROOT, "benchmarks", "baseline.json")
+
+# Programa → registros finales esperados (ver el encabezado de cada .s)
+KERNELS = {
+    "memcpy": {"a0": 24512, "a1": 128},
+    "matmul": {"a0": 8406},
+    "bubble_sort": {"a0": 1292, "a1": 1, "a2": 10, "a3": 113},
+    "fibonacci": {"s0": 144, "s1": 832040},
+    "linked_list": {"a0": 4224, "a1": 256},
+    "state_machine": {"s3": 6, "s4": 144},
+}
+PATHS = ("engine", "headless", "functional")
+MAX_RUNS = 200
+# Caída tolerada de la media geométrica de instrucciones/s normalizadas (sin cambios en el código,
+# dos corridas en la misma máquina llegan a diferir ~18%)
+DEFAULT_TOLERANCE = 0.30
+DEFAULT_RSS_TOLERANCE = 0.35
+
+
+def run_engine(idx: int, path: str) -> tuple:
+    cpu = CPU_CLASSES[idx]()
+    cpu.load_program_file(path)
+    start = time.perf_counter()
+    cpu.run()
+    seconds = time.perf_counter() - start
+    return seconds, cpu.metrics.ciclos_totales, cpu.metrics.instrucciones_retiradas, cpu.registers.values
+
+
+def run_headless(idx: int, path: str) -> tuple:
+    start = time.perf_counter()
+    record = SimulatorManager.run_batch([(path, None)], [idx], max_workers=1)[0]
+    seconds = time.perf_counter() - start
+    values = [record["registros"][f"x{i}"] for i in range(32)]
+    return seconds, record["ciclos_totales"], record["instrucciones_retiradas"], values
+
+
+def run_functional(idx: int, path: str) -> tuple:
+    fast = FunctionalSimulator()
+    fast.load_program_file(path)
+    start = time.perf_counter()
+    fast.run()
+    seconds = time.perf_counter() - start
+    return seconds, None, fast.instructions, fast.registers.values
+
+
+RUNNERS = {"engine": run_engine, "headless": run_headless, "functional": run_functional}
+
+
+def calibrate() -> float:
+    """
+    Function: calibrate
+    Mide un lazo fijo de Python puro (mejor de 3) como referencia de la velocidad del host.
+    Las comparaciones con la línea base usan instrucciones/s multiplicadas por este tiempo, para
+    que una máquina más lenta o cargada no se confunda con una regresión del simulador.
+    Returns:
+    - float: segundos del lazo de calibración.
+    """
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        values = [0] * 32
+        for i in range(200000):
+            values[i & 31] = values[(i + 1) & 31] + i
+        seconds = time.perf_counter() - start
+        if best is None or seconds < best:
+            best = seconds
+    return best
+
+
+def peak_rss_kib():
+    """
+    Function: peak_rss_kib
+    RSS pico del proceso en KiB (ru_maxrss de Linux).
+    Returns:
+    - int o None: None si el módulo resource no está disponible (Windows).
+    """
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(job: dict) -> dict:
+    """
+    Function: measure
+    Ejecuta una combinación programa × ruta × procesador --repeat veces (en su propio proceso).
+    Params:
+    - job: dict - claves kernel, path, index (None en la ruta functional), repeat y min_time
+      (sigue repitiendo hasta sumar al menos min_time segundos medidos).
+    Returns:
+    - dict: resultado con la mejor corrida y el RSS pico del proceso (None sin el módulo resource).
+    """
+    path = os.path.join(PROGRAMS_DIR, job["kernel"] + ".s")
+    runner = RUNNERS[job["path"]]
+    best = None
+    runs = 0
+    total = 0.0
+    while runs < job["repeat"] or (total < job["min_time"] and runs < MAX_RUNS):
+        seconds, cycles, instructions, values = runner(job["index"], path)
+        runs += 1
+        total += seconds
+        if best is None or seconds < best:
+            best = seconds
+    expected = KERNELS[job["kernel"]]
+    calibration = calibrate()
+    return {
+        "kernel": job["kernel"],
+        "ruta": job["path"],
+        "procesador": SimulatorManager.CPU_KEYS[job["index"]] if job["index"] is not None else "functional",
+        "correcto": all(values[register_index(reg)] == value for reg, value in expected.items()),
+        "ciclos": cycles,
+        "instrucciones": instructions,
+        "cpi": cycles / instructions if cycles and instructions else None,
+        "segundos": best,
+        "corridas": runs,
+        "ciclos_por_segundo": cycles / best if cycles else None,
+        "instrucciones_por_segundo": instructions / best,
+        "instrucciones_por_calibracion": instructions / best * calibration,
+        "calibracion_s": calibration,
+        "rss_pico_kib": peak_rss_kib(),
+    }
+
+
+def result_key(result: dict) -> str:
+    return f"{result['kernel']}/{result['ruta']}/{result['procesador']}"
+
+
+def compare(result: dict, base: dict, rss_tolerance: float) -> list:
+    """
+    Function: compare
+    Compara un resultado con su entrada de la línea base. La velocidad no se compara aquí: solo
+    cuenta la media geométrica de todas las combinaciones (ver main).
+    Returns:
+    - list[str]: motivos de regresión (vacía si no hay).
+    """
+    problems = []
+    if not result["correcto"]:
+        problems.append("registros finales incorrectos")
+    if base is None:
+        return problems
+    for field in ("ciclos", "instrucciones"):
+        if result[field] != base.get(field):
+            problems.append(f"{field} simulados {base.get(field)} → {result[field]}")
+    rss, base_rss = result["rss_pico_kib"], base.get("rss_pico_kib")
+    if rss is not None and base_rss is not None and rss > base_rss * (1 + rss_tolerance):
+        problems.append("RSS pico sobre la tolerancia")
+    return problems
+
+
+def build_jobs(kernels: list, paths: list, repeat: int, min_time: float) -> list:
+    jobs = []
+    for kernel in kernels:
+        for path in paths:
+            indices = [None] if path == "functional" else range(len(CPU_CLASSES))
+            for idx in indices:
+                jobs.append({"kernel": kernel, "path": path, "index": idx, "repeat": repeat,
+                             "min_time": min_time})
+    return jobs
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Suite de benchmarks del simulador")
+    parser.add_argument("--kernel", action="append", choices=sorted(KERNELS), default=[],
+                        help="programa a ejecutar (repetible; por defecto todos)")
+    parser.add_argument("--path", action="append", choices=PATHS, default=[],
+                        help="ruta a medir (repetible; por defecto todas)")
+    parser.add_argument("--repeat", type=int, default=5, help="corridas mínimas por combinación (se toma la mejor)")
+    parser.add_argument("--min-time", type=float, default=0.25,
+                        help="segundos medidos mínimos por combinación (agrega corridas)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="línea base JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="guardar los resultados como línea base")
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help="caída tolerada de la media geométrica de instrucciones/s (fracción; "
+                             f"por defecto la de la línea base o {DEFAULT_TOLERANCE})")
+    parser.add_argument("--rss-tolerance", type=float, default=DEFAULT_RSS_TOLERANCE,
+                        help="aumento de RSS pico tolerado por combinación (fracción)")
+    parser.add_argument("-o", "--output", help="archivo JSON con los resultados completos")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    settings = {}
+    if not args.save_baseline and os.path.isfile(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            settings = json.load(f)
+        baseline = settings.get("resultados", {})
+    # Al comparar, al menos las corridas y el tiempo con que se midió la línea base
+    repeat = max(args.repeat, settings.get("repeat", 0))
+    min_time = max(args.min_time, settings.get("min_time", 0.0))
+    tolerance = args.tolerance if args.tolerance is not None else settings.get("tolerancia", DEFAULT_TOLERANCE)
+    if (repeat, min_time) != (args.repeat, args.min_time):
+        print(f"Se mide con repeat={repeat} y min-time={min_time} s, como la línea base")
+
+    jobs = build_jobs(args.kernel or list(KERNELS), args.path or list(PATHS), repeat, min_time)
+    # Un proceso nuevo por combinación: el RSS pico de cada una no arrastra el de las anteriores
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        results = list(pool.map(measure, jobs))
+
+    status = 0
+    ratios = []
+    print(f"{'combinación':<40} {'ciclos':>8} {'CPI':>6} {'ciclos/s':>10} {'instr/s':>10} {'Δ norm.':>10} {'RSS KiB':>9}")
+    for result in results:
+        key = result_key(result)
+        base = baseline.get(key)
+        problems = compare(result, base, args.rss_tolerance)
+        result["regresiones"] = problems
+        delta = ""
+        if base:
+            ratio = result["instrucciones_por_calibracion"] / base["instrucciones_por_calibracion"]
+            delta = f"{(ratio - 1) * 100:+.1f}%"
+            ratios.append(ratio)
+        cycles = result["ciclos"] if result["ciclos"] is not None else "-"
+        cpi = f"{result['cpi']:.3f}" if result["cpi"] else "-"
+        cps = f"{result['ciclos_por_segundo']:.0f}" if result["ciclos_por_segundo"] else "-"
+        rss = result["rss_pico_kib"] if result["rss_pico_kib"] is not None else "-"
+        print(f"{key:<40} {cycles:>8} {cpi:>6} {cps:>10} {result['instrucciones_por_segundo']:>10.0f} "
+              f"{delta:>10} {rss:>9}")
+        for problem in problems:
+            print(f"    REGRESIÓN: {problem}")
+            status = 1
+    if ratios:
+        geomean = math.exp(sum(math.log(ratio) for ratio in ratios) / len(ratios))
+        print(f"Media geométrica de instrucciones/s normalizadas frente a la línea base: {(geomean - 1) * 100:+.1f}% "
+              f"(tolerancia -{tolerance * 100:.0f}%)")
+        if geomean < 1 - tolerance:
+            print("    REGRESIÓN: media geométrica de instrucciones/s (normalizadas por la calibración) bajo la tolerancia")
+            status = 1
+
+    if args.save_baseline:
+        data = {
+            "host": {"python": platform.python_version(), "plataforma": platform.platform(),
+                     "procesador": platform.machine()},
+            "repeat": repeat,
+            "min_time": min_time,
+            "tolerancia": tolerance,
+            "resultados": {
+                result_key(result): {field: result[field] for field in
+                                     ("ciclos", "instrucciones", "cpi", "ciclos_por_segundo",
+                                      "instrucciones_por_segundo", "instrucciones_por_calibracion",
+                                      "calibracion_s", "rss_pico_kib")}
+                for result in results
+            },
+        }
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Línea base guardada en {args.baseline}")
+    elif not baseline:
+        print(f"Sin línea base en {args.baseline}: use --save-baseline para crearla")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+# Bubble sort ascendente de 24 palabras generadas con x = (5x + 3) mod 128, con salida temprana
+# cuando una pasada no intercambia nada. Luego verifica el orden.
+# Resultado esperado: a1 = 1 (ordenado), a0 = 1292 (suma), a2 = 10 (mínimo), a3 = 113 (máximo)
+    addi s0, x0, 0       # arreglo
+    addi s1, x0, 24      # n
+    addi t0, x0, 0       # i
+    addi t1, x0, 11      # x (semilla)
+    addi t3, s0, 0
+gen:
+    slli t2, t1, 2
+    add  t1, t1, t2
+    addi t1, t1, 3
+    andi t1, t1, 127
+    sw   t1, 0(t3)
+    addi t3, t3, 4
+    addi t0, t0, 1
+    blt  t0, s1, gen
+
+    addi s2, s1, -1      # comparaciones de la pasada
+outer:
+    addi t0, x0, 0       # hubo intercambio
+    addi t1, x0, 0       # j
+    addi t3, s0, 0
+inner:
+    lw   t4, 0(t3)
+    lw   t5, 4(t3)
+    bge  t5, t4, no_swap
+    sw   t5, 0(t3)
+    sw   t4, 4(t3)
+    addi t0, x0, 1
+no_swap:
+    addi t3, t3, 4
+    addi t1, t1, 1
+    blt  t1, s2, inner
+    beq  t0, x0, sorted
+    addi s2, s2, -1
+    bne  s2, x0, outer
+
+sorted:
+    addi a0, x0, 0
+    addi a1, x0, 1
+    lw   a2, 0(s0)
+    addi t1, x0, 0
+    addi t3, s0, 0
+check:
+    lw   t4, 0(t3)
+    add  a0, a0, t4
+    addi t1, t1, 1
+    bge  t1, s1, check_done
+    lw   t5, 4(t3)
+    bge  t5, t4, check_ok
+    addi a1, x0, 0
+check_ok:
+    addi t3, t3, 4
+    jal  x0, check
+check_done:
+    addi a3, t4, 0
@@ -0,0 +1,41 @@
+# Fibonacci recursivo fib(12) con marcos en la pila (jal/jalr, sw/lw de ra) e iterativo fib(30).
+# Resultado esperado: s0 = 144, s1 = 832040
+    lui  sp, 1           # sp = 4096 (tope de la memoria de datos)
+    addi a0, x0, 12
+    jal  ra, fib
+    addi s0, a0, 0
+
+    addi t0, x0, 0       # fib(i)
+    addi t1, x0, 1       # fib(i + 1)
+    addi t2, x0, 30
+iter:
+    add  t3, t0, t1
+    addi t0, t1, 0
+    addi t1, t3, 0
+    addi t2, t2, -1
+    bne  t2, x0, iter
+    addi s1, t0, 0
+    jal  x0, end
+
+# fib: a0 = fib(a0)
+fib:
+    addi t0, x0, 2
+    blt  a0, t0, fib_base
+    addi sp, sp, -12
+    sw   ra, 8(sp)
+    sw   a0, 4(sp)
+    addi a0, a0, -1
+    jal  ra, fib
+    sw   a0, 0(sp)
+    lw   a0, 4(sp)
+    addi a0, a0, -2
+    jal  ra, fib
+    lw   t1, 0(sp)
+    add  a0, a0, t1
+    lw   ra, 8(sp)
+    addi sp, sp, 12
+fib_base:
+    jalr x0, 0(ra)
+
+end:
+    addi a7, x0, 93      # marca de fin
@@ -0,0 +1,43 @@
+# Recorrido de lista enlazada: 32 nodos {valor, siguiente} repartidos en memoria según la
+# permutación (13 * i) mod 32, recorridos 8 veces (persecución de punteros con load-use).
+# Resultado esperado: a0 = 4224 (8 * 528), a1 = 256 (nodos visitados)
+    addi s0, x0, 256     # base de los nodos (la dirección 0 es el fin de lista)
+    addi s1, x0, 32      # nodos
+    addi t0, x0, 0       # i
+build:
+    slli t1, t0, 3       # dirección del nodo i = base + ((13 * i) mod 32) * 8
+    slli t2, t0, 2
+    add  t1, t1, t2
+    add  t1, t1, t0
+    andi t1, t1, 31
+    slli t1, t1, 3
+    add  t1, t1, s0
+    addi t3, t0, 1
+    sw   t3, 0(t1)       # valor = i + 1
+    addi t4, x0, 0       # siguiente = 0 en el último nodo
+    beq  t3, s1, link
+    slli t4, t3, 3
+    slli t5, t3, 2
+    add  t4, t4, t5
+    add  t4, t4, t3
+    andi t4, t4, 31
+    slli t4, t4, 3
+    add  t4, t4, s0
+link:
+    sw   t4, 4(t1)
+    addi t0, t0, 1
+    blt  t0, s1, build
+
+    addi a0, x0, 0       # suma de valores
+    addi a1, x0, 0       # nodos visitados
+    addi s2, x0, 8       # recorridos
+walk_again:
+    addi t0, s0, 0       # cabeza (nodo 0)
+walk:
+    lw   t1, 0(t0)
+    add  a0, a0, t1
+    addi a1, a1, 1
+    lw   t0, 4(t0)
+    bne  t0, x0, walk
+    addi s2, s2, -1
+    bne  s2, x0, walk_again
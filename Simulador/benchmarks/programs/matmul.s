@@ -0,0 +1,84 @@
+# Multiplicación de matrices 6x6: C = A x B con A[i][j] = i + j + 1 y B[i][j] = i - j + 6.
+# RV32I no tiene mul: cada producto llama a una rutina de sumas y desplazamientos (jal/jalr).
+# Resultado esperado: a0 = 8406 (suma de todos los elementos de C)
+    addi s0, x0, 0       # A
+    addi s1, x0, 144     # B
+    addi s2, x0, 288     # C
+    addi s3, x0, 6       # N
+
+    addi t0, x0, 0       # i
+    addi t3, s0, 0       # puntero A
+    addi t4, s1, 0       # puntero B
+init_i:
+    addi t1, x0, 0       # j
+init_j:
+    add  t2, t0, t1
+    addi t2, t2, 1
+    sw   t2, 0(t3)
+    sub  t2, t0, t1
+    addi t2, t2, 6
+    sw   t2, 0(t4)
+    addi t3, t3, 4
+    addi t4, t4, 4
+    addi t1, t1, 1
+    blt  t1, s3, init_j
+    addi t0, t0, 1
+    blt  t0, s3, init_i
+
+    addi s4, x0, 0       # i
+    addi s6, s0, 0       # &A[i][0]
+    addi s8, s2, 0       # &C[i][j]
+mm_i:
+    addi s5, x0, 0       # j
+mm_j:
+    addi s7, x0, 0       # k
+    addi s9, x0, 0       # acumulador
+    addi s10, s6, 0      # &A[i][k]
+    slli t0, s5, 2
+    add  s11, s1, t0     # &B[k][j]
+mm_k:
+    lw   a0, 0(s10)
+    lw   a1, 0(s11)
+    jal  ra, mul
+    add  s9, s9, a0
+    addi s10, s10, 4
+    addi s11, s11, 24
+    addi s7, s7, 1
+    blt  s7, s3, mm_k
+    sw   s9, 0(s8)
+    addi s8, s8, 4
+    addi s5, s5, 1
+    blt  s5, s3, mm_j
+    addi s6, s6, 24
+    addi s4, s4, 1
+    blt  s4, s3, mm_i
+
+    addi a0, x0, 0
+    addi t0, s2, 0
+    addi t1, x0, 36
+sum:
+    lw   t2, 0(t0)
+    add  a0, a0, t2
+    addi t0, t0, 4
+    addi t1, t1, -1
+    bne  t1, x0, sum
+    jal  x0, end
+
+# mul: a0 = a0 * a1 (a1 >= 0); usa t5 y t6
+mul:
+    addi t5, x0, 0
+mul_loop:
+    beq  a1, x0, mul_done
+    andi t6, a1, 1
+    beq  t6, x0, mul_skip
+    add  t5, t5, a0
+mul_skip:
+    slli a0, a0, 1
+    srli a1, a1, 1
+    jal  x0, mul_loop
+mul_done:
+    addi a0, t5, 0
+    jalr x0, 0(ra)
+
+end:
+    addi a7, x0, 93      # marca de fin
@@ -0,0 +1,36 @@
+# memcpy: llena src[i] = 3*i + 1 (128 palabras), las copia a dst y suma dst en a0.
+# Resultado esperado: a0 = 24512, a1 = 128 (palabras copiadas)
+    addi s0, x0, 0       # src
+    addi s1, x0, 512     # dst
+    addi s2, x0, 128     # palabras
+    addi t0, x0, 0       # i
+    addi t1, x0, 1       # valor = 3*i + 1
+    addi t2, s0, 0       # puntero src
+
+init:
+    sw   t1, 0(t2)
+    addi t1, t1, 3
+    addi t2, t2, 4
+    addi t0, t0, 1
+    blt  t0, s2, init
+
+    addi t0, s0, 0       # puntero src
+    addi t1, s1, 0       # puntero dst
+    addi a1, x0, 0       # palabras copiadas
+copy:
+    lw   t2, 0(t0)       # load-use con el sw siguiente
+    sw   t2, 0(t1)
+    addi t0, t0, 4
+    addi t1, t1, 4
+    addi a1, a1, 1
+    bne  a1, s2, copy
+
+    addi a0, x0, 0
+    addi t0, s1, 0
+    addi t1, x0, 0
+checksum:
+    lw   t2, 0(t0)
+    add  a0, a0, t2
+    addi t0, t0, 4
+    addi t1, t1, 1
+    blt  t1, s2, checksum
@@ -0,0 +1,46 @@
+# Máquina de estados con muchos saltos: procesa 400 símbolos 0..3 generados con
+# x = (5x + 3) mod 256, símbolo = (x >> 5) mod 4, y cuenta apariciones del patrón "012".
+# Resultado esperado: s3 = 6 (coincidencias), s4 = 144 (cambios de estado)
+    addi s0, x0, 400     # símbolos
+    addi s1, x0, 7       # x (semilla)
+    addi s2, x0, 0       # estado
+    addi s3, x0, 0       # coincidencias
+    addi s4, x0, 0       # cambios de estado
+    addi t4, x0, 1
+    addi t5, x0, 2
+next_symbol:
+    slli t0, s1, 2
+    add  s1, s1, t0
+    addi s1, s1, 3
+    andi s1, s1, 255
+    srli t0, s1, 5
+    andi t0, t0, 3       # símbolo
+    addi t1, s2, 0       # estado anterior
+    beq  t0, x0, to1     # un 0 siempre empieza el patrón
+    beq  s2, t4, st1
+    beq  s2, t5, st2
+    jal  x0, to0
+st1:
+    beq  t0, t4, to2
+    jal  x0, to0
+st2:
+    beq  t0, t5, to3
+    jal  x0, to0
+to1:
+    addi s2, x0, 1
+    jal  x0, count
+to2:
+    addi s2, x0, 2
+    jal  x0, count
+to3:
+    addi s2, x0, 3
+    addi s3, s3, 1
+    jal  x0, count
+to0:
+    addi s2, x0, 0
+count:
+    beq  s2, t1, same
+    addi s4, s4, 1
+same:
+    addi s0, s0, -1
+    bne  s0, x0, next_symbol
@@ -0,0 +1,287 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+"""
+Module: cli
+Ejecución por línea de comandos, sin interfaz gráfica (no importa tkinter). Carga programas .s/.asm
+con el ensamblador de dos pasadas (InOut/assembler.py) o imágenes .bin de código máquina RV32I
+(core/rv32i.py), los ejecuta en los procesadores elegidos y emite las métricas en JSON o CSV.
+
+Uso (desde la carpeta Simulador):
+    python cli.py programa.s
+    python cli.py programa.s otro.asm --cpu basic --cpu full --format csv -o resultados.csv
+    python cli.py programa.s --max-cycles 10000 --reg sp=0x7ff0 --mem 0x100=42 --state
+    python cli.py programa.s --preload estado.json   # {"registers": {...}, "memory": {...}}
+    python cli.py *.s --jobs 4                       # combinaciones repartidas en 4 procesos
+    python cli.py programa.s --trace-dir trazas      # traza binaria por ciclo (InOut/trace.py)
+    python cli.py programa.s --fast-forward 100000   # primeras instrucciones en modo funcional
+    python cli.py programa.s --profile               # tiempo del host por etapa ("perfil" en el JSON)
+    python cli.py programa.s --pstats-dir perfiles   # además un perfil de cProfile por simulación
+    python cli.py programa.s --emit-bin imagenes     # guarda imagenes/programa.bin (código máquina)
+    python cli.py imagenes/programa.bin              # simula una imagen .bin
+
+Códigos de salida:
+- 0: todas las simulaciones se ejecutaron.
+- 1: algún programa no se pudo cargar, parsear o codificar (--emit-bin).
+- 2: argumentos inválidos.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+from InOut.assembler import Assembler
+from InOut.program_loader import ProgramLoader
+from core.instruction import Instruction
+from core.rv32i import encode, decode
+from core.simulator_manager import SimulatorManager
+
+# Columnas del CSV (los campos anidados como config/registros se omiten)
+CSV_FIELDS = [
+    "programa", "procesador", "clave", "completado", "ciclos_totales", "instrucciones_retiradas",
+    "cpi", "branches_totales", "branches_acertados", "branch_accuracy", "tiempo_simulado",
+    "tiempo_ejecucion", "ciclos_stall_memoria", "instrucciones_adelantadas", "memoria_digest",
+]
+
+
+def parse_int(text: str) -> int:
+    """Convierte un entero decimal, hexadecimal (0x) o binario (0b)."""
+    return int(text, 0)
+
+
+def parse_assignment(text: str) -> tuple:
+    """
+    Function: parse_assignment
+    Convierte "CLAVE=VALOR" en una tupla. Se usa para --reg y --mem.
+    Example:
+        parse_assignment("sp=0x100")  # ("sp", 256)
+    """
+    if "=" not in text:
+        raise argparse.ArgumentTypeError(f"Se esperaba CLAVE=VALOR: '{text}'")
+    key, value = text.split("=", 1)
+    try:
+        return key.strip(), parse_int(value.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Valor no numérico: '{text}'") from None
+
+
+def select_cpus(names: list) -> list:
+    """
+    Function: select_cpus
+    Traduce los nombres/índices de --cpu a índices de SimulatorManager.
+    Returns:
+    - list[int]: índices en orden, sin repetidos (todos si no se eligió ninguno).
+    """
+    if not names or "all" in names:
+        return list(range(len(SimulatorManager.CPU_KEYS)))
+    indices = []
+    for name in names:
+        key = name.replace("-", "_")
+        if key.isdigit() and int(key) < len(SimulatorManager.CPU_KEYS):
+            idx = int(key)
+        elif key in SimulatorManager.CPU_KEYS:
+            idx = SimulatorManager.CPU_KEYS.index(key)
+        else:
+            raise argparse.ArgumentTypeError(f"Procesador desconocido: '{name}'")
+        if idx not in indices:
+            indices.append(idx)
+    return indices
+
+
+def load_program_lines(path: str) -> list[str]:
+    """
+    Function: load_program_lines
+    Lee un archivo .s/.asm y devuelve las instrucciones con las etiquetas ya resueltas. Una imagen
+    .bin de código máquina se desensambla hasta la primera palabra no decodificable (fin del programa,
+    como en la etapa IF).
+    """
+    if os.path.splitext(path)[1] in ProgramLoader.BINARY_EXTENSIONS:
+        lines = []
+        for index, word in enumerate(ProgramLoader.load_binary(path)):
+            try:
+                lines.append(decode(word, index * 4).raw_text)
+            except ValueError:
+                break
+        return lines
+    return [instr.raw_text for instr in Assembler().instructions(path)]
+
+
+def check_program(path: str):
+    """
+    Function: check_program
+    Validación rápida antes de repartir un programa entre los procesos: que el archivo exista y tenga
+    una extensión válida (un .s/.asm además pasa por la pasada 1 del ensamblador). Cada trabajo ensambla
+    o carga el archivo por su cuenta; los errores de parseo llegan en su registro ("error").
+    Restriction:
+    Lanza OSError o ValueError si el programa no se puede cargar.
+    """
+    if os.path.splitext(path)[1] in ProgramLoader.BINARY_EXTENSIONS:
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Archivo no encontrado: {path}")
+        return
+    Assembler().scan(path)
+
+
+def save_program_binary(path: str, lines: list[str]):
+    """
+    Function: save_program_binary
+    Codifica un programa ya ensamblado (salida de load_program_lines) y lo guarda como imagen .bin.
+    Restriction:
+    Lanza ValueError si alguna instrucción no tiene codificación RV32I (inmediato fuera de rango).
+    """
+    ProgramLoader.save_binary(path, [encode(Instruction(line, index * 4)) for index, line in enumerate(lines)])
+
+
+def load_preload(path: str) -> tuple:
+    """
+    Function: load_preload
+    Lee un JSON con las claves opcionales "registers" y "memory". Las direcciones y valores
+    pueden ser enteros o textos ("0x100").
+    Returns:
+    - tuple: (registros, memoria) como diccionarios.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    def as_int(value):
+        return value if isinstance(value, int) else parse_int(str(value))
+
+    registers = {reg: as_int(val) for reg, val in data.get("registers", {}).items()}
+    memory = {as_int(addr): as_int(val) for addr, val in data.get("memory", {}).items()}
+    return registers, memory
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Simulador RISC-V sin interfaz gráfica")
+    parser.add_argument("programs", nargs="+", help="archivos .s/.asm (o imágenes .bin de código máquina) a simular")
+    parser.add_argument("--cpu", action="append", default=[],
+                        help="procesador a ejecutar: basic, no-hazards, no-predictor, full, all o 0-3 "
+                             "(repetible; por defecto todos)")
+    parser.add_argument("--format", choices=["json", "csv"], default="json", help="formato de salida")
+    parser.add_argument("-o", "--output", help="archivo de salida (por defecto stdout)")
+    parser.add_argument("--max-cycles", type=int, default=None, help="máximo de ciclos por simulación")
+    parser.add_argument("--reg", action="append", type=parse_assignment, default=[],
+                        help="registro inicial, ej. --reg sp=0x7ff0 (repetible)")
+    parser.add_argument("--mem", action="append", type=parse_assignment, default=[],
+                        help="palabra inicial de memoria, ej. --mem 0x100=42 (repetible)")
+    parser.add_argument("--preload", help="JSON con registros y memoria iniciales")
+    parser.add_argument("--state", action="store_true",
+                        help="incluir memoria de datos, PC y pipeline finales (solo JSON)")
+    parser.add_argument("--trace-dir", default=None,
+                        help="carpeta donde grabar una traza binaria por simulación (<programa>_<cpu>.rvtrace)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="procesos en paralelo (por defecto uno por núcleo; 1 = sin procesos extra)")
+    parser.add_argument("--data-mem-words", type=int, default=None, help="tamaño de la memoria de datos")
+    parser.add_argument("--sparse-memory", action="store_true", help="memoria de datos dispersa (32 bits)")
+    parser.add_argument("--caches", action="store_true",
+                        help="modelar las cachés L1I/L1D/L2 de config.py (fallos = ciclos de stall)")
+    parser.add_argument("--fast-forward", type=int, default=None, metavar="N",
+                        help="ejecutar las primeras N instrucciones en modo funcional (sin pipeline) "
+                             "y continuar desde ahí con el procesador elegido")
+    parser.add_argument("--profile", action="store_true",
+                        help="medir el tiempo del host por etapa, riesgos y métricas (clave \"perfil\", solo JSON)")
+    parser.add_argument("--pstats-dir", default=None,
+                        help="carpeta donde escribir un perfil de cProfile por simulación (<programa>_<cpu>.pstats)")
+    parser.add_argument("--emit-bin", default=None, metavar="DIR",
+                        help="carpeta donde guardar cada programa como código máquina RV32I (<programa>.bin)")
+    return parser
+
+
+def write_results(results: list, fmt: str, out):
+    if fmt == "json":
+        json.dump(results, out, indent=2, ensure_ascii=False)
+        out.write("\n")
+    else:
+        writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main(argv=None) -> int:
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        indices = select_cpus(args.cpu)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    registers, memory = {}, {}
+    if args.preload:
+        registers, memory = load_preload(args.preload)
+    registers.update(dict(args.reg))
+    memory.update({parse_int(addr): value for addr, value in args.mem})
+
+    programs = []
+    status = 0
+    for path in args.programs:
+        try:
+            check_program(path)
+        except (OSError, ValueError) as e:
+            print(f"Error al cargar {path}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        programs.append((path, None))  # Cada trabajo carga el archivo directo a su memoria
+
+    for directory in (args.trace_dir, args.pstats_dir, args.emit_bin):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    if args.emit_bin:
+        for path, _ in list(programs):
+            name = os.path.splitext(os.path.basename(path))[0]
+            try:
+                lines = load_program_lines(path)
+            except (OSError, ValueError) as e:
+                print(f"Error al cargar {path}: {e}", file=sys.stderr)
+                programs.remove((path, None))
+                status = 1
+                continue
+            try:
+                save_program_binary(os.path.join(args.emit_bin, name + ".bin"), lines)
+            except ValueError as e:
+                print(f"Error al codificar {path}: {e}", file=sys.stderr)
+                status = 1
+
+    # Todas las combinaciones programa × procesador se reparten en un mismo pool de procesos
+    results = SimulatorManager.run_batch(programs, indices, max_cycles=args.max_cycles,
+                                         registers=registers, memory=memory,
+                                         include_state=args.state, max_workers=args.jobs,
+                                         data_mem_words=args.data_mem_words,
+                                         sparse_memory=args.sparse_memory or None,
+                                         caches=args.caches or None,
+                                         fast_forward=args.fast_forward,
+                                         profile=args.profile,
+                                         pstats_dir=args.pstats_dir,
+                                         trace_dir=args.trace_dir)
+
+    # Un programa que no se pudo ensamblar o cargar deja un registro con "error" por procesador
+    errors = {}
+    for record in results:
+        if "error" in record:
+            errors.setdefault(record["programa"], record["error"])
+    for path, error in errors.items():
+        print(f"Error al cargar {path}: {error}", file=sys.stderr)
+        status = 1
+    results = [record for record in results if "error" not in record]
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            write_results(results, args.format, out)
+    else:
+        write_results(results, args.format, sys.stdout)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,6 +23,7 @@ Methods:
 - predict: Realiza una predicción para una instrucción dada su dirección.
 - update: Actualiza la tabla de predicción con el resultado real del salto.
 - flush_required: Determina si es necesario hacer un flush por predicción errónea.
+- snapshot / restore: Copia y restaura la tabla de predicción.
 
 Example:
     predictor = BranchPredictor()
@@ -58,13 +59,14 @@ class BranchPredictor:
             "target": None  # target se debe calcular por fuera si es necesario
         }
 
-    def update(self, pc: int, taken: bool):
+    def update(self, pc: int, taken: bool, target: int = None):
         """
         Function: update
         Actualiza la tabla de predicción con el resultado real del salto.
         Params:
         - pc: int - dirección de la instrucción de salto.
         - taken: bool - True si se tomó el salto, False si no.
+        - target: int o None - destino real (sin uso: este predictor no tiene BTB).
         Example:
             predictor.update(12, True)
         """
@@ -84,3 +86,45 @@ class BranchPredictor:
                 # hacer flush
         """
         return prediction_taken != actual_taken
+
+    def snapshot(self) -> dict:
+        """
+        Function: snapshot
+        Devuelve una copia de la tabla de predicción (historial inverso).
+        """
+        return dict(self.predictor_table)
+
+    def restore(self, snapshot: dict):
+        """
+        Function: restore
+        Restaura la tabla de predicción a partir de una copia tomada con snapshot().
+        """
+        self.predictor_table = dict(snapshot)
+
+
+"""
+Class: NullBranchPredictor
+Predictor que siempre predice "no tomado" y no aprende. Se usa en el procesador sin predicción:
+cualquier salto tomado resulta en una predicción errónea y, por lo tanto, en un flush.
+
+Example:
+    predictor = NullBranchPredictor()
+    predictor.flush_required(False, True)  # True
+"""
+
+class NullBranchPredictor:
+    def predict(self, pc: int) -> dict:
+        return {"taken": False, "target": None}
+
+    def update(self, pc: int, taken: bool, target: int = None):
+        pass
+
+    def flush_required(self, prediction_taken: bool, actual_taken: bool) -> bool:
+        # siempre hay que hacer flush si el branch se toma (predicted=False, actual=True)
+        return actual_taken and not prediction_taken
+
+    def snapshot(self):
+        return None  # sin estado
+
+    def restore(self, snapshot):
+        pass
@@ -0,0 +1,261 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+import random
+from array import array
+from config import (CACHES_ENABLED, MEMORY_LATENCY_CYCLES, L1I_CACHE, L1D_CACHE, L2_CACHE)
+
+# Las memorias de instrucciones y de datos son espacios separados que empiezan en 0: el bit 32
+# distingue los accesos de la L1I dentro del L2 unificado.
+INSTRUCTION_SPACE = 1 << 32
+ADDRESS_MASK = (1 << 33) - 1
+
+"""
+Class: Cache
+Modelo de tiempo de una caché asociativa por conjuntos. No guarda datos (siguen en Memory): solo
+tags, bits dirty y marcas de reemplazo, en arreglos planos de sets * assoc entradas, para decidir
+si un acceso acierta y cuántos ciclos cuesta.
+
+- Acierto: hit_cycles.
+- Fallo: hit_cycles + costo del siguiente nivel (otra Cache o memory_cycles), más la escritura
+  del bloque expulsado si estaba dirty (write-back).
+- write-back usa write-allocate; write-through no asigna bloque en escrituras y las manda al
+  siguiente nivel a través de un buffer de escritura (sin ciclos de stall).
+
+Attributes:
+- name: str - nombre para métricas ("L1I", "L1D", "L2").
+- size, assoc, line: int - capacidad y tamaño de bloque en bytes, vías por conjunto.
+- sets: int - cantidad de conjuntos.
+- replacement: str - "lru", "fifo" o "random".
+- write_policy: str - "write-back" o "write-through".
+- hit_cycles: int - ciclos extra de un acierto.
+- next_level: Cache o None - siguiente nivel (None = memoria principal).
+- space: int - bits agregados a las direcciones enviadas al siguiente nivel (INSTRUCTION_SPACE en la L1I).
+- memory_cycles: int - ciclos de un acceso a memoria principal.
+- tags: array('q') - número de bloque de cada entrada (-1 = inválida).
+- dirty: bytearray - 1 si la entrada fue escrita (write-back).
+- stamps: array('Q') - último uso (LRU) o momento de llenado (FIFO).
+- hits, misses, writebacks: int - estadísticas.
+
+Methods:
+- access: Simula un acceso y devuelve sus ciclos.
+- stats: Devuelve las estadísticas como diccionario.
+- snapshot / restore: Copia y restaura el estado (historial inverso).
+
+Example:
+    l1d = Cache("L1D", size=4096, assoc=4, line=32)
+    ciclos = l1d.access(0x100, write=False)
+"""
+
+class Cache:
+    REPLACEMENTS = ("lru", "fifo", "random")
+    WRITE_POLICIES = ("write-back", "write-through")
+
+    def __init__(self, name: str, size: int, assoc: int, line: int, replacement: str = "lru",
+                 write_policy: str = "write-back", hit_cycles: int = 0, next_level=None,
+                 memory_cycles: int = None, seed: int = 0, space: int = 0):
+        if line <= 0 or line & (line - 1):
+            raise ValueError(f"{name}: el tamaño de bloque debe ser potencia de 2 (recibido {line})")
+        if assoc <= 0 or size % (assoc * line):
+            raise ValueError(f"{name}: el tamaño debe ser múltiplo de assoc * line")
+        sets = size // (assoc * line)
+        if sets & (sets - 1):
+            raise ValueError(f"{name}: la cantidad de conjuntos debe ser potencia de 2 (recibido {sets})")
+        if replacement not in self.REPLACEMENTS:
+            raise ValueError(f"{name}: reemplazo desconocido {replacement} (opciones: {', '.join(self.REPLACEMENTS)})")
+        if write_policy not in self.WRITE_POLICIES:
+            raise ValueError(f"{name}: política de escritura desconocida {write_policy}")
+
+        self.name = name
+        self.size = size
+        self.assoc = assoc
+        self.line = line
+        self.sets = sets
+        self.replacement = replacement
+        self.write_policy = write_policy
+        self.hit_cycles = hit_cycles
+        self.next_level = next_level
+        self.space = space
+        self.memory_cycles = memory_cycles if memory_cycles is not None else MEMORY_LATENCY_CYCLES
+
+        self.offset_bits = line.bit_length() - 1
+        self.set_mask = sets - 1
+        self._lru = replacement == "lru"
+        self._write_back = write_policy == "write-back"
+        self._random = random.Random(seed)  # semilla fija: las ejecuciones son reproducibles
+
+        entries = sets * assoc
+        self.tags = array("q", [-1]) * entries
+        self.dirty = bytearray(entries)
+        self.stamps = array("Q", [0]) * entries
+        self.counter = 0
+        self.hits = 0
+        self.misses = 0
+        self.writebacks = 0
+
+    def access(self, addr: int, write: bool = False) -> int:
+        """
+        Function: access
+        Simula una lectura o escritura en addr y actualiza tags, bits dirty y estadísticas.
+        Params:
+        - addr: int - dirección en bytes.
+        - write: bool - True para una escritura.
+        Returns:
+        - int: ciclos que tarda el acceso (hit_cycles si acierta).
+        """
+        block = (addr & ADDRESS_MASK) >> self.offset_bits
+        base = (block & self.set_mask) * self.assoc
+        tags = self.tags
+        self.counter += 1
+
+        for way in range(base, base + self.assoc):
+            if tags[way] == block:
+                self.hits += 1
+                if self._lru:
+                    self.stamps[way] = self.counter
+                if write:
+                    if self._write_back:
+                        self.dirty[way] = 1
+                    elif self.next_level is not None:
+                        self.next_level.access(addr | self.space, True)
+                return self.hit_cycles
+
+        self.misses += 1
+        if write and not self._write_back:
+            # Sin write-allocate: la escritura sigue al siguiente nivel por el buffer de escritura
+            if self.next_level is not None:
+                self.next_level.access(addr | self.space, True)
+            return self.hit_cycles
+
+        cycles = self.hit_cycles + self._next_level_cycles(addr, False)
+        way = self._victim(base)
+        if self.dirty[way]:
+            self.writebacks += 1
+            cycles += self._next_level_cycles(tags[way] << self.offset_bits, True)
+        tags[way] = block
+        self.dirty[way] = 1 if write else 0
+        self.stamps[way] = self.counter
+        return cycles
+
+    def _next_level_cycles(self, addr: int, write: bool) -> int:
+        if self.next_level is not None:
+            return self.next_level.access(addr | self.space, write)
+        return self.memory_cycles
+
+    def _victim(self, base: int) -> int:
+        """
+        Function: _victim
+        Elige la vía a reemplazar en el conjunto que empieza en base: una inválida si existe,
+        si no según la política (menor marca para LRU/FIFO, o al azar).
+        """
+        tags = self.tags
+        end = base + self.assoc
+        for way in range(base, end):
+            if tags[way] == -1:
+                return way
+        if self.replacement == "random":
+            return base + self._random.randrange(self.assoc)
+        return min(range(base, end), key=self.stamps.__getitem__)
+
+    def stats(self) -> dict:
+        accesses = self.hits + self.misses
+        return {
+            "accesos": accesses,
+            "aciertos": self.hits,
+            "fallos": self.misses,
+            "writebacks": self.writebacks,
+            "tasa_aciertos": (self.hits / accesses) * 100 if accesses else None,
+        }
+
+    def snapshot(self) -> tuple:
+        return (self.tags.tobytes(), bytes(self.dirty), self.stamps.tobytes(), self.counter,
+                self.hits, self.misses, self.writebacks, self._random.getstate())
+
+    def restore(self, snapshot: tuple):
+        tags, dirty, stamps, self.counter, self.hits, self.misses, self.writebacks, rng = snapshot
+        self.tags = array("q")
+        self.tags.frombytes(tags)
+        self.dirty[:] = dirty
+        self.stamps = array("Q")
+        self.stamps.frombytes(stamps)
+        self._random.setstate(rng)
+
+
+"""
+Class: CacheHierarchy
+L1 de instrucciones y L1 de datos (privadas) con un L2 unificado opcional detrás de ambas.
+
+Attributes:
+- l1i, l1d: Cache - cachés de primer nivel.
+- l2: Cache o None - caché unificada de segundo nivel.
+
+Methods:
+- caches: Lista de las cachés presentes.
+- stats: Estadísticas por caché.
+- snapshot / restore: Copia y restaura todas las cachés.
+
+Example:
+    hierarchy = create_cache_hierarchy(True)
+    ciclos = hierarchy.l1d.access(0x40, write=True)
+"""
+
+class CacheHierarchy:
+    def __init__(self, l1i_config: dict = None, l1d_config: dict = None, l2_config: dict = None,
+                 memory_cycles: int = None):
+        """
+        Function: __init__
+        Construye la jerarquía a partir de diccionarios con las claves de L1I_CACHE (config.py).
+        Params:
+        - l1i_config, l1d_config: dict o None - configuración de cada L1 (None = config.py).
+        - l2_config: dict o None - configuración del L2 (None = sin L2).
+        - memory_cycles: int o None - ciclos de la memoria principal.
+        """
+        memory_cycles = memory_cycles if memory_cycles is not None else MEMORY_LATENCY_CYCLES
+        self.l2 = self._build("L2", l2_config, None, memory_cycles) if l2_config else None
+        self.l1i = self._build("L1I", l1i_config or L1I_CACHE, self.l2, memory_cycles, INSTRUCTION_SPACE)
+        self.l1d = self._build("L1D", l1d_config or L1D_CACHE, self.l2, memory_cycles)
+
+    @staticmethod
+    def _build(name: str, options: dict, next_level, memory_cycles: int, space: int = 0) -> Cache:
+        return Cache(name, options["size"], options["assoc"], options["line"],
+                     replacement=options.get("replacement", "lru"),
+                     write_policy=options.get("write_policy", "write-back"),
+                     hit_cycles=options.get("hit_cycles", 0),
+                     next_level=next_level, memory_cycles=memory_cycles, space=space)
+
+    def caches(self) -> list:
+        return [cache for cache in (self.l1i, self.l1d, self.l2) if cache is not None]
+
+    def stats(self) -> dict:
+        return {cache.name: cache.stats() for cache in self.caches()}
+
+    def snapshot(self) -> tuple:
+        return tuple(cache.snapshot() for cache in self.caches())
+
+    def restore(self, snapshot: tuple):
+        for cache, state in zip(self.caches(), snapshot):
+            cache.restore(state)
+
+
+def create_cache_hierarchy(enabled: bool = None):
+    """
+    Function: create_cache_hierarchy
+    Crea la jerarquía de cachés de config.py, o None si las cachés están desactivadas.
+    Params:
+    - enabled: bool o None - activa las cachés (None = CACHES_ENABLED).
+    Returns:
+    - CacheHierarchy o None.
+    """
+    if enabled is None:
+        enabled = CACHES_ENABLED
+    if not enabled:
+        return None
+    return CacheHierarchy(L1I_CACHE, L1D_CACHE, L2_CACHE)
@@ -0,0 +1,115 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+import time
+from config import REAL_TIME_PACING
+
+"""
+Class: SimulatedClock
+Reloj virtual del procesador. Las etapas del pipeline registran su latencia (tomada de config.py)
+y al cerrar cada ciclo el reloj avanza según la etapa más lenta de ese ciclo, igual que el periodo
+de reloj de un pipeline real. No consume tiempo real salvo en modo de ritmo en tiempo real.
+
+Attributes:
+- real_time: bool - si es True, cada etapa además duerme su latencia en tiempo real (modo anterior).
+- current_time: float - tiempo simulado acumulado, en segundos.
+- cycle_latency: float - latencia máxima registrada en el ciclo actual, en segundos.
+
+Constructor:
+- __init__: Inicializa el reloj en cero.
+
+Methods:
+- stage: Registra la latencia de una etapa en el ciclo actual.
+- end_cycle: Cierra el ciclo actual y avanza el tiempo simulado.
+- get_time: Devuelve el tiempo simulado acumulado.
+- snapshot / restore: Copia y restaura el estado del reloj (historial inverso).
+- reset: Reinicia el reloj a cero.
+
+Example:
+    clock = SimulatedClock()
+    clock.stage(1e-9)
+    clock.stage(3e-9)
+    clock.end_cycle()  # 3e-9
+"""
+
+class SimulatedClock:
+    def __init__(self, real_time: bool = None):
+        """
+        Function: __init__
+        Inicializa el reloj virtual en cero.
+        Params:
+        - real_time: bool - activa el ritmo en tiempo real (time.sleep por etapa). Si es None se usa REAL_TIME_PACING.
+        """
+        self.real_time = REAL_TIME_PACING if real_time is None else real_time
+        self.current_time = 0.0
+        self.cycle_latency = 0.0
+
+    def stage(self, latency: float):
+        """
+        Function: stage
+        Registra la latencia de una etapa que trabajó en el ciclo actual.
+        Params:
+        - latency: float - latencia de la etapa en segundos.
+        Example:
+            clock.stage(LATENCY_EX)
+        """
+        if latency > self.cycle_latency:
+            self.cycle_latency = latency
+        if self.real_time:
+            time.sleep(latency)
+
+    def end_cycle(self) -> float:
+        """
+        Function: end_cycle
+        Cierra el ciclo actual: el tiempo simulado avanza la latencia de la etapa más lenta del ciclo.
+        Returns:
+        - float: tiempo simulado acumulado en segundos.
+        Example:
+            t = clock.end_cycle()
+        """
+        self.current_time += self.cycle_latency
+        self.cycle_latency = 0.0
+        return self.current_time
+
+    def get_time(self) -> float:
+        """
+        Function: get_time
+        Devuelve el tiempo simulado acumulado.
+        Returns:
+        - float: tiempo simulado en segundos.
+        Example:
+            t = clock.get_time()
+        """
+        return self.current_time
+
+    def snapshot(self) -> tuple:
+        """
+        Function: snapshot
+        Devuelve el estado del reloj (tiempo acumulado y latencia del ciclo en curso).
+        """
+        return (self.current_time, self.cycle_latency)
+
+    def restore(self, snapshot: tuple):
+        """
+        Function: restore
+        Restaura el estado del reloj tomado con snapshot().
+        """
+        self.current_time, self.cycle_latency = snapshot
+
+    def reset(self):
+        """
+        Function: reset
+        Reinicia el reloj virtual a cero.
+        Example:
+            clock.reset()
+        """
+        self.current_time = 0.0
+        self.cycle_latency = 0.0
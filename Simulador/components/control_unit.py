@@ -1,10 +1,50 @@
+from typing import NamedTuple
+from core.instruction import AluOp, LOAD_OPCODES, STORE_OPCODES
+
+
+class ControlSignals(NamedTuple):
+    """
+    Registro inmutable de señales de control de una instrucción.
+    Se calcula una sola vez por opcode y se comparte entre todas las instrucciones iguales.
+    Conserva get() para el código que lo trata como diccionario.
+    """
+    RegWrite: bool = False
+    MemRead: bool = False
+    MemWrite: bool = False
+    MemToReg: bool = False
+    ALUSrc: bool = False
+    Branch: bool = False
+    ALUOp: AluOp = AluOp.ADD
+    MemWidth: int = 4       # Bytes por acceso a memoria (4 = palabra, 2 = media, 1 = byte)
+    MemSigned: bool = True  # Extensión de signo en lecturas de byte/media palabra
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+
+NOP_SIGNALS = ControlSignals()  # Todas las señales en falso (NOP)
+
+
 class ControlUnit:
+    MEM_WIDTH = {"w": 4, "h": 2, "b": 1}  # Sufijo del mnemónico (lw/lh/lb...) → bytes
+
     def __init__(self):
-        pass
+        self._cache = {}  # opcode -> ControlSignals
 
-    def generate_signals(self, opcode: str) -> dict:
+    def generate_signals(self, opcode: str) -> ControlSignals:
         """
         Genera las señales de control para la instrucción dada por su opcode.
+        El resultado se memoriza por opcode, ya que las señales no dependen de los operandos.
+        """
+        signals = self._cache.get(opcode)
+        if signals is None:
+            signals = ControlSignals(**self._build_signals(opcode))
+            self._cache[opcode] = signals
+        return signals
+
+    def _build_signals(self, opcode: str) -> dict:
+        """
+        Construye el diccionario de señales de control para un opcode.
         """
         signals = {
             "RegWrite": False,
@@ -13,48 +53,53 @@ class ControlUnit:
             "MemToReg": False,
             "ALUSrc": False,
             "Branch": False,
-            "ALUOp": "ADD"  # Por defecto
+            "ALUOp": AluOp.ADD,  # Por defecto
+            "MemWidth": 4,
+            "MemSigned": True
         }
 
         if opcode in {"add", "sub", "and", "or", "slt", "xor", "sll", "srl", "sra"}:
             signals["RegWrite"] = True
             signals["ALUSrc"] = False
-            signals["ALUOp"] = opcode.upper()
+            signals["ALUOp"] = AluOp[opcode.upper()]
 
         elif opcode in {"addi", "andi", "ori", "slti", "slli", "srli", "srai"}:
             signals["RegWrite"] = True
             signals["ALUSrc"] = True
-            signals["ALUOp"] = opcode.upper()
+            signals["ALUOp"] = AluOp[opcode.upper()]
 
-        elif opcode == "lw":
+        elif opcode in LOAD_OPCODES:
             signals["RegWrite"] = True
             signals["MemRead"] = True
             signals["MemToReg"] = True
             signals["ALUSrc"] = True
-            signals["ALUOp"] = "ADD"
+            signals["ALUOp"] = AluOp.ADD
+            signals["MemWidth"] = self.MEM_WIDTH[opcode[1]]
+            signals["MemSigned"] = not opcode.endswith("u")
 
-        elif opcode == "sw":
+        elif opcode in STORE_OPCODES:
             signals["MemWrite"] = True
             signals["ALUSrc"] = True
-            signals["ALUOp"] = "ADD"
+            signals["ALUOp"] = AluOp.ADD
+            signals["MemWidth"] = self.MEM_WIDTH[opcode[1]]
 
         elif opcode in {"beq", "bne", "blt", "bge", "bltu", "bgeu"}:
             signals["Branch"] = True
-            signals["ALUOp"] = "SUB"
+            signals["ALUOp"] = AluOp.SUB
 
         elif opcode == "jal":
             signals["RegWrite"] = True
-            signals["ALUOp"] = "ADD"  # Dirección de retorno en x[rd]
+            signals["ALUOp"] = AluOp.ADD  # Dirección de retorno en x[rd]
 
         elif opcode == "jalr":
             signals["RegWrite"] = True
             signals["ALUSrc"] = True
-            signals["ALUOp"] = "ADD"
+            signals["ALUOp"] = AluOp.ADD
 
         elif opcode in {"lui", "auipc"}:
             signals["RegWrite"] = True
             signals["ALUSrc"] = True
-            signals["ALUOp"] = "LUI" if opcode == "lui" else "AUIPC"
+            signals["ALUOp"] = AluOp.LUI if opcode == "lui" else AluOp.AUIPC
 
         elif opcode == "nop":
             pass  # todo en falso
@@ -9,12 +9,17 @@ Consulta el archivo LICENSE para más detalles.
 ==========================================================================
 """
 
+from core.instruction import LOAD_OPCODES
+
 """
 Class: HazardUnit
-Clase que implementa la unidad de detección y resolución de hazards en el pipeline, gestionando stalls.
+Clase que implementa la unidad de detección de hazards en el pipeline, gestionando stalls. Los
+caminos de bypass los decide solo ForwardingUnit (core/policies.py); esta unidad únicamente sabe
+si existen, para no pedir stall en los RAW que el forwarding resuelve.
 
 Attributes:
-(No tiene atributos propios, es una clase de utilidad por método.)
+- forwarding: bool - el procesador tiene caminos de forwarding EX/MEM y MEM/WB. Con forwarding
+  solo los riesgos load-use requieren stall; sin él, también los RAW con una instrucción ALU.
 
 Constructor:
 - __init__: Inicializa la instancia de la unidad de hazards.
@@ -23,72 +28,57 @@ Methods:
 - detect_hazard: Detecta hazards de tipo load-use y determina si es necesario hacer stall.
 
 Example:
-    hazard = HazardUnit()
+    hazard = HazardUnit(forwarding=True)
     resultado = hazard.detect_hazard(if_id, id_ex, ex_mem, mem_wb)
 """
 
 class HazardUnit:
-    def __init__(self):
+    def __init__(self, forwarding: bool = False):
         """
         Function: __init__
         Inicializa la instancia de la unidad de hazards.
+        Params:
+        - forwarding: bool - hay forwarding (ver ForwardingUnit en core/policies.py).
         """
-        pass
+        self.forwarding = forwarding
 
-    def detect_hazard(self, if_id: dict, id_ex: dict, ex_mem: dict, mem_wb: dict) -> dict:
+    def detect_hazard(self, if_id, id_ex, ex_mem, mem_wb) -> dict:
         """
         Function: detect_hazard
-        Detecta hazards de tipo load-use y determina si es necesario hacer stall o forwarding.
+        Detecta hazards de tipo load-use (y RAW sin forwarding) y determina si es necesario hacer stall.
         Params:
-        - if_id: dict - registro IF/ID del pipeline.
-        - id_ex: dict - registro ID/EX del pipeline.
-        - ex_mem: dict - registro EX/MEM del pipeline.
-        - mem_wb: dict - registro MEM/WB del pipeline.
+        - if_id: IFIDLatch - registro IF/ID del pipeline.
+        - id_ex: IDEXLatch - registro ID/EX del pipeline.
+        - ex_mem: EXMEMLatch - registro EX/MEM del pipeline.
+        - mem_wb: MEMWBLatch - registro MEM/WB del pipeline.
         Returns:
-        - dict: contiene 'stall' (bool) y 'forward' (dict con claves 'rs1' y 'rs2').
+        - dict: contiene 'stall' (bool).
         Example:
             resultado = hazard.detect_hazard(if_id, id_ex, ex_mem, mem_wb)
         """
         stall = False
-        forward = {'rs1': None, 'rs2': None}
 
-        instr_id = if_id.get("instr")
-        instr_ex = id_ex.get("instr")
-        instr_mem = ex_mem.get("instr")
-        instr_wb = mem_wb.get("instr")
+        instr_id = if_id.instr
+        instr_ex = id_ex.instr
 
         if not instr_id or not instr_ex:
-            return {"stall": False, "forward": forward}
+            return {"stall": False}
 
+        # Registros como número (0-31); x0 (0) nunca genera dependencias
         rs1 = instr_id.rs1
         rs2 = instr_id.rs2
 
         # ---------- 1. Load-Use Hazard (requiere stall) ----------
-        if instr_ex.opcode == "lw" and instr_ex.rd and instr_ex.rd != "x0":
-            if instr_ex.rd == rs1 or instr_ex.rd == rs2:
-                stall = True
-
-        # ---------- 1b. RAW Hazard ALU→ALU o ALU→branch (requiere stall si no hay forwarding) ----------
-        # Detecta si la instrucción previa (ID/EX) escribe en un registro que la actual (IF/ID) lee
-        if instr_ex.opcode in {"add", "sub", "and", "or", "slt", "addi"} and instr_ex.rd and instr_ex.rd != "x0":
+        # El dato del load recién existe al final de MEM: ni el forwarding evita la burbuja
+        if instr_ex.opcode in LOAD_OPCODES and instr_ex.rd:
             if instr_ex.rd == rs1 or instr_ex.rd == rs2:
                 stall = True
 
-        # ---------- 2. Forwarding desde EX/MEM ----------
-        if instr_mem and instr_mem.rd and instr_mem.rd != "x0":
-            if instr_mem.rd == rs1:
-                forward['rs1'] = 'EX'
-            if instr_mem.rd == rs2:
-                forward['rs2'] = 'EX'
-
-        # ---------- 3. Forwarding desde MEM/WB ----------
-        if instr_wb and instr_wb.rd and instr_wb.rd != "x0":
-            if forward['rs1'] is None and instr_wb.rd == rs1:
-                forward['rs1'] = 'MEM'
-            if forward['rs2'] is None and instr_wb.rd == rs2:
-                forward['rs2'] = 'MEM'
+        if not self.forwarding:
+            # ---------- 2. RAW Hazard ALU→ALU o ALU→branch (requiere stall si no hay forwarding) ----------
+            # Detecta si la instrucción previa (ID/EX) escribe en un registro que la actual (IF/ID) lee
+            if instr_ex.opcode in {"add", "sub", "and", "or", "slt", "addi"} and instr_ex.rd:
+                if instr_ex.rd == rs1 or instr_ex.rd == rs2:
+                    stall = True
 
-        return {
-            "stall": stall,
-            "forward": forward
-        }
+        return {"stall": stall}
@@ -9,14 +9,575 @@ Consulta el archivo LICENSE para más detalles.
 ==========================================================================
 """
 
+import hashlib
+import struct
+from array import array
+from config import DATA_MEM_WORDS, SPARSE_DATA_MEMORY
+
 """
 Class: Memory
-Clase que simula una memoria RAM de palabras de 32 bits para el simulador.
-Permite almacenar, recuperar y manipular datos enteros en posiciones de memoria alineadas a 4 bytes.
+Memoria de datos direccionable por byte, respaldada por un bytearray (little-endian, como RISC-V).
+Las palabras se leen y escriben con struct y se ajustan a 32 bits: las lecturas devuelven el
+valor con signo y las escrituras truncan a los 32 bits menos significativos. Soporta accesos
+de byte y media palabra (lb/lh/lbu/lhu/sb/sh) y volcados sin copia mediante memoryview.
+
+Attributes:
+- size: int - tamaño de la memoria en bytes.
+- data: bytearray - contenido de la memoria.
+- dirty: set - direcciones de palabra (alineadas a 4) escritas desde el último take_dirty().
+- all_dirty: bool - True si cambió toda la memoria (inicio, reset, restore).
+
+Constructor:
+- __init__: Inicializa la memoria con un tamaño dado en palabras de 32 bits.
+
+Methods:
+- _check_address: Valida alineación y rango de un acceso.
+- load_word / store_word: Lee o escribe una palabra de 32 bits.
+- load_half / store_half: Lee o escribe media palabra (16 bits).
+- load_byte / store_byte: Lee o escribe un byte.
+- load / store: Acceso genérico de 1, 2 o 4 bytes (usado por la etapa MEM).
+- load_program: Carga una lista de valores en memoria a partir de una dirección inicial.
+- view: Devuelve un memoryview (sin copia) de un rango de memoria.
+- dump: Devuelve un diccionario con el contenido de memoria entre dos direcciones.
+- snapshot / restore: Copia y restaura el contenido completo de la memoria.
+- digest: Resumen SHA-256 del contenido (para comparar ejecuciones sin transferir la memoria).
+- take_dirty: Devuelve y limpia las palabras modificadas (para redibujar solo esas en la GUI).
+- ensure_words: Agranda la memoria si es menor que la cantidad de palabras pedida.
+- reset: Limpia toda la memoria, restaurando su estado inicial.
+
+Example:
+    mem = Memory(1024)
+    mem.store_word(0, -1)
+    print(mem.load_word(0))   # Imprime: -1
+    print(mem.load_byte(0, signed=False))  # Imprime: 255
+    mem.reset()
+"""
+
+_WORD = struct.Struct("<i")
+_UWORD = struct.Struct("<I")
+_HALF = struct.Struct("<h")
+_UHALF = struct.Struct("<H")
+
+class Memory:
+    def __init__(self, size_in_words=1024):
+        """
+        Function: __init__
+        Inicializa una memoria de datos de 1024 palabras (4096 bytes) por defecto.
+        Params:
+        - size_in_words: int - cantidad de palabras de 32 bits.
+        """
+        self.size = size_in_words * 4  # Tamaño en bytes
+        self.data = bytearray(self.size)  # Inicializa la memoria en cero
+        self.dirty = set()
+        self.all_dirty = True
+
+    def _check_address(self, address: int, width: int = 4) -> int:
+        """
+        Function: _check_address
+        Valida que la dirección esté alineada al tamaño del acceso y dentro del rango de memoria.
+        Params:
+        - address: int - dirección de memoria a validar.
+        - width: int - tamaño del acceso en bytes (1, 2 o 4).
+        Returns:
+        - int: la misma dirección, ya validada.
+        Restriction:
+        La dirección debe estar alineada a width bytes y dentro del rango de memoria.
+        """
+        if address % width != 0:
+            raise ValueError(f"Dirección no alineada a {width} bytes: {address}")
+        if address < 0 or address + width > self.size:
+            raise ValueError(f"Dirección fuera de rango: {address}")
+        return address
+
+    def load_word(self, address: int) -> int:
+        """
+        Function: load_word
+        Lee una palabra de 32 bits (con signo) desde la dirección dada.
+        Params:
+        - address: int - dirección de memoria desde la cual leer.
+        Returns:
+        - int: valor almacenado en la dirección dada.
+        Restriction:
+        La dirección debe ser válida y estar alineada a 4 bytes.
+        Example:
+            valor = mem.load_word(8)
+        """
+        self._check_address(address, 4)  # Validación de dirección
+        return _WORD.unpack_from(self.data, address)[0]
+
+    def store_word(self, address: int, value: int):
+        """
+        Function: store_word
+        Escribe una palabra de 32 bits en la dirección dada, truncando el valor a 32 bits.
+        Params:
+        - address: int - dirección de memoria donde escribir.
+        - value: int - valor a almacenar.
+        Restriction:
+        La dirección debe ser válida y estar alineada a 4 bytes.
+        Example:
+            mem.store_word(12, 42)
+        """
+        self._check_address(address, 4)  # Validación de dirección
+        _UWORD.pack_into(self.data, address, value & 0xFFFFFFFF)
+        self.dirty.add(address)
+
+    def load_half(self, address: int, signed: bool = True) -> int:
+        """
+        Function: load_half
+        Lee media palabra (16 bits) desde la dirección dada (lh / lhu).
+        Params:
+        - address: int - dirección alineada a 2 bytes.
+        - signed: bool - True extiende el signo (lh), False extiende con ceros (lhu).
+        Returns:
+        - int: valor leído.
+        Example:
+            valor = mem.load_half(2, signed=False)
+        """
+        self._check_address(address, 2)
+        return (_HALF if signed else _UHALF).unpack_from(self.data, address)[0]
+
+    def store_half(self, address: int, value: int):
+        """
+        Function: store_half
+        Escribe los 16 bits menos significativos del valor en la dirección dada (sh).
+        Params:
+        - address: int - dirección alineada a 2 bytes.
+        - value: int - valor a almacenar.
+        Example:
+            mem.store_half(2, 0x1234)
+        """
+        self._check_address(address, 2)
+        _UHALF.pack_into(self.data, address, value & 0xFFFF)
+        self.dirty.add(address & ~3)
+
+    def load_byte(self, address: int, signed: bool = True) -> int:
+        """
+        Function: load_byte
+        Lee un byte desde la dirección dada (lb / lbu).
+        Params:
+        - address: int - dirección de memoria.
+        - signed: bool - True extiende el signo (lb), False extiende con ceros (lbu).
+        Returns:
+        - int: valor leído.
+        Example:
+            valor = mem.load_byte(3)
+        """
+        self._check_address(address, 1)
+        value = self.data[address]
+        if signed and value & 0x80:
+            value -= 0x100
+        return value
+
+    def store_byte(self, address: int, value: int):
+        """
+        Function: store_byte
+        Escribe el byte menos significativo del valor en la dirección dada (sb).
+        Params:
+        - address: int - dirección de memoria.
+        - value: int - valor a almacenar.
+        Example:
+            mem.store_byte(3, 0x7F)
+        """
+        self._check_address(address, 1)
+        self.data[address] = value & 0xFF
+        self.dirty.add(address & ~3)
+
+    def load(self, address: int, width: int = 4, signed: bool = True) -> int:
+        """
+        Function: load
+        Lectura genérica de 1, 2 o 4 bytes, según las señales de control de la instrucción.
+        Params:
+        - address: int - dirección de memoria.
+        - width: int - tamaño del acceso en bytes.
+        - signed: bool - extensión de signo para accesos de 1 y 2 bytes.
+        Returns:
+        - int: valor leído.
+        Example:
+            valor = mem.load(4, 2, signed=False)  # lhu
+        """
+        if width == 4:
+            return self.load_word(address)
+        if width == 2:
+            return self.load_half(address, signed)
+        return self.load_byte(address, signed)
+
+    def store(self, address: int, value: int, width: int = 4):
+        """
+        Function: store
+        Escritura genérica de 1, 2 o 4 bytes, según las señales de control de la instrucción.
+        Params:
+        - address: int - dirección de memoria.
+        - value: int - valor a almacenar (se trunca al tamaño del acceso).
+        - width: int - tamaño del acceso en bytes.
+        Example:
+            mem.store(6, 0xBEEF, 2)  # sh
+        """
+        if width == 4:
+            self.store_word(address, value)
+        elif width == 2:
+            self.store_half(address, value)
+        else:
+            self.store_byte(address, value)
+
+    def load_program(self, values: list, start_address: int = 0):
+        """
+        Function: load_program
+        Carga una lista de valores enteros en memoria comenzando desde start_address.
+        Se usa para cargar datos de entrada.
+        Params:
+        - values: list - lista de enteros a cargar en memoria.
+        - start_address: int - dirección inicial donde comenzar a cargar los valores.
+        Example:
+            mem.load_program([1,2,3], 0)
+        """
+        for offset, val in enumerate(values):
+            addr = start_address + offset * 4  # Calcula la dirección alineada
+            self.store_word(addr, val)
+
+    def view(self, from_addr: int = 0, to_addr: int = None) -> memoryview:
+        """
+        Function: view
+        Devuelve un memoryview de solo lectura sobre un rango de memoria, sin copiar los datos.
+        Params:
+        - from_addr: int - dirección inicial.
+        - to_addr: int o None - dirección final (exclusiva). Si es None, se usa el final de la memoria.
+        Returns:
+        - memoryview: bytes del rango pedido.
+        Example:
+            raw = bytes(mem.view(0, 64))
+        """
+        if to_addr is None:
+            to_addr = self.size
+        return memoryview(self.data).toreadonly()[from_addr:to_addr]
+
+    def dump(self, from_addr=0, to_addr=None) -> dict:
+        """
+        Function: dump
+        Devuelve una representación de memoria entre dos direcciones (inclusive), palabra por palabra.
+        Ideal para mostrar en GUI o logs.
+        Params:
+        - from_addr: int - dirección inicial (alineada a 4).
+        - to_addr: int o None - dirección final (inclusive). Si es None, se usa el final de la memoria.
+        Returns:
+        - dict: diccionario con direcciones como llaves y valores almacenados.
+        Example:
+            mem.dump(0, 16)
+        """
+        if to_addr is None:
+            to_addr = self.size - 4
+        self._check_address(from_addr, 4)
+        self._check_address(to_addr, 4)
+        words = self.view(from_addr, to_addr + 4)
+        return {from_addr + i * 4: value
+                for i, (value,) in enumerate(_WORD.iter_unpack(words))}
+
+    def snapshot(self) -> bytes:
+        """
+        Function: snapshot
+        Devuelve una copia inmutable del contenido completo de la memoria.
+        Returns:
+        - bytes: contenido de la memoria.
+        Example:
+            estado = mem.snapshot()
+        """
+        return bytes(self.data)
+
+    def restore(self, snapshot: bytes):
+        """
+        Function: restore
+        Restaura el contenido de la memoria a partir de una copia tomada con snapshot().
+        Params:
+        - snapshot: bytes - contenido a restaurar (mismo tamaño que la memoria).
+        Example:
+            mem.restore(estado)
+        """
+        if len(snapshot) != self.size:
+            raise ValueError("El snapshot no coincide con el tamaño de la memoria")
+        self.data[:] = snapshot
+        self.all_dirty = True
+
+    def take_dirty(self):
+        """
+        Function: take_dirty
+        Devuelve las palabras escritas desde la llamada anterior y reinicia el seguimiento.
+        Returns:
+        - set o None: direcciones (alineadas a 4) modificadas, o None si hay que redibujar todo.
+        Example:
+            for addr in mem.take_dirty() or ():
+                ...
+        """
+        if self.all_dirty:
+            self.all_dirty = False
+            self.dirty.clear()
+            return None
+        dirty = self.dirty
+        self.dirty = set()
+        return dirty
+
+    def digest(self) -> str:
+        """
+        Function: digest
+        Devuelve el SHA-256 (hexadecimal) del contenido de la memoria, calculado sin copiarla.
+        Returns:
+        - str: resumen del contenido.
+        Example:
+            if mem_a.digest() == mem_b.digest(): ...
+        """
+        return hashlib.sha256(self.view()).hexdigest()
+
+    def reset(self):
+        """
+        Function: reset
+        Limpia toda la memoria, restaurando su estado inicial.
+        Example:
+            mem.reset()
+        """
+        self.data[:] = bytes(self.size)  # Reinicia todos los bytes a cero
+        self.all_dirty = True
+
+    def ensure_words(self, size_in_words: int):
+        """
+        Function: ensure_words
+        Agranda la memoria (rellenando con ceros) para que tenga al menos size_in_words palabras.
+        Params:
+        - size_in_words: int - cantidad mínima de palabras de 32 bits.
+        Restriction:
+        No puede haber memoryviews de view() vivos mientras la memoria crece.
+        Example:
+            mem.ensure_words(4096)
+        """
+        new_size = size_in_words * 4
+        if new_size > self.size:
+            self.data.extend(bytes(new_size - self.size))
+            self.size = new_size
+            self.all_dirty = True
+
+    def __len__(self):
+        return self.size
+
+
+"""
+Class: SparseMemory
+Memoria de datos dispersa: el espacio de direcciones (por defecto los 4 GiB de RV32) se divide en
+páginas de 4 KiB que solo se reservan la primera vez que se escriben. Las lecturas de páginas no
+tocadas devuelven 0 sin reservar nada, así que el consumo es proporcional a lo que el programa usa
+(por ejemplo, una pila cerca de 0xFFFFFFF0 y datos cerca de 0). Las direcciones se ajustan a 32 bits.
+Tiene la misma interfaz que Memory.
+
+Attributes:
+- size: int - tamaño del espacio de direcciones en bytes.
+- pages: dict - número de página → bytearray de PAGE_SIZE bytes.
+
+Methods:
+- load_word / store_word, load_half / store_half, load_byte / store_byte, load / store: igual que Memory.
+- view: memoryview del rango pedido (sin copia si cae dentro de una sola página).
+- dump: Volcado por palabras; sin rango explícito solo recorre las páginas reservadas.
+- snapshot / restore: Copia y restaura las páginas reservadas.
+- digest: Resumen SHA-256 de las páginas con datos.
+- ensure_words: No hace nada (las páginas se reservan al primer uso).
+- reset: Libera todas las páginas.
+
+Example:
+    mem = SparseMemory()
+    mem.store_word(0xFFFFFFF0, 7)
+    print(mem.load_word(0xFFFFFFF0), len(mem.pages))  # 7 1
+"""
+
+PAGE_BITS = 12
+PAGE_SIZE = 1 << PAGE_BITS  # 4 KiB
+PAGE_OFFSET_MASK = PAGE_SIZE - 1
+ADDRESS_MASK = 0xFFFFFFFF
+
+class SparseMemory(Memory):
+    def __init__(self, size_in_words=1 << 30):
+        """
+        Function: __init__
+        Inicializa una memoria dispersa vacía.
+        Params:
+        - size_in_words: int - tamaño del espacio de direcciones en palabras (por defecto 4 GiB).
+        """
+        self.size = size_in_words * 4
+        self.pages = {}
+        self.dirty = set()
+        self.all_dirty = True
+
+    def _check_address(self, address: int, width: int = 4) -> int:
+        """
+        Function: _check_address
+        Ajusta la dirección a 32 bits y valida alineación y rango.
+        Returns:
+        - int: dirección ajustada.
+        """
+        address &= ADDRESS_MASK
+        if address % width != 0:
+            raise ValueError(f"Dirección no alineada a {width} bytes: {address}")
+        if address + width > self.size:
+            raise ValueError(f"Dirección fuera de rango: {address}")
+        return address
+
+    def _page(self, address: int) -> bytearray:
+        """
+        Function: _page
+        Devuelve la página que contiene la dirección, reservándola si todavía no existe.
+        """
+        number = address >> PAGE_BITS
+        page = self.pages.get(number)
+        if page is None:
+            page = self.pages[number] = bytearray(PAGE_SIZE)
+        return page
+
+    def load_word(self, address: int) -> int:
+        address = self._check_address(address, 4)
+        page = self.pages.get(address >> PAGE_BITS)
+        if page is None:
+            return 0
+        return _WORD.unpack_from(page, address & PAGE_OFFSET_MASK)[0]
+
+    def store_word(self, address: int, value: int):
+        address = self._check_address(address, 4)
+        _UWORD.pack_into(self._page(address), address & PAGE_OFFSET_MASK, value & 0xFFFFFFFF)
+        self.dirty.add(address)
+
+    def load_half(self, address: int, signed: bool = True) -> int:
+        address = self._check_address(address, 2)
+        page = self.pages.get(address >> PAGE_BITS)
+        if page is None:
+            return 0
+        return (_HALF if signed else _UHALF).unpack_from(page, address & PAGE_OFFSET_MASK)[0]
+
+    def store_half(self, address: int, value: int):
+        address = self._check_address(address, 2)
+        _UHALF.pack_into(self._page(address), address & PAGE_OFFSET_MASK, value & 0xFFFF)
+        self.dirty.add(address & ~3)
+
+    def load_byte(self, address: int, signed: bool = True) -> int:
+        address = self._check_address(address, 1)
+        page = self.pages.get(address >> PAGE_BITS)
+        if page is None:
+            return 0
+        value = page[address & PAGE_OFFSET_MASK]
+        if signed and value & 0x80:
+            value -= 0x100
+        return value
+
+    def store_byte(self, address: int, value: int):
+        address = self._check_address(address, 1)
+        self._page(address)[address & PAGE_OFFSET_MASK] = value & 0xFF
+        self.dirty.add(address & ~3)
+
+    def view(self, from_addr: int = 0, to_addr: int = None) -> memoryview:
+        """
+        Function: view
+        Devuelve un memoryview de solo lectura del rango pedido. Si el rango cae dentro de una
+        página reservada no hay copia; en otro caso se arma una copia con ceros en los huecos.
+        """
+        if to_addr is None:
+            to_addr = self.size
+        first = from_addr >> PAGE_BITS
+        if to_addr - from_addr <= PAGE_SIZE and (to_addr - 1) >> PAGE_BITS == first and first in self.pages:
+            offset = from_addr & PAGE_OFFSET_MASK
+            return memoryview(self.pages[first]).toreadonly()[offset:offset + to_addr - from_addr]
+        out = bytearray(to_addr - from_addr)
+        for number, page in self.pages.items():
+            base = number << PAGE_BITS
+            lo = max(base, from_addr)
+            hi = min(base + PAGE_SIZE, to_addr)
+            if lo < hi:
+                out[lo - from_addr:hi - from_addr] = page[lo - base:hi - base]
+        return memoryview(out).toreadonly()
+
+    def dump(self, from_addr=0, to_addr=None) -> dict:
+        """
+        Function: dump
+        Devuelve el contenido por palabras. Sin to_addr solo incluye las páginas reservadas
+        dentro del rango (el espacio completo es demasiado grande para volcarlo entero).
+        """
+        if to_addr is not None:
+            return super().dump(from_addr, to_addr)
+        output = {}
+        for number in sorted(self.pages):
+            base = number << PAGE_BITS
+            if base + PAGE_SIZE <= from_addr:
+                continue
+            words = memoryview(self.pages[number]).toreadonly()
+            for i, (value,) in enumerate(_WORD.iter_unpack(words)):
+                addr = base + i * 4
+                if addr >= from_addr:
+                    output[addr] = value
+        return output
+
+    def snapshot(self) -> dict:
+        """
+        Function: snapshot
+        Devuelve una copia de las páginas reservadas (número de página → bytes).
+        """
+        return {number: bytes(page) for number, page in self.pages.items()}
+
+    def restore(self, snapshot: dict):
+        """
+        Function: restore
+        Restaura las páginas a partir de una copia tomada con snapshot().
+        """
+        self.pages = {number: bytearray(page) for number, page in snapshot.items()}
+        self.all_dirty = True
+
+    def digest(self) -> str:
+        """
+        Function: digest
+        SHA-256 de las páginas con contenido distinto de cero (en orden de dirección).
+        """
+        h = hashlib.sha256()
+        for number in sorted(self.pages):
+            page = self.pages[number]
+            if any(page):
+                h.update(number.to_bytes(4, "little"))
+                h.update(page)
+        return h.hexdigest()
+
+    def ensure_words(self, size_in_words: int):
+        pass  # Las páginas se reservan al primer uso
+
+    def reset(self):
+        """
+        Function: reset
+        Libera todas las páginas reservadas.
+        """
+        self.pages = {}
+        self.all_dirty = True
+
+
+def create_data_memory(size_in_words: int = None, sparse: bool = None) -> Memory:
+    """
+    Function: create_data_memory
+    Crea la memoria de datos de un procesador según los parámetros o, si se omiten, según config.py.
+    Params:
+    - size_in_words: int o None - tamaño en palabras (en modo disperso, tamaño del espacio de direcciones).
+    - sparse: bool o None - True para usar SparseMemory en lugar de la memoria densa.
+    Returns:
+    - Memory: memoria de datos.
+    Example:
+        data_mem = create_data_memory(sparse=True)
+    """
+    if sparse is None:
+        sparse = SPARSE_DATA_MEMORY
+    if sparse:
+        return SparseMemory(size_in_words) if size_in_words is not None else SparseMemory()
+    return Memory(size_in_words if size_in_words is not None else DATA_MEM_WORDS)
+
+
+"""
+Class: InstructionMemory
+Memoria de instrucciones organizada en palabras de 32 bits. Guarda código máquina RV32I
+(core/rv32i.py) en un array('I'): 4 bytes por instrucción, sin objetos por celda.
+Permite almacenar y recuperar palabras en posiciones de memoria alineadas a 4 bytes.
 
 Attributes:
 - size: int - cantidad de palabras de 32 bits que puede almacenar la memoria.
-- data: list - lista de enteros que representa el contenido de la memoria.
+- data: array('I') - palabras sin signo que representan el contenido de la memoria.
+- extended: dict - índice → Instruction para las instrucciones sin codificación RV32I (inmediato
+  fuera del rango de su formato). Su celda de data queda en 0; load_word devuelve la Instruction.
+- on_write: función o None - se llama con la dirección escrita (None en reset) para invalidar
+  cachés derivadas del código, como la caché de bloques del modo funcional.
 
 Constructor:
 - __init__: Inicializa la memoria con un tamaño dado en palabras de 32 bits.
@@ -27,16 +588,17 @@ Methods:
 - store_word: Escribe una palabra de 32 bits en una dirección dada.
 - load_program: Carga una lista de valores en memoria a partir de una dirección inicial.
 - dump: Devuelve un diccionario con el contenido de memoria entre dos direcciones.
+- ensure_words: Agranda la memoria si es menor que la cantidad de palabras pedida.
 - reset: Limpia toda la memoria, restaurando su estado inicial.
 
 Example:
-    mem = Memory(1024)
+    mem = InstructionMemory(1024)
     mem.store_word(0, 123)
     print(mem.load_word(0))  # Imprime: 123
     mem.reset()
 """
 
-class Memory:
+class InstructionMemory:
     def __init__(self, size_in_words=1024):
         """
         Function: __init__
@@ -45,7 +607,9 @@ class Memory:
         - size_in_words: int - cantidad de celdas de 32 bits.
         """
         self.size = size_in_words  # Número de palabras de 32 bits
-        self.data = [0] * self.size  # Inicializa la memoria en cero
+        self.data = array('I', bytes(4 * self.size))  # Inicializa la memoria en cero
+        self.extended = {}
+        self.on_write = None
 
     def _check_address(self, address: int):
         """
@@ -72,13 +636,17 @@ class Memory:
         Params:
         - address: int - dirección de memoria desde la cual leer.
         Returns:
-        - int: valor almacenado en la dirección dada.
+        - int o Instruction: palabra almacenada (la Instruction si no tiene codificación RV32I).
         Restriction:
         La dirección debe ser válida y estar alineada a 4 bytes.
         Example:
             valor = mem.load_word(8)
         """
         index = self._check_address(address)  # Validación de dirección
+        if self.extended:
+            instr = self.extended.get(index)
+            if instr is not None:
+                return instr
         return self.data[index]
 
     def store_word(self, address: int, value: int):
@@ -87,14 +655,22 @@ class Memory:
         Escribe una palabra de 32 bits en la dirección dada.
         Params:
         - address: int - dirección de memoria donde escribir.
-        - value: int - valor de 32 bits a almacenar.
+        - value: int o Instruction - valor de 32 bits, o una Instruction sin codificación RV32I.
         Restriction:
         La dirección debe ser válida y estar alineada a 4 bytes.
         Example:
             mem.store_word(12, 42)
         """
         index = self._check_address(address)  # Validación de dirección
-        self.data[index] = value
+        if isinstance(value, int):
+            self.data[index] = value & 0xFFFFFFFF
+            if self.extended:
+                self.extended.pop(index, None)
+        else:
+            self.data[index] = 0
+            self.extended[index] = value
+        if self.on_write is not None:
+            self.on_write(address)
 
     def load_program(self, values: list, start_address: int = 0):
         """
@@ -138,4 +714,21 @@ class Memory:
         Example:
             mem.reset()
         """
-        self.data = [0] * self.size  # Reinicia todos los valores a cero
+        self.data = array('I', bytes(4 * self.size))  # Reinicia todos los valores a cero
+        self.extended = {}
+        if self.on_write is not None:
+            self.on_write(None)
+
+    def ensure_words(self, size_in_words: int):
+        """
+        Function: ensure_words
+        Agranda la memoria para que tenga al menos size_in_words palabras (por ejemplo,
+        para que quepa un programa más largo que el tamaño configurado).
+        Params:
+        - size_in_words: int - cantidad mínima de palabras.
+        Example:
+            mem.ensure_words(len(programa))
+        """
+        if size_in_words > self.size:
+            self.data.frombytes(bytes(4 * (size_in_words - self.size)))
+            self.size = size_in_words
@@ -0,0 +1,58 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+"""
+Package: predictors
+Familia de predictores de saltos con interfaz común (predict / update / flush_required /
+snapshot / restore, ver PredictorBase) y tablas de tamaño configurable respaldadas por arreglos.
+El predictor de 1 bit original (components/branch_predictor.py) sigue disponible como "1bit".
+"""
+
+from components.branch_predictor import BranchPredictor
+from components.predictors.base import PredictorBase
+from components.predictors.btb import BranchTargetBuffer
+from components.predictors.two_bit import TwoBitPredictor
+from components.predictors.gshare import GsharePredictor
+from components.predictors.tournament import TournamentPredictor
+from config import BRANCH_PREDICTOR, PREDICTOR_ENTRIES, PREDICTOR_HISTORY_BITS, BTB_ENTRIES
+
+PREDICTOR_KINDS = ("1bit", "2bit", "gshare", "tournament")
+
+
+def create_predictor(kind: str = None, entries: int = None, history_bits: int = None,
+                     btb_entries: int = None):
+    """
+    Function: create_predictor
+    Crea un predictor de saltos según los parámetros o, si se omiten, según config.py.
+    Params:
+    - kind: str o None - "1bit", "2bit", "gshare" o "tournament".
+    - entries: int o None - contadores por tabla (potencia de 2).
+    - history_bits: int o None - bits de historia global (gshare y tournament).
+    - btb_entries: int o None - entradas del BTB (potencia de 2; 0 = sin BTB).
+    Returns:
+    - predictor con la interfaz de PredictorBase.
+    Example:
+        predictor = create_predictor("gshare", entries=4096, history_bits=12)
+    """
+    kind = kind or BRANCH_PREDICTOR
+    entries = entries or PREDICTOR_ENTRIES
+    history_bits = history_bits if history_bits is not None else PREDICTOR_HISTORY_BITS
+    btb_entries = btb_entries if btb_entries is not None else BTB_ENTRIES
+    if kind == "1bit":
+        return BranchPredictor()
+    btb = BranchTargetBuffer(btb_entries) if btb_entries else None
+    if kind == "2bit":
+        return TwoBitPredictor(entries, btb=btb)
+    if kind == "gshare":
+        return GsharePredictor(entries, history_bits, btb=btb)
+    if kind == "tournament":
+        return TournamentPredictor(entries, history_bits, btb=btb)
+    raise ValueError(f"Predictor desconocido: {kind} (opciones: {', '.join(PREDICTOR_KINDS)})")
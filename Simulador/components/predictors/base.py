@@ -0,0 +1,124 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from abc import ABC, abstractmethod
+
+"""
+Class: PredictorBase
+Interfaz común (clase abstracta) de los predictores de saltos del paquete. Las subclases solo
+implementan la predicción de dirección (predict_taken / train) y la copia de sus tablas; el destino
+lo aporta un BranchTargetBuffer opcional. Un predictor al que le falte alguno de esos métodos no se
+puede instanciar.
+
+Las tablas de contadores son bytearray de tamaño potencia de 2 indexados con los bits bajos de PC/4.
+
+Attributes:
+- btb: BranchTargetBuffer o None - buffer de destinos consultado en predict().
+
+Methods:
+- predict: Devuelve {"taken", "target"} para el salto en pc ("target" es None sin acierto en el BTB).
+- update: Entrena el predictor (y el BTB) con el resultado real.
+- flush_required: Indica si la dirección predicha fue errónea.
+- snapshot / restore: Copia y restaura las tablas (historial inverso).
+- predict_taken / train / _snapshot_tables / _restore_tables: métodos abstractos de las subclases.
+
+Example:
+    predictor = TwoBitPredictor(entries=1024, btb=BranchTargetBuffer(64))
+    prediction = predictor.predict(pc)
+    predictor.update(pc, taken=True, target=pc + 16)
+"""
+
+COUNTER_MAX = 3          # contador saturado de 2 bits: 0-1 no tomado, 2-3 tomado
+COUNTER_THRESHOLD = 2
+COUNTER_INIT = 1         # débilmente "no tomado" (misma predicción inicial que el predictor de 1 bit)
+
+
+def index_mask(entries: int, what: str = "La tabla") -> int:
+    """
+    Function: index_mask
+    Valida que entries sea potencia de 2 y devuelve la máscara de índice (entries - 1).
+    """
+    if entries <= 0 or entries & (entries - 1):
+        raise ValueError(f"{what} debe tener una cantidad de entradas potencia de 2 (recibido {entries})")
+    return entries - 1
+
+
+def train_counter(counters: bytearray, index: int, taken: bool):
+    """
+    Function: train_counter
+    Incrementa (tomado) o decrementa (no tomado) un contador saturado de 2 bits.
+    """
+    value = counters[index]
+    if taken:
+        if value < COUNTER_MAX:
+            counters[index] = value + 1
+    elif value:
+        counters[index] = value - 1
+
+
+class PredictorBase(ABC):
+    def __init__(self, btb=None):
+        self.btb = btb
+
+    def predict(self, pc: int) -> dict:
+        """
+        Function: predict
+        Params:
+        - pc: int - dirección de la instrucción de salto.
+        Returns:
+        - dict: 'taken' (bool) y 'target' (int o None si el BTB no tiene el salto).
+        """
+        btb = self.btb
+        return {
+            "taken": self.predict_taken(pc),
+            "target": btb.lookup(pc) if btb is not None else None,
+        }
+
+    def update(self, pc: int, taken: bool, target: int = None):
+        """
+        Function: update
+        Entrena la dirección con el resultado real y guarda el destino de los saltos tomados en el BTB.
+        Params:
+        - pc: int - dirección de la instrucción de salto.
+        - taken: bool - True si se tomó.
+        - target: int o None - destino real del salto.
+        """
+        self.train(pc, taken)
+        if taken and target is not None and self.btb is not None:
+            self.btb.update(pc, target)
+
+    def flush_required(self, prediction_taken: bool, actual_taken: bool) -> bool:
+        return prediction_taken != actual_taken
+
+    def snapshot(self) -> tuple:
+        return (self._snapshot_tables(), self.btb.snapshot() if self.btb is not None else None)
+
+    def restore(self, snapshot: tuple):
+        tables, btb_state = snapshot
+        self._restore_tables(tables)
+        if self.btb is not None:
+            self.btb.restore(btb_state)
+
+    @abstractmethod
+    def predict_taken(self, pc: int) -> bool:
+        """Dirección predicha (True = tomado) para el salto en pc."""
+
+    @abstractmethod
+    def train(self, pc: int, taken: bool):
+        """Entrena las tablas de dirección con el resultado real del salto en pc."""
+
+    @abstractmethod
+    def _snapshot_tables(self):
+        """Copia inmutable de las tablas de dirección (ver snapshot)."""
+
+    @abstractmethod
+    def _restore_tables(self, tables):
+        """Restaura las tablas copiadas con _snapshot_tables."""
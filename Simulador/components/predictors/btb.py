@@ -0,0 +1,69 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from array import array
+from components.predictors.base import index_mask
+
+"""
+Class: BranchTargetBuffer
+Buffer de destinos de salto de mapeo directo y tamaño fijo. Un PC se descompone en
+índice = (PC >> 2) & (entries - 1) y tag = PC >> (2 + index_bits); una entrada solo acierta si
+es válida y su tag coincide, así dos saltos que comparten índice se reemplazan entre sí.
+
+Attributes:
+- entries: int - entradas (potencia de 2).
+- index_bits: int - bits de índice (log2(entries)).
+- valid: bytearray - 1 si la entrada tiene un destino.
+- tags: array('L') - tag de cada entrada.
+- targets: array('L') - destino de cada entrada.
+
+Methods:
+- lookup: Destino guardado para un PC, o None.
+- update: Guarda el destino de un salto tomado.
+- snapshot / restore: Copia y restaura las tablas.
+
+Example:
+    btb = BranchTargetBuffer(64)
+    btb.update(0x40, 0x10)
+    btb.lookup(0x40)  # 0x10
+"""
+
+class BranchTargetBuffer:
+    def __init__(self, entries: int = 64):
+        self.mask = index_mask(entries, "El BTB")
+        self.entries = entries
+        self.index_bits = entries.bit_length() - 1
+        self.valid = bytearray(entries)
+        self.tags = array("L", [0]) * entries
+        self.targets = array("L", [0]) * entries
+
+    def lookup(self, pc: int):
+        index = (pc >> 2) & self.mask
+        if self.valid[index] and self.tags[index] == pc >> (2 + self.index_bits):
+            return self.targets[index]
+        return None
+
+    def update(self, pc: int, target: int):
+        index = (pc >> 2) & self.mask
+        self.valid[index] = 1
+        self.tags[index] = pc >> (2 + self.index_bits)
+        self.targets[index] = target & 0xFFFFFFFF
+
+    def snapshot(self) -> tuple:
+        return (bytes(self.valid), self.tags.tobytes(), self.targets.tobytes())
+
+    def restore(self, snapshot: tuple):
+        valid, tags, targets = snapshot
+        self.valid[:] = valid
+        self.tags = array("L")
+        self.tags.frombytes(tags)
+        self.targets = array("L")
+        self.targets.frombytes(targets)
@@ -0,0 +1,58 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from components.predictors.base import (PredictorBase, index_mask, train_counter,
+                                        COUNTER_INIT, COUNTER_THRESHOLD)
+
+"""
+Class: GsharePredictor
+Predictor gshare: contadores de 2 bits indexados con PC/4 XOR la historia global (resultado de
+los últimos history_bits saltos). Captura correlaciones entre saltos distintos que el bimodal no ve.
+
+En este simulador un salto se predice y se resuelve en el mismo ciclo, así que la historia no
+cambia entre predict() y update() y ambos calculan el mismo índice.
+
+Attributes:
+- entries: int - contadores de la tabla (potencia de 2).
+- history_bits: int - bits de historia global.
+- history: int - historia global (1 = tomado), el bit 0 es el salto más reciente.
+- counters: bytearray - contadores 0..3.
+
+Example:
+    predictor = GsharePredictor(entries=4096, history_bits=12)
+"""
+
+class GsharePredictor(PredictorBase):
+    def __init__(self, entries: int = 1024, history_bits: int = 10, btb=None):
+        super().__init__(btb)
+        self.mask = index_mask(entries)
+        self.entries = entries
+        self.history_bits = history_bits
+        self.history_mask = (1 << history_bits) - 1
+        self.history = 0
+        self.counters = bytearray([COUNTER_INIT]) * entries
+
+    def _index(self, pc: int) -> int:
+        return ((pc >> 2) ^ self.history) & self.mask
+
+    def predict_taken(self, pc: int) -> bool:
+        return self.counters[self._index(pc)] >= COUNTER_THRESHOLD
+
+    def train(self, pc: int, taken: bool):
+        train_counter(self.counters, self._index(pc), taken)
+        self.history = ((self.history << 1) | taken) & self.history_mask
+
+    def _snapshot_tables(self):
+        return (bytes(self.counters), self.history)
+
+    def _restore_tables(self, tables):
+        counters, self.history = tables
+        self.counters[:] = counters
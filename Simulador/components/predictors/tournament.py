@@ -0,0 +1,61 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from components.predictors.base import (PredictorBase, index_mask, train_counter,
+                                        COUNTER_INIT, COUNTER_THRESHOLD)
+from components.predictors.two_bit import TwoBitPredictor
+from components.predictors.gshare import GsharePredictor
+
+"""
+Class: TournamentPredictor
+Predictor de torneo: combina un bimodal (por PC) y un gshare (historia global) y elige entre
+ambos con una tabla de contadores de 2 bits indexada por PC (0-1 usa el bimodal, 2-3 el gshare).
+El selector solo se entrena cuando los dos predictores discrepan, hacia el que acertó.
+
+Attributes:
+- local: TwoBitPredictor - componente por dirección.
+- global_predictor: GsharePredictor - componente de historia global.
+- chooser: bytearray - contadores del selector.
+
+Example:
+    predictor = TournamentPredictor(entries=1024, history_bits=10)
+"""
+
+class TournamentPredictor(PredictorBase):
+    def __init__(self, entries: int = 1024, history_bits: int = 10, btb=None):
+        super().__init__(btb)
+        self.mask = index_mask(entries)
+        self.entries = entries
+        self.local = TwoBitPredictor(entries)
+        self.global_predictor = GsharePredictor(entries, history_bits)
+        self.chooser = bytearray([COUNTER_INIT]) * entries
+
+    def predict_taken(self, pc: int) -> bool:
+        if self.chooser[(pc >> 2) & self.mask] >= COUNTER_THRESHOLD:
+            return self.global_predictor.predict_taken(pc)
+        return self.local.predict_taken(pc)
+
+    def train(self, pc: int, taken: bool):
+        local_taken = self.local.predict_taken(pc)
+        global_taken = self.global_predictor.predict_taken(pc)
+        if local_taken != global_taken:
+            train_counter(self.chooser, (pc >> 2) & self.mask, global_taken == taken)
+        self.local.train(pc, taken)
+        self.global_predictor.train(pc, taken)
+
+    def _snapshot_tables(self):
+        return (self.local._snapshot_tables(), self.global_predictor._snapshot_tables(), bytes(self.chooser))
+
+    def _restore_tables(self, tables):
+        local, global_tables, chooser = tables
+        self.local._restore_tables(local)
+        self.global_predictor._restore_tables(global_tables)
+        self.chooser[:] = chooser
@@ -0,0 +1,46 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from components.predictors.base import (PredictorBase, index_mask, train_counter,
+                                        COUNTER_INIT, COUNTER_THRESHOLD)
+
+"""
+Class: TwoBitPredictor
+Predictor bimodal: una tabla de contadores saturados de 2 bits indexada por los bits bajos de PC/4.
+Un salto necesita equivocarse dos veces seguidas para cambiar de predicción, así que el último
+salto de un lazo no invierte la predicción de la siguiente ejecución del lazo.
+
+Attributes:
+- entries: int - contadores de la tabla (potencia de 2).
+- counters: bytearray - contadores 0..3.
+
+Example:
+    predictor = TwoBitPredictor(entries=512)
+"""
+
+class TwoBitPredictor(PredictorBase):
+    def __init__(self, entries: int = 1024, btb=None):
+        super().__init__(btb)
+        self.mask = index_mask(entries)
+        self.entries = entries
+        self.counters = bytearray([COUNTER_INIT]) * entries
+
+    def predict_taken(self, pc: int) -> bool:
+        return self.counters[(pc >> 2) & self.mask] >= COUNTER_THRESHOLD
+
+    def train(self, pc: int, taken: bool):
+        train_counter(self.counters, (pc >> 2) & self.mask, taken)
+
+    def _snapshot_tables(self):
+        return bytes(self.counters)
+
+    def _restore_tables(self, tables):
+        self.counters[:] = tables
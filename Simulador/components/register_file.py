@@ -9,27 +9,74 @@ Consulta el archivo LICENSE para más detalles.
 ==========================================================================
 """
 
+# Nombres ABI de x0..x31 (convención de llamadas RISC-V)
+ABI_NAMES = (
+    "zero", "ra", "sp", "gp", "tp", "t0", "t1", "t2",
+    "s0", "s1", "a0", "a1", "a2", "a3", "a4", "a5",
+    "a6", "a7", "s2", "s3", "s4", "s5", "s6", "s7",
+    "s8", "s9", "s10", "s11", "t3", "t4", "t5", "t6",
+)
+
+# Nombre canónico de cada registro, indexado por número
+REGISTER_NAMES = tuple(f"x{i}" for i in range(32))
+
+# Cualquier nombre aceptado (xN, ABI o fp) → número de registro
+REGISTER_INDEX = {name: i for i, name in enumerate(REGISTER_NAMES)}
+REGISTER_INDEX.update({name: i for i, name in enumerate(ABI_NAMES)})
+REGISTER_INDEX["fp"] = 8  # alias de s0
+
+
+def register_index(reg) -> int:
+    """
+    Function: register_index
+    Convierte un nombre de registro (x5, t0, sp, fp...) o un número en el índice 0-31.
+    Params:
+    - reg: str o int - nombre o número del registro.
+    Returns:
+    - int: número de registro.
+    Restriction:
+    Lanza ValueError si el registro no existe.
+    Example:
+        register_index('a0')  # 10
+    """
+    if isinstance(reg, int):
+        if 0 <= reg < 32:
+            return reg
+    else:
+        index = REGISTER_INDEX.get(reg.strip())
+        if index is not None:
+            return index
+    raise ValueError(f"Register {reg} does not exist.")
+
+
 """
 Class: RegisterFile
 Clase que simula el banco de registros de un procesador RISC-V, con registros x0 a x31.
+Los registros se guardan en una lista de 32 posiciones indexada por número de registro;
+las etapas del pipeline usan índices enteros resueltos al parsear la instrucción.
 Permite leer, escribir, reiniciar y obtener el estado de todos los registros.
 
 Attributes:
-- registers: dict - diccionario que almacena los valores de los registros (x0 a x31).
+- values: list - valores de los registros, indexados por número (x0 a x31).
+- dirty: set - números de registro escritos desde el último take_dirty().
+- all_dirty: bool - True si cambió todo el banco (inicio, reset, restore).
 
 Constructor:
 - __init__: Inicializa todos los registros en 0, asegurando que x0 siempre sea 0.
 
 Methods:
-- read: Devuelve el valor actual de un registro dado su nombre.
+- read: Devuelve el valor actual de un registro dado su número o nombre.
 - write: Escribe un valor en un registro, ignorando x0.
-- dump: Devuelve una copia del estado de todos los registros.
+- dump: Devuelve el estado de todos los registros como diccionario nombre → valor.
+- take_dirty: Devuelve y limpia los registros modificados (para redibujar solo esos en la GUI).
+- snapshot / restore: Copia y restaura los 32 registros.
 - reset: Reinicia todos los registros a 0, excepto x0.
 - __str__: Devuelve una representación textual de todos los registros.
 
 Example:
     rf = RegisterFile()
-    rf.write('x1', 10)
+    rf.write(1, 10)
+    rf.write('a0', 7)
     print(rf.read('x1'))  # Imprime: 10
     print(rf)  # Muestra todos los registros
     rf.reset()
@@ -41,55 +88,93 @@ class RegisterFile:
         Function: __init__
         Inicializa los registros x0 a x31 en 0. El registro x0 siempre permanece en 0.
         """
-        self.registers = {f'x{i}': 0 for i in range(32)}  # Crea los registros x0-x31
-        self.registers['x0'] = 0  # x0 siempre tiene el valor 0 (hardwired)
+        self.values = [0] * 32  # x0-x31; x0 siempre tiene el valor 0 (hardwired)
+        self.dirty = set()
+        self.all_dirty = True
 
-    def read(self, reg_name: str) -> int:
+    def read(self, reg) -> int:
         """
         Function: read
         Devuelve el valor actual del registro especificado.
         Params:
-        - reg_name: str - nombre del registro a leer (ejemplo: 'x5').
+        - reg: int o str - número de registro (camino rápido) o nombre ('x5', 't0').
         Returns:
         - int: valor almacenado en el registro.
         Restriction:
-        Lanza ValueError si el nombre del registro es inválido.
+        Lanza ValueError si el registro es inválido.
         Example:
-            valor = rf.read('x2')
+            valor = rf.read(2)
         """
-        if reg_name not in self.registers:
-            raise ValueError(f"Register {reg_name} does not exist.")
-        return self.registers[reg_name]
+        if type(reg) is not int:
+            reg = register_index(reg)
+        return self.values[reg]
 
-    def write(self, reg_name: str, value: int):
+    def write(self, reg, value: int):
         """
         Function: write
         Escribe un valor en el registro especificado, ignorando x0.
         Params:
-        - reg_name: str - nombre del registro a escribir.
+        - reg: int o str - número o nombre del registro a escribir.
         - value: int - valor a almacenar en el registro.
         Restriction:
         No permite modificar el registro x0. Lanza ValueError si el registro no existe.
         Example:
-            rf.write('x3', 42)
+            rf.write(3, 42)
         """
-        if reg_name == 'x0':
+        if type(reg) is not int:
+            reg = register_index(reg)
+        if reg == 0:
             # Ignora escritura en x0
             return
-        if reg_name not in self.registers:
-            raise ValueError(f"Register {reg_name} does not exist.")
-        self.registers[reg_name] = value
+        self.values[reg] = value
+        self.dirty.add(reg)
+
+    def take_dirty(self):
+        """
+        Function: take_dirty
+        Devuelve los registros escritos desde la llamada anterior y reinicia el seguimiento.
+        Returns:
+        - set o None: números de registro modificados, o None si hay que redibujar todo el banco.
+        Example:
+            cambios = rf.take_dirty()
+        """
+        if self.all_dirty:
+            self.all_dirty = False
+            self.dirty.clear()
+            return None
+        dirty = self.dirty
+        self.dirty = set()
+        return dirty
 
     def dump(self) -> dict:
         """
         Function: dump
-        Devuelve una copia del estado de todos los registros.
+        Devuelve el estado de todos los registros con su nombre canónico.
         Returns:
-        - dict: copia del diccionario de registros.
+        - dict: nombre ('x0'..'x31') → valor.
         Example:
             estado = rf.dump()
         """
-        return self.registers.copy()
+        return dict(zip(REGISTER_NAMES, self.values))
+
+    def snapshot(self) -> tuple:
+        """
+        Function: snapshot
+        Devuelve una copia inmutable de los 32 registros.
+        Returns:
+        - tuple: valores de x0..x31.
+        """
+        return tuple(self.values)
+
+    def restore(self, snapshot: tuple):
+        """
+        Function: restore
+        Restaura los registros a partir de una copia tomada con snapshot().
+        Params:
+        - snapshot: tuple - valores de x0..x31.
+        """
+        self.values[:] = snapshot
+        self.all_dirty = True
 
     def reset(self):
         """
@@ -98,9 +183,8 @@ class RegisterFile:
         Example:
             rf.reset()
         """
-        for key in self.registers:
-            if key != 'x0':
-                self.registers[key] = 0
+        self.values[:] = [0] * 32
+        self.all_dirty = True
 
     def __str__(self):
         """
@@ -111,5 +195,5 @@ class RegisterFile:
         Example:
             print(rf)
         """
-        lines = [f"{reg}: {val}" for reg, val in self.registers.items()]
+        lines = [f"{reg}: {val}" for reg, val in zip(REGISTER_NAMES, self.values)]
         return "\n".join(lines)
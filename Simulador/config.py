@@ -5,5 +5,54 @@ LATENCY_EX = 2e-9    # 2ns
 LATENCY_MEM = 3e-9   # 4ns
 LATENCY_WB = 1e-9    # 1ns
 
+# Las latencias se acumulan en un reloj simulado (components/clock.py).
+# Con True, cada etapa además espera su latencia en tiempo real (time.sleep).
+REAL_TIME_PACING = False
+
+# Tamaño por defecto de las memorias, en palabras de 32 bits.
+# La memoria de instrucciones crece automáticamente si el programa no cabe.
+INSTR_MEM_WORDS = 1024
+DATA_MEM_WORDS = 1024
+
+# Con True, la memoria de datos es dispersa (páginas de 4 KiB reservadas al primer uso)
+# y cubre todo el espacio de 32 bits; DATA_MEM_WORDS deja de aplicar.
+SPARSE_DATA_MEMORY = False
+
+# Historial para ejecución inversa (paso atrás, core/history.py): checkpoint completo cada
+# HISTORY_CHECKPOINT_INTERVAL ciclos más un delta por ciclo, conservando a lo sumo
+# HISTORY_BUDGET_CYCLES ciclos hacia atrás.
+HISTORY_CHECKPOINT_INTERVAL = 128
+HISTORY_BUDGET_CYCLES = 100000
+
+# Predictor de saltos del procesador completo (components/predictors): "1bit", "2bit", "gshare"
+# o "tournament". Las tablas tienen PREDICTOR_ENTRIES contadores (potencia de 2), gshare y
+# tournament usan PREDICTOR_HISTORY_BITS bits de historia global y el BTB tiene BTB_ENTRIES
+# entradas de mapeo directo (0 = sin BTB; entonces jalr no se predice tomado).
+BRANCH_PREDICTOR = "2bit"
+PREDICTOR_ENTRIES = 1024
+PREDICTOR_HISTORY_BITS = 10
+BTB_ENTRIES = 256
+
+# Jerarquía de cachés (components/cache.py). Modelo solo de tiempo: los datos siguen en Memory.
+# Con CACHES_ENABLED, cada fallo congela el pipeline los ciclos que tarda el siguiente nivel
+# (L2 o memoria principal, MEMORY_LATENCY_CYCLES). L2_CACHE = None desactiva el L2 unificado.
+# size y line en bytes; replacement: "lru", "fifo" o "random"; write_policy: "write-back"
+# (con write-allocate) o "write-through" (sin write-allocate, con buffer de escritura);
+# hit_cycles: ciclos extra de un acierto en ese nivel (0 = dentro de la latencia de la etapa).
+CACHES_ENABLED = False
+MEMORY_LATENCY_CYCLES = 30
+L1I_CACHE = {"size": 4096, "assoc": 2, "line": 32, "replacement": "lru", "write_policy": "write-back", "hit_cycles": 0}
+L1D_CACHE = {"size": 4096, "assoc": 4, "line": 32, "replacement": "lru", "write_policy": "write-back", "hit_cycles": 0}
+L2_CACHE = {"size": 65536, "assoc": 8, "line": 64, "replacement": "lru", "write_policy": "write-back", "hit_cycles": 8}
+
+# Traza binaria (InOut/trace.py): registros por bloque escrito al archivo.
+TRACE_CHUNK_RECORDS = 8192
+
+# Modo funcional (core/functional.py): con BLOCK_CACHE_ENABLED, cada bloque básico se compila una
+# vez a una función de Python (core/block_cache.py) y se ejecuta completo en un solo despacho.
+# BLOCK_MAX_INSTRUCTIONS limita el largo de un bloque.
+BLOCK_CACHE_ENABLED = True
+BLOCK_MAX_INSTRUCTIONS = 64
+
 # Harris & Harris - Digital Design and Computer Architecture: RISC-V Edition
 # Computer Organization and Design: The Hardware/Software Interface (Patterson & Hennessy)
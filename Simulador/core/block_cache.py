@@ -0,0 +1,211 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+import re
+from core.decode_cache import DecodeCache
+from core.instruction import Opcode, ALU_EXPRESSIONS, BRANCH_EXPRESSIONS
+from config import BLOCK_MAX_INSTRUCTIONS
+
+# Nombres de operandos dentro de ALU_EXPRESSIONS / BRANCH_EXPRESSIONS
+_OPERAND = re.compile(r"\b(a|b|pc)\b")
+
+"""
+Class: Block
+Bloque básico traducido: secuencia de instrucciones sin saltos internos que termina en un salto
+(tipo B, jal o jalr), antes de otro líder o al llegar a BLOCK_MAX_INSTRUCTIONS.
+
+Attributes:
+- start: int - PC de entrada.
+- end: int - PC siguiente a la última instrucción (el bloque cubre [start, end)).
+- length: int - instrucciones del bloque.
+- run: función (registros, memoria de datos) -> PC siguiente; ejecuta el bloque completo.
+- source: str - código generado (para depuración).
+"""
+
+class Block:
+    __slots__ = ("start", "end", "length", "run", "source")
+
+    def __init__(self, start: int, end: int, length: int, run, source: str):
+        self.start = start
+        self.end = end
+        self.length = length
+        self.run = run
+        self.source = source
+
+
+"""
+Class: BlockCache
+Caché de bloques básicos para el modo funcional. Cada bloque se compila una sola vez a una función
+de Python generada a partir de las micro-ops de la caché de decodificación: los números de registro,
+inmediatos y PCs quedan como constantes y las operaciones de ALU_EXPRESSIONS se escriben en línea,
+así que el bloque completo se ejecuta en un solo despacho contra la lista de registros.
+
+discover() recorre el programa cargado y marca los líderes (PC 0, destinos de saltos y la
+instrucción siguiente a cada salto); los bloques que entran por otro PC (destinos de jalr o el PC
+de un handoff) se compilan la primera vez que se piden. Un líder obsoleto solo corta un bloque
+antes de tiempo, así que invalidate() borra bloques pero no recalcula los líderes.
+
+Attributes:
+- decode_cache: DecodeCache - micro-ops de origen.
+- max_instructions: int - largo máximo de un bloque.
+- blocks: dict - PC de entrada → Block.
+- leaders: set - PCs donde empieza un bloque básico.
+
+Methods:
+- discover: Encuentra los bloques básicos del programa y los compila.
+- get: Devuelve el bloque que entra por un PC, compilándolo si hace falta.
+- compile: Traduce el bloque que empieza en un PC.
+- invalidate: Borra los bloques que contienen un PC, o todos.
+
+Example:
+    blocks = BlockCache(decode_cache)
+    blocks.discover()
+    pc = blocks.get(0).run(registers.values, data_mem)
+"""
+
+class BlockCache:
+    def __init__(self, decode_cache: DecodeCache, max_instructions: int = None):
+        self.decode_cache = decode_cache
+        self.max_instructions = max_instructions or BLOCK_MAX_INSTRUCTIONS
+        self.blocks = {}
+        self.leaders = set()
+
+    def discover(self) -> int:
+        """
+        Function: discover
+        Pasada de descubrimiento sobre las micro-ops cargadas: calcula los líderes y compila el
+        bloque de cada uno.
+        Returns:
+        - int: cantidad de bloques compilados.
+        """
+        leaders = {0}
+        for index, uop in enumerate(self.decode_cache.entries):
+            if uop is None or not uop.predicted:
+                continue
+            pc = index << 2
+            leaders.add(pc + 4)
+            if uop.op != Opcode.JALR:
+                leaders.add(pc + uop.imm)
+        self.leaders = leaders
+        self.blocks.clear()
+        for pc in sorted(leaders):
+            self.get(pc)
+        return len(self.blocks)
+
+    def get(self, pc: int):
+        """
+        Function: get
+        Devuelve el bloque que entra por pc.
+        Returns:
+        - Block o None: None si no hay una instrucción decodificada en pc.
+        """
+        block = self.blocks.get(pc)
+        if block is None:
+            block = self.compile(pc)
+            if block is not None:
+                self.blocks[pc] = block
+        return block
+
+    def compile(self, start: int):
+        """
+        Function: compile
+        Genera y compila la función del bloque que empieza en start.
+        Params:
+        - start: int - PC de entrada.
+        Returns:
+        - Block o None: None si no hay una instrucción decodificada en start.
+        """
+        lookup = self.decode_cache.lookup
+        lines = []
+        pc = start
+        length = 0
+        next_pc = None
+        while length < self.max_instructions:
+            uop = lookup(pc)
+            if uop is None or (length and pc in self.leaders):
+                break
+            length += 1
+            next_pc = self._translate(uop, pc, lines)
+            pc += 4
+            if next_pc is not None:
+                break
+        if not length:
+            return None
+        if next_pc is None:
+            lines.append(f"return {pc}")
+
+        name = f"block_{start:x}"
+        source = f"def {name}(v, mem):\n" + "".join(f"    {line}\n" for line in lines)
+        namespace = {}
+        exec(compile(source, f"<bloque {start:#x}>", "exec"), namespace)
+        return Block(start, pc, length, namespace[name], source)
+
+    @staticmethod
+    def _translate(uop, pc: int, lines: list):
+        """
+        Function: _translate
+        Agrega a lines las sentencias de una micro-op con la semántica de ExecuteStage,
+        MemoryAccessStage y WriteBackStage.
+        Returns:
+        - True si la instrucción termina el bloque (ya agregó su return), None si no.
+        """
+        control = uop.signals
+        rs1 = f"v[{uop.rs1}]" if uop.rs1 else "0"
+        rs2 = f"v[{uop.rs2}]" if uop.rs2 else "0"
+        operands = {"a": rs1, "b": f"({uop.imm})" if control.ALUSrc else rs2, "pc": str(pc)}
+        dest = f"v[{uop.rd}] = " if control.RegWrite and uop.rd else ""
+
+        condition = BRANCH_EXPRESSIONS[uop.op]
+        if condition is not None:
+            condition = _OPERAND.sub(lambda m: {"a": rs1, "b": rs2}[m.group(1)], condition)
+            lines.append(f"return {pc + uop.imm} if {condition} else {pc + 4}")
+            return True
+        if uop.op == Opcode.JAL:
+            if dest:
+                lines.append(f"{dest}{pc + 4}")
+            lines.append(f"return {pc + uop.imm}")
+            return True
+        if uop.op == Opcode.JALR:
+            # El destino se calcula antes de escribir rd (rd puede ser igual a rs1)
+            lines.append(f"target = ({rs1} + ({uop.imm})) & ~1")
+            if dest:
+                lines.append(f"{dest}{pc + 4}")
+            lines.append("return target")
+            return True
+
+        result = _OPERAND.sub(lambda m: operands[m.group(1)], ALU_EXPRESSIONS[control.ALUOp])
+        if control.MemRead:
+            if control.MemWidth == 4:
+                lines.append(f"{dest}mem.load_word({result})")
+            else:
+                lines.append(f"{dest}mem.load({result}, {control.MemWidth}, {control.MemSigned})")
+        elif control.MemWrite:
+            if control.MemWidth == 4:
+                lines.append(f"mem.store_word({result}, {rs2})")
+            else:
+                lines.append(f"mem.store({result}, {rs2}, {control.MemWidth})")
+        elif dest:
+            lines.append(f"{dest}{result}")
+        return None
+
+    def invalidate(self, pc: int = None):
+        """
+        Function: invalidate
+        Borra los bloques que contienen pc (la instrucción cambió), o todos si pc es None.
+        """
+        if pc is None:
+            self.blocks.clear()
+            self.leaders = set()
+            return
+        if self.blocks:
+            stale = [start for start, block in self.blocks.items() if block.start <= pc < block.end]
+            for start in stale:
+                del self.blocks[start]
@@ -0,0 +1,171 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from core.instruction import Instruction, Opcode, OPCODE_NAMES, ALU_FUNCTIONS, BRANCH_CONDITIONS, OPCODE_ALU_OP
+from core.rv32i import NOP_WORD, from_memory_word, to_memory_word
+from components.control_unit import ControlUnit, ControlSignals, NOP_SIGNALS
+
+"""
+Class: MicroOp
+Instrucción pre-decodificada ("micro-op"): reúne los campos que las etapas ID y EX necesitan
+para no volver a decodificar ni generar señales de control en cada ciclo. Es lo que viaja por los
+latches del pipeline. No guarda la Instruction parseada (con su texto y operandos), sino la palabra
+RV32I: instruction la reconstruye solo cuando hace falta el texto (GUI, consola).
+
+Attributes:
+- word: int o Instruction - palabra RV32I de la instrucción (la Instruction si no tiene codificación).
+- pc: int - dirección de la instrucción.
+- opcode: str - mnemónico de la instrucción.
+- op: Opcode - opcode entero usado por las tablas de despacho de EX.
+- rd, rs1, rs2: int o None - números de registro destino y fuente (0-31).
+- imm: int o None - inmediato ya convertido a entero.
+- signals: ControlSignals - señales de control inmutables de la instrucción.
+- alu: función de ALU_FUNCTIONS según la señal ALUOp (ExecuteStage).
+- basic_alu: función de ALU_FUNCTIONS según el opcode (ExecuteStageBasic, sin unidad de control).
+- branch_condition: función de BRANCH_CONDITIONS o None si no es un salto condicional.
+- predicted: bool - True si la instrucción pasa por el predictor de saltos en ID (tipo B, jal y jalr).
+
+Methods:
+- instruction: Instruction reconstruida a partir de la palabra (propiedad).
+"""
+
+class MicroOp:
+    __slots__ = ("word", "pc", "opcode", "op", "rd", "rs1", "rs2", "imm", "signals",
+                 "alu", "basic_alu", "branch_condition", "predicted")
+
+    def __init__(self, instr: Instruction, signals: ControlSignals, word: int = None):
+        self.op = instr.op
+        if self.op is None:
+            raise ValueError(f"Operación no soportada: {instr.opcode}")
+        self.word = word if word is not None else to_memory_word(instr)
+        self.pc = instr.address
+        self.opcode = OPCODE_NAMES[self.op]  # Cadena compartida, no la del texto parseado
+        self.rd = instr.rd
+        self.rs1 = instr.rs1
+        self.rs2 = instr.rs2
+        self.imm = instr.imm
+        self.signals = signals
+        self.alu = ALU_FUNCTIONS[signals.ALUOp]
+        self.basic_alu = ALU_FUNCTIONS[OPCODE_ALU_OP[self.op]]
+        self.branch_condition = BRANCH_CONDITIONS[self.op]
+        self.predicted = self.branch_condition is not None or self.op in (Opcode.JAL, Opcode.JALR)
+
+    @property
+    def instruction(self) -> Instruction:
+        return from_memory_word(self.word, self.pc)
+
+    def __str__(self):
+        if self.op == Opcode.NOP:
+            return "nop"
+        return str(self.instruction)
+
+
+NOP_UOP = MicroOp(Instruction("nop", 0), NOP_SIGNALS, NOP_WORD)
+
+"""
+Class: DecodeCache
+Caché de instrucciones pre-decodificadas indexada por PC/4. Se llena al cargar el programa
+(o la primera vez que se busca un PC) y las etapas IF, ID y EX leen de ella.
+
+Attributes:
+- control_unit: ControlUnit - genera las señales de control al llenar una entrada.
+- entries: list - micro-ops indexadas por PC // 4 (None si la entrada no existe).
+
+Constructor:
+- __init__: Inicializa la caché vacía.
+
+Methods:
+- fill: Decodifica una instrucción y la guarda en la entrada de su PC.
+- fill_word: Igual que fill, a partir de una palabra RV32I.
+- lookup: Devuelve la micro-op de un PC o None.
+- invalidate: Borra una entrada o toda la caché.
+
+Example:
+    cache = DecodeCache()
+    cache.fill(0, Instruction("addi x1, x0, 5", 0))
+    uop = cache.lookup(0)
+"""
+
+class DecodeCache:
+    def __init__(self, control_unit: ControlUnit = None):
+        """
+        Function: __init__
+        Inicializa una caché vacía.
+        Params:
+        - control_unit: ControlUnit - unidad de control usada para generar las señales.
+        """
+        self.control_unit = control_unit if control_unit is not None else ControlUnit()
+        self.entries = []
+
+    def fill(self, pc: int, instr: Instruction, word: int = None) -> MicroOp:
+        """
+        Function: fill
+        Decodifica la instrucción y la guarda en la entrada correspondiente a su PC.
+        Params:
+        - pc: int - dirección de la instrucción (alineada a 4).
+        - instr: Instruction - instrucción a pre-decodificar.
+        - word: int, Instruction o None - su valor en memoria (to_memory_word), si ya se calculó.
+        Returns:
+        - MicroOp: micro-op almacenada.
+        Restriction:
+        Lanza ValueError si el mnemónico no es soportado.
+        Example:
+            uop = cache.fill(8, instr)
+        """
+        if instr.opcode == "nop":
+            uop = NOP_UOP
+        else:
+            uop = MicroOp(instr, self.control_unit.generate_signals(instr.opcode), word)
+        index = pc >> 2
+        if index >= len(self.entries):
+            self.entries.extend([None] * (index + 1 - len(self.entries)))
+        self.entries[index] = uop
+        return uop
+
+    def fill_word(self, pc: int, word: int) -> MicroOp:
+        """
+        Function: fill_word
+        Decodifica una palabra de la memoria de instrucciones (o toma la Instruction sin codificación
+        guardada en ella) y guarda su micro-op.
+        Restriction:
+        Lanza ValueError si la palabra no es decodificable (fin del programa o datos).
+        Example:
+            uop = cache.fill_word(pc, instr_mem.load_word(pc))
+        """
+        return self.fill(pc, from_memory_word(word, pc), word)
+
+    def lookup(self, pc: int):
+        """
+        Function: lookup
+        Devuelve la micro-op almacenada para un PC.
+        Params:
+        - pc: int - dirección de la instrucción.
+        Returns:
+        - MicroOp o None: None si no hay entrada para ese PC.
+        """
+        index = pc >> 2
+        if 0 <= index < len(self.entries):
+            return self.entries[index]
+        return None
+
+    def invalidate(self, pc: int = None):
+        """
+        Function: invalidate
+        Borra la entrada de un PC, o toda la caché si pc es None.
+        Params:
+        - pc: int o None - dirección a invalidar.
+        """
+        if pc is None:
+            self.entries = []
+            return
+        index = pc >> 2
+        if 0 <= index < len(self.entries):
+            self.entries[index] = None
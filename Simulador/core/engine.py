@@ -0,0 +1,464 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+import time
+from core.pipeline import Pipeline
+from core.decode_cache import DecodeCache
+from core.instruction import Instruction
+from core.rv32i import store_instruction, load_words
+from core.stage_if import InstructionFetch
+from core.stage_id import InstructionDecode
+from core.stage_id_basic import InstructionDecodeBasic
+from core.stage_ex import ExecuteStage
+from core.stage_ex_basic import ExecuteStageBasic
+from core.stage_mem import MemoryAccessStage
+from core.stage_wb import WriteBackStage
+from core.policies import NoHazardDetection, NoForwarding, RedirectOnTakenBranch
+from core.history import CycleHistory
+from core.events import EventBus
+from core.profiler import StageProfiler
+from InOut.trace import TraceRecorder
+from InOut.assembler import Assembler
+from InOut.program_loader import ProgramLoader
+from components.register_file import RegisterFile
+from components.memory import InstructionMemory, create_data_memory
+from components.control_unit import ControlUnit
+from components.clock import SimulatedClock
+from components.cache import create_cache_hierarchy
+from InOut.metrics import Metrics
+from config import INSTR_MEM_WORDS
+
+"""
+Class: PipelineEngine
+Motor único del pipeline de 5 etapas. El ciclo (control de saltos → stall o fetch → ID → EX → MEM → WB)
+se implementa una sola vez; lo que distingue a cada procesador se inyecta como estrategias:
+
+- hazard_policy: decide si se inserta un stall (NoHazardDetection, HazardUnitPolicy).
+- forwarding_policy: caminos de bypass hacia EX (NoForwarding, ForwardingUnit). La HazardUnit se
+  configura según esta política: con forwarding solo se detiene en riesgos load-use. El forwarding
+  no sustituye valores (cada instrucción completa WB al pasar por EX); solo cambia stalls y reportes.
+- branch_predictor: predictor usado en ID/EX, o None para las etapas básicas sin predicción.
+- flush_policy: redirección de PC y flush al inicio del ciclo (RedirectOnTakenBranch, FlushOnMispredict).
+
+Attributes:
+- instr_mem, data_mem, registers, pipeline, clock, decode_cache, control_unit: estado del procesador.
+- if_stage, id_stage, ex_stage, mem_stage, wb_stage: etapas del pipeline.
+- hazard_unit, branch_predictor: componentes expuestos por las estrategias (o None).
+- track_branches: bool - registrar aciertos del predictor en las métricas.
+- metrics: Metrics - métricas de la ejecución.
+- last_id_ex, last_ex_mem: latches ID/EX y EX/MEM del ciclo anterior.
+- history: CycleHistory o None - historial para ejecución inversa (ver enable_history).
+- trace: TraceRecorder o None - traza binaria por ciclo (ver start_trace).
+- events: EventBus - eventos del pipeline (stall, flush, forward, mispredict, retire, cycle, finished).
+- caches: CacheHierarchy o None - cachés L1I/L1D/L2 (components/cache.py); sus fallos congelan el
+  pipeline memory_stall ciclos.
+- profiler: StageProfiler o None - tiempo del host por etapa (ver enable_profiling).
+
+Methods:
+- load_program, load_program_file, load_binary_file, preload_registers, preload_data_memory: cargan el
+  estado inicial.
+- run: Ejecuta el programa completo (modos "full", "step" y "delay").
+- run_one_cycle: Avanza un ciclo (usado por la GUI); retorna True al terminar.
+- enable_history, step_back: Ejecución inversa con checkpoints y deltas por ciclo.
+- capture_state, restore_state: Copia y restaura el estado completo salvo la memoria de datos.
+- start_trace, stop_trace: Graban una traza binaria ciclo a ciclo (InOut/trace.py).
+- enable_profiling, disable_profiling: Miden el tiempo del host por etapa (core/profiler.py).
+- _emit_cycle_events: Publica los eventos del ciclo (solo si hay suscriptores).
+- get_metrics: Devuelve las métricas.
+
+Example:
+    cpu = PipelineEngine(name="Mi procesador", hazard_policy=HazardUnitPolicy())
+    cpu.load_program(["addi x1, x0, 5"])
+    cpu.run()
+"""
+
+class PipelineEngine:
+    def __init__(self, name: str = "Procesador", hazard_policy=None, forwarding_policy=None,
+                 branch_predictor=None, flush_policy=None, track_branches: bool = False,
+                 real_time: bool = None, instr_mem_words: int = None, data_mem_words: int = None,
+                 sparse_memory: bool = None, caches: bool = None):
+        """
+        Function: __init__
+        Construye el procesador a partir de sus estrategias.
+        Params:
+        - name: str - nombre usado en métricas y mensajes.
+        - hazard_policy, forwarding_policy, flush_policy: estrategias (por defecto: sin riesgos,
+          sin forwarding y redirección simple en saltos tomados).
+        - branch_predictor: predictor de saltos, o None para usar las etapas ID/EX básicas.
+        - track_branches: bool - contar predicciones correctas/incorrectas en las métricas.
+        - real_time: bool - ritmo en tiempo real del reloj simulado.
+        - instr_mem_words, data_mem_words, sparse_memory: configuración de memorias (ver config.py).
+        - caches: bool - modelar la jerarquía de cachés (None = CACHES_ENABLED de config.py).
+        """
+        self.name = name
+        self.hazard_policy = hazard_policy if hazard_policy is not None else NoHazardDetection()
+        self.forwarding_policy = forwarding_policy if forwarding_policy is not None else NoForwarding()
+        self.flush_policy = flush_policy if flush_policy is not None else RedirectOnTakenBranch()
+        self.branch_predictor = branch_predictor
+        self.hazard_unit = self.hazard_policy.hazard_unit
+        if self.hazard_unit is not None:
+            self.hazard_unit.forwarding = self.forwarding_policy.enabled
+        self.track_branches = track_branches
+
+        self.instr_mem = InstructionMemory(size_in_words=instr_mem_words or INSTR_MEM_WORDS)
+        self.data_mem = create_data_memory(data_mem_words, sparse_memory)
+        self.pipeline = Pipeline()
+        self.clock = SimulatedClock(real_time)
+        self.registers = RegisterFile()
+        self.control_unit = ControlUnit()
+        self.decode_cache = DecodeCache(self.control_unit)  # micro-ops pre-decodificadas por PC
+        self.instr_mem.on_write = self.decode_cache.invalidate  # Escribir una instrucción invalida su micro-op
+
+        self.if_stage = InstructionFetch(self.instr_mem, latency=None, clock=self.clock, decode_cache=self.decode_cache)
+        if branch_predictor is None:
+            self.id_stage = InstructionDecodeBasic(self.registers, latency=None, clock=self.clock)
+            self.ex_stage = ExecuteStageBasic(latency=None, clock=self.clock)
+        else:
+            self.id_stage = InstructionDecode(self.registers, branch_predictor, self.control_unit, latency=None, clock=self.clock)
+            self.ex_stage = ExecuteStage(branch_predictor, latency=None, clock=self.clock)
+        self.mem_stage = MemoryAccessStage(self.data_mem, latency=None, clock=self.clock)
+        self.wb_stage = WriteBackStage(self.registers, latency=None, clock=self.clock)
+
+        self.metrics = Metrics(name=name)
+        self.caches = create_cache_hierarchy(caches)
+        self.memory_stall = 0
+        self.memory_stall_latency = 0.0
+        if self.caches is not None:
+            self.if_stage.cache = self.caches.l1i
+            self.mem_stage.cache = self.caches.l1d
+            self.metrics.caches = self.caches
+        self.last_id_ex = None
+        self.last_ex_mem = None
+        self._step_pipeline_initialized = False
+        self.history = None
+        self.trace = None
+        self.profiler = None
+        self.events = EventBus()
+
+    def load_program(self, instr_list: list[str]):
+        self.instr_mem.ensure_words(len(instr_list))  # La memoria crece si el programa no cabe
+        for i, line in enumerate(instr_list):
+            # Código máquina RV32I (la Instruction si su inmediato no cabe en el formato)
+            store_instruction(Instruction(line, i * 4), self.instr_mem, self.decode_cache)
+
+    def load_program_file(self, path: str) -> int:
+        """
+        Function: load_program_file
+        Ensambla un archivo .s/.asm directamente en la memoria de instrucciones (InOut/assembler.py),
+        sin pasar por la lista de textos de load_program.
+        Returns:
+        - int: cantidad de instrucciones cargadas.
+        """
+        return Assembler().assemble(path, self.instr_mem, self.decode_cache)
+
+    def load_binary_file(self, path: str) -> int:
+        """
+        Function: load_binary_file
+        Carga una imagen .bin de código máquina RV32I (palabras little-endian desde la dirección 0).
+        Returns:
+        - int: cantidad de palabras cargadas.
+        """
+        return load_words(ProgramLoader.load_binary(path), self.instr_mem, self.decode_cache)
+
+    def preload_registers(self, values: dict):
+        for reg, val in values.items():
+            self.registers.write(reg, val)
+
+    def preload_data_memory(self, values: dict):
+        for addr, val in values.items():
+            self.data_mem.store_word(addr, val)
+
+    def _start(self):
+        """
+        Function: _start
+        Prepara el pipeline y los latches del ciclo anterior antes de ejecutar.
+        """
+        self.pipeline.init_pipeline()
+        self.last_id_ex = None
+        self.last_ex_mem = None
+
+    def _cycle(self):
+        """
+        Function: _cycle
+        Ejecuta un ciclo completo del pipeline. Es el único lazo interno del simulador:
+        cualquier optimización aquí aplica a todas las variantes de procesador.
+        Los eventos del ciclo se publican al final y solo si el bus tiene suscriptores.
+        """
+        pipeline = self.pipeline
+        if self.history is not None:
+            self.history.begin_cycle(self)
+        if self.memory_stall:
+            self._memory_stall_cycle()
+            return
+        self.metrics.tick()
+
+        stall = self.hazard_policy.must_stall(pipeline)
+
+        # --- CONTROL DE SALTOS Y FLUSH (según el resultado del ciclo anterior) ---
+        flushed = self.flush_policy.apply(self.last_id_ex, self.last_ex_mem, self.if_stage, pipeline)
+
+        forwarded = 0
+        if stall:
+            # La instrucción de IF/ID ya se ejecutó al entrar: este ciclo solo avanza la burbuja
+            pipeline.insert_stall()
+            id_ex = self.id_stage.decode(pipeline.ID_EX)
+        else:
+            fetched = self.if_stage.fetch()
+            pipeline.step(fetched.instr, fetched.pc)
+            id_ex = self.id_stage.decode(pipeline.IF_ID)
+            if self.forwarding_policy.enabled:
+                forwarded = self.forwarding_policy.forward(id_ex, pipeline)
+        ex_mem = self.ex_stage.execute(id_ex)
+        self.last_id_ex = id_ex  # Guardar para el siguiente ciclo
+        self.last_ex_mem = ex_mem
+
+        if self.track_branches and id_ex.uop.predicted:
+            self.metrics.track_branch(id_ex.predicted_taken, ex_mem.branch_taken, ex_mem.flush_required)
+
+        mem_wb = self.mem_stage.access(ex_mem)
+        self.wb_stage.write_back(mem_wb)
+
+        self.metrics.track_writeback(mem_wb.instr)
+        self.metrics.track_simulated_time(self.clock.end_cycle())
+        if self.caches is not None:
+            self._collect_miss_cycles()
+        if self.events.active:
+            self._emit_cycle_events(stall, flushed, forwarded, ex_mem, mem_wb)
+
+    def _collect_miss_cycles(self):
+        """
+        Function: _collect_miss_cycles
+        Convierte los ciclos de fallo de caché de IF y MEM de este ciclo en ciclos de pipeline congelado.
+        """
+        if_stage = self.if_stage
+        mem_stage = self.mem_stage
+        penalty = if_stage.miss_cycles + mem_stage.miss_cycles
+        if penalty:
+            # Cada ciclo congelado dura lo que la etapa más lenta que esperaba a la memoria
+            latency = 0.0
+            if if_stage.miss_cycles:
+                latency = if_stage.latency
+            if mem_stage.miss_cycles and mem_stage.latency > latency:
+                latency = mem_stage.latency
+            self.memory_stall += penalty
+            self.memory_stall_latency = latency
+            if_stage.miss_cycles = 0
+            mem_stage.miss_cycles = 0
+
+    def _memory_stall_cycle(self):
+        """
+        Function: _memory_stall_cycle
+        Ciclo con el pipeline congelado esperando a la jerarquía de memoria: solo avanzan el
+        conteo de ciclos y el reloj simulado (no se publican eventos).
+        """
+        self.memory_stall -= 1
+        metrics = self.metrics
+        metrics.tick()
+        metrics.ciclos_stall_memoria += 1
+        self.clock.stage(self.memory_stall_latency)
+        metrics.track_simulated_time(self.clock.end_cycle())
+
+    def _emit_cycle_events(self, stall: bool, flushed: bool, forwarded: int, ex_mem, mem_wb):
+        """
+        Function: _emit_cycle_events
+        Publica los eventos del ciclo que acaba de terminar, en el orden en que ocurrieron.
+        """
+        events = self.events
+        if flushed:
+            events.emit("flush", self)
+        if stall:
+            events.emit("stall", self)
+        if forwarded:
+            events.emit("forward", self, forwarded)
+        if ex_mem.flush_required:
+            events.emit("mispredict", self, ex_mem.pc)
+        if mem_wb.instr.opcode != "nop":
+            events.emit("retire", self, mem_wb.instr)
+        events.emit("cycle", self, stall, flushed, forwarded)
+
+    def run(self, modo="full", delay_seg=1.0):
+        self.metrics.start_timer()
+        self._start()
+
+        while not self.pipeline.is_done():
+            self._cycle()
+
+            # --- Modo de ejecución ---
+            if modo == "step":
+                input("Presione Enter para continuar al siguiente ciclo...")
+            elif modo == "delay":
+                time.sleep(delay_seg)
+            # modo "full" no hace nada extra
+
+        self.metrics.stop_timer()
+        self.events.emit("finished", self)
+
+    def enable_history(self, checkpoint_interval: int = None, budget_cycles: int = None) -> CycleHistory:
+        """
+        Function: enable_history
+        Activa el historial de ejecución inversa a partir del próximo ciclo.
+        Params:
+        - checkpoint_interval: int - ciclos entre checkpoints (None = config.py).
+        - budget_cycles: int - ciclos de historial conservados (None = config.py).
+        Returns:
+        - CycleHistory: historial creado.
+        """
+        self.history = CycleHistory(checkpoint_interval, budget_cycles)
+        return self.history
+
+    def step_back(self, cycles: int = 1) -> int:
+        """
+        Function: step_back
+        Retrocede la simulación 'cycles' ciclos (requiere enable_history).
+        Params:
+        - cycles: int - ciclos a retroceder.
+        Returns:
+        - int: ciclo en el que quedó el procesador.
+        Example:
+            cpu.step_back()  # deshace el último ciclo
+        """
+        if self.history is None:
+            raise RuntimeError("El historial de ejecución inversa no está activado (enable_history)")
+        return self.history.rewind(self, self.metrics.ciclos_totales - cycles)
+
+    def capture_state(self) -> dict:
+        """
+        Function: capture_state
+        Copia el estado del procesador salvo la memoria de datos (la restaura CycleHistory con deltas).
+        Returns:
+        - dict: estado restaurable con restore_state().
+        """
+        pipeline = self.pipeline
+        return {
+            "registers": self.registers.snapshot(),
+            "pc": self.if_stage.pc,
+            "halted": self.if_stage.halted,
+            "latches": tuple(latch.snapshot() for latch in self._latches()),
+            "pipeline": (pipeline.completed, pipeline.cycles),
+            "last": (self.last_id_ex is not None, self.last_ex_mem is not None),
+            "predictor": self.branch_predictor.snapshot() if self.branch_predictor is not None else None,
+            "metrics": self.metrics.snapshot(),
+            "clock": self.clock.snapshot(),
+            "initialized": self._step_pipeline_initialized,
+            "memory_stall": (self.memory_stall, self.memory_stall_latency),
+            "caches": self.caches.snapshot() if self.caches is not None else None,
+        }
+
+    def restore_state(self, state: dict):
+        """
+        Function: restore_state
+        Restaura un estado tomado con capture_state().
+        Params:
+        - state: dict - estado del procesador.
+        """
+        self.registers.restore(state["registers"])
+        self.if_stage.pc = state["pc"]
+        self.if_stage.halted = state["halted"]
+        for latch, values in zip(self._latches(), state["latches"]):
+            latch.restore(values)
+        self.pipeline.completed, self.pipeline.cycles = state["pipeline"]
+        has_id_ex, has_ex_mem = state["last"]
+        self.last_id_ex = self.id_stage.out if has_id_ex else None
+        self.last_ex_mem = self.ex_stage.out if has_ex_mem else None
+        if self.branch_predictor is not None:
+            self.branch_predictor.restore(state["predictor"])
+        self.metrics.restore(state["metrics"])
+        self.clock.restore(state["clock"])
+        self._step_pipeline_initialized = state["initialized"]
+        self.memory_stall, self.memory_stall_latency = state["memory_stall"]
+        if self.caches is not None:
+            self.caches.restore(state["caches"])
+
+    def start_trace(self, path: str, chunk_records: int = None) -> TraceRecorder:
+        """
+        Function: start_trace
+        Empieza a grabar una traza binaria por ciclo en path (ver InOut/trace.py).
+        Params:
+        - path: str - archivo de salida (se sobrescribe).
+        - chunk_records: int - registros por bloque escrito (None = config.py).
+        Returns:
+        - TraceRecorder: grabador activo.
+        """
+        self.stop_trace()
+        self.trace = TraceRecorder(path, chunk_records)
+        self.events.subscribe("cycle", self.trace.record_cycle)
+        return self.trace
+
+    def stop_trace(self):
+        """
+        Function: stop_trace
+        Termina la traza activa (si hay) y cierra su archivo.
+        """
+        if self.trace is not None:
+            self.events.unsubscribe("cycle", self.trace.record_cycle)
+            self.trace.close()
+            self.trace = None
+
+    def enable_profiling(self, stages: bool = True, pstats: bool = False) -> StageProfiler:
+        """
+        Function: enable_profiling
+        Empieza a medir el tiempo del host por etapa; el resultado queda en las métricas ("perfil").
+        Params:
+        - stages: bool - medir el tiempo por etapa, riesgos y métricas.
+        - pstats: bool - grabar un perfil de cProfile de la ejecución (ver disable_profiling).
+        Returns:
+        - StageProfiler: perfilador activo.
+        """
+        self.disable_profiling()
+        self.profiler = StageProfiler(stages, pstats)
+        self.profiler.attach(self)
+        if stages:
+            self.metrics.profile = self.profiler
+        return self.profiler
+
+    def disable_profiling(self, pstats_path: str = None):
+        """
+        Function: disable_profiling
+        Deja de medir (los tiempos acumulados siguen en las métricas) y escribe el perfil de cProfile.
+        Params:
+        - pstats_path: str o None - archivo .pstats de salida (requiere enable_profiling(pstats=True)).
+        """
+        if self.profiler is not None:
+            self.profiler.detach()
+            if pstats_path:
+                self.profiler.dump_pstats(pstats_path)
+            self.profiler = None
+
+    def _latches(self) -> tuple:
+        """Latches del pipeline y de salida de cada etapa (reutilizados en sitio)."""
+        pipeline = self.pipeline
+        return (pipeline.IF_ID, pipeline.ID_EX, pipeline.EX_MEM, pipeline.MEM_WB,
+                self.if_stage.out, self.id_stage.out, self.ex_stage.out, self.mem_stage.out)
+
+    def get_metrics(self):
+        return self.metrics
+
+    def run_one_cycle(self):
+        """Avanza un ciclo del pipeline. Retorna True si terminó, False si no."""
+        if not self._step_pipeline_initialized:
+            self.metrics.start_timer()
+            self._step_start_time = time.perf_counter()
+            self._start()
+            self._step_pipeline_initialized = True
+
+        if self.pipeline.is_done():
+            self.metrics.stop_timer()
+            return True
+
+        self._cycle()
+
+        # Actualiza el tiempo de ejecución en cada ciclo
+        self.metrics.elapsed_time = time.perf_counter() - self._step_start_time
+
+        if self.pipeline.is_done():
+            self.metrics.stop_timer()
+            return True
+        return False
@@ -0,0 +1,187 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+"""
+Module: events
+Bus de eventos del pipeline. Reemplaza los print() del lazo interno: el motor solo publica eventos
+si alguien está suscrito, así que sin suscriptores el costo es revisar EventBus.active una vez por ciclo.
+
+Eventos (los callbacks reciben siempre el procesador como primer argumento):
+- "stall": (cpu) - se insertó una burbuja por un riesgo load-use.
+- "flush": (cpu) - la política de saltos vació IF/ID e ID/EX.
+- "forward": (cpu, mask) - operandos de EX que llegarían por bypass (FLAG_FORWARD_A / FLAG_FORWARD_B);
+  es solo un reporte, los valores ya están en el banco de registros.
+- "mispredict": (cpu, pc) - EX detectó una predicción de salto incorrecta.
+- "retire": (cpu, instr) - una instrucción (MicroOp, no NOP) llegó a WB; str(instr) la desensambla.
+- "cycle": (cpu, stalled, flushed, forwarded) - fin de ciclo (lo usa la traza binaria).
+- "finished": (cpu) - PipelineEngine.run terminó el programa.
+
+Cada evento tiene un nivel (EVENT_LEVELS) que usan los suscriptores con filtro, como ConsoleLogger.
+
+Classes:
+- EventBus: registro de suscriptores y publicación de eventos.
+- ConsoleLogger: suscriptor que imprime los eventos con nivel suficiente.
+
+Example:
+    logger = ConsoleLogger(level=DEBUG)
+    logger.attach(cpu)
+    cpu.events.subscribe("retire", lambda cpu, instr: contador.append(instr))
+"""
+
+TRACE = 5
+DEBUG = 10
+INFO = 20
+
+EVENT_LEVELS = {
+    "cycle": TRACE,
+    "retire": DEBUG,
+    "forward": DEBUG,
+    "flush": DEBUG,
+    "stall": INFO,
+    "mispredict": INFO,
+    "finished": INFO,
+}
+
+
+"""
+Class: EventBus
+Suscriptores por nombre de evento. 'active' es True mientras haya al menos un suscriptor y es lo
+único que revisa el motor en cada ciclo.
+
+Attributes:
+- listeners: dict - evento → lista de callbacks.
+- active: bool - hay algún suscriptor.
+
+Methods:
+- subscribe / unsubscribe: Agregan o quitan un callback.
+- has_listeners: Indica si un evento tiene suscriptores.
+- emit: Llama a los callbacks de un evento.
+- clear: Quita todos los suscriptores.
+"""
+
+class EventBus:
+    def __init__(self):
+        self.listeners = {}
+        self.active = False
+
+    def subscribe(self, event: str, callback):
+        """
+        Function: subscribe
+        Registra callback para el evento indicado.
+        Params:
+        - event: str - nombre del evento (ver EVENT_LEVELS).
+        - callback: callable - recibe (cpu, *datos del evento).
+        Returns:
+        - callable: el mismo callback (para usarlo luego en unsubscribe).
+        Example:
+            bus.subscribe("stall", lambda cpu: print("stall"))
+        """
+        if event not in EVENT_LEVELS:
+            raise ValueError(f"Evento desconocido: {event}")
+        self.listeners.setdefault(event, []).append(callback)
+        self.active = True
+        return callback
+
+    def unsubscribe(self, event: str, callback):
+        """
+        Function: unsubscribe
+        Quita callback del evento (si estaba suscrito).
+        """
+        callbacks = self.listeners.get(event)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self.listeners[event]
+        self.active = bool(self.listeners)
+
+    def has_listeners(self, event: str) -> bool:
+        return event in self.listeners
+
+    def emit(self, event: str, *args):
+        """
+        Function: emit
+        Llama a los suscriptores del evento con los argumentos dados.
+        """
+        callbacks = self.listeners.get(event)
+        if callbacks:
+            for callback in tuple(callbacks):
+                callback(*args)
+
+    def clear(self):
+        self.listeners = {}
+        self.active = False
+
+
+"""
+Class: ConsoleLogger
+Imprime por consola los eventos del pipeline con nivel >= level. Con el nivel por defecto (INFO)
+reproduce la salida original: stalls, predicciones incorrectas y el resumen final de métricas.
+
+Attributes:
+- level: int - nivel mínimo a imprimir (TRACE, DEBUG o INFO).
+
+Methods:
+- attach / detach: Suscriben o quitan el logger del bus de un procesador.
+- log: Imprime un mensaje si su nivel alcanza el mínimo.
+
+Example:
+    ConsoleLogger().attach(cpu)
+    cpu.run()
+"""
+
+class ConsoleLogger:
+    def __init__(self, level: int = INFO):
+        self.level = level
+        self._handlers = {
+            "stall": self._on_stall,
+            "flush": self._on_flush,
+            "forward": self._on_forward,
+            "mispredict": self._on_mispredict,
+            "retire": self._on_retire,
+            "finished": self._on_finished,
+        }
+
+    def attach(self, cpu):
+        """
+        Function: attach
+        Suscribe el logger a los eventos de cpu cuyo nivel alcanza el mínimo.
+        """
+        for event, handler in self._handlers.items():
+            if EVENT_LEVELS[event] >= self.level:
+                cpu.events.subscribe(event, handler)
+        return self
+
+    def detach(self, cpu):
+        for event, handler in self._handlers.items():
+            cpu.events.unsubscribe(event, handler)
+
+    def log(self, level: int, message: str):
+        if level >= self.level:
+            print(message)
+
+    def _on_stall(self, cpu):
+        print("Hazard detectado → STALL aplicado (load-use)")
+
+    def _on_flush(self, cpu):
+        print(f"Flush del pipeline en el ciclo {cpu.metrics.ciclos_totales}")
+
+    def _on_forward(self, cpu, mask):
+        print(f"Forwarding en EX: bypass reportado (máscara={mask:#04x})")
+
+    def _on_mispredict(self, cpu, pc):
+        print(f"Predicción incorrecta @ PC={pc} → FLUSH requerido")
+
+    def _on_retire(self, cpu, instr):
+        print(f"Retirada: {instr}")
+
+    def _on_finished(self, cpu):
+        print(f"\nPrograma finalizado ({cpu.name}). Pipeline vacío.")
+        cpu.metrics.display()
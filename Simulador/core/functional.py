@@ -0,0 +1,286 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from core.decode_cache import DecodeCache
+from core.block_cache import BlockCache
+from core.instruction import Instruction, Opcode
+from core.rv32i import store_instruction, load_words
+from components.register_file import RegisterFile
+from components.memory import InstructionMemory, create_data_memory
+from components.control_unit import ControlUnit
+from InOut.assembler import Assembler
+from InOut.program_loader import ProgramLoader
+from config import INSTR_MEM_WORDS, BLOCK_CACHE_ENABLED
+
+"""
+Class: FunctionalSimulator
+Modo funcional (solo ISA): retira una instrucción por paso, sin latches, etapas, reloj ni métricas
+de pipeline. Usa las mismas micro-ops de la caché de decodificación que ID/EX (tablas ALU_FUNCTIONS
+y BRANCH_CONDITIONS, señales de control) y la misma semántica que ExecuteStage, MemoryAccessStage
+y WriteBackStage, así que el estado arquitectónico final coincide con el de cualquier procesador.
+
+Sirve para adelantar rápido hasta una región de interés y entregar el estado (PC, registros y
+memorias) a un procesador con pipeline con handoff(). El estado microarquitectónico (predictor,
+cachés, latches) del procesador queda frío.
+
+Con la caché de bloques (core/block_cache.py) los bloques básicos se ejecutan completos en un solo
+despacho; el intérprete de una instrucción por paso solo atiende PCs sin bloque y los finales de
+run() que no alcanzan para un bloque entero. Escribir la memoria de instrucciones invalida las
+entradas afectadas de ambas cachés.
+
+Attributes:
+- instr_mem, data_mem, registers, decode_cache: estado arquitectónico.
+- block_cache: BlockCache o None - bloques básicos traducidos.
+- pc: int - dirección de la siguiente instrucción.
+- halted: bool - True al llegar al final del programa.
+- instructions: int - instrucciones retiradas.
+
+Methods:
+- load_program, load_program_file, load_binary_file, preload_registers, preload_data_memory: cargan el
+  estado inicial (como PipelineEngine).
+- step: Retira una instrucción.
+- run: Retira instrucciones hasta terminar o llegar a un límite.
+- handoff: Copia el estado arquitectónico a un procesador con pipeline.
+
+Example:
+    fast = FunctionalSimulator()
+    fast.load_program(lineas)
+    fast.run(max_instructions=100000)
+    cpu = Processor()
+    fast.handoff(cpu)
+    cpu.run()
+"""
+
+class FunctionalSimulator:
+    def __init__(self, instr_mem_words: int = None, data_mem_words: int = None, sparse_memory: bool = None,
+                 block_cache: bool = None):
+        """
+        Function: __init__
+        Crea memorias y registros con la misma configuración que PipelineEngine.
+        Params:
+        - instr_mem_words, data_mem_words, sparse_memory: configuración de memorias (ver config.py).
+        - block_cache: bool - ejecutar por bloques básicos (None = BLOCK_CACHE_ENABLED).
+        """
+        self.instr_mem = InstructionMemory(size_in_words=instr_mem_words or INSTR_MEM_WORDS)
+        self.data_mem = create_data_memory(data_mem_words, sparse_memory)
+        self.registers = RegisterFile()
+        self.decode_cache = DecodeCache(ControlUnit())
+        if block_cache is None:
+            block_cache = BLOCK_CACHE_ENABLED
+        self.block_cache = BlockCache(self.decode_cache) if block_cache else None
+        self.instr_mem.on_write = self._instruction_written
+        self.pc = 0
+        self.halted = False
+        self.instructions = 0
+
+    def load_program(self, instr_list: list[str]):
+        self.instr_mem.ensure_words(len(instr_list))
+        for i, line in enumerate(instr_list):
+            store_instruction(Instruction(line, i * 4), self.instr_mem, self.decode_cache)
+        if self.block_cache is not None:
+            self.block_cache.discover()
+
+    def load_program_file(self, path: str) -> int:
+        """
+        Function: load_program_file
+        Ensambla un archivo .s/.asm directamente en la memoria de instrucciones (como PipelineEngine).
+        Returns:
+        - int: cantidad de instrucciones cargadas.
+        """
+        count = Assembler().assemble(path, self.instr_mem, self.decode_cache)
+        if self.block_cache is not None:
+            self.block_cache.discover()
+        return count
+
+    def load_binary_file(self, path: str) -> int:
+        """
+        Function: load_binary_file
+        Carga una imagen .bin de código máquina RV32I (como PipelineEngine).
+        Returns:
+        - int: cantidad de palabras cargadas.
+        """
+        count = load_words(ProgramLoader.load_binary(path), self.instr_mem, self.decode_cache)
+        if self.block_cache is not None:
+            self.block_cache.discover()
+        return count
+
+    def _instruction_written(self, address: int):
+        """
+        Function: _instruction_written
+        Invalida la micro-op y los bloques de una dirección escrita (todas si address es None).
+        """
+        self.decode_cache.invalidate(address)
+        if self.block_cache is not None:
+            self.block_cache.invalidate(address)
+
+    def preload_registers(self, values: dict):
+        for reg, val in values.items():
+            self.registers.write(reg, val)
+
+    def preload_data_memory(self, values: dict):
+        for addr, val in values.items():
+            self.data_mem.store_word(addr, val)
+
+    def _fetch_uop(self, pc: int):
+        """
+        Function: _fetch_uop
+        Busca la micro-op de un PC que no está en la caché de decodificación, igual que
+        InstructionFetch: si la memoria no tiene una instrucción válida, el programa terminó.
+        Returns:
+        - MicroOp o None: None al llegar al final del programa.
+        """
+        try:
+            return self.decode_cache.fill_word(pc, self.instr_mem.load_word(pc))
+        except Exception:
+            return None
+
+    def step(self) -> bool:
+        """
+        Function: step
+        Retira una instrucción.
+        Returns:
+        - bool: False si el programa ya había terminado.
+        """
+        return self.run(1) == 1
+
+    def run(self, max_instructions: int = None) -> int:
+        """
+        Function: run
+        Retira instrucciones hasta el final del programa o hasta max_instructions.
+        Params:
+        - max_instructions: int o None - límite de instrucciones de esta llamada (None = sin límite).
+        Returns:
+        - int: instrucciones retiradas en esta llamada.
+        Example:
+            fast.run(5000)
+        """
+        if self.halted:
+            return 0
+        if self.block_cache is None:
+            return self._interpret(max_instructions)
+
+        blocks = self.block_cache.blocks
+        get_block = self.block_cache.get
+        values = self.registers.values
+        data_mem = self.data_mem
+        pc = self.pc
+        retired = 0
+        interpreted = 0
+        limit = max_instructions if max_instructions is not None else -1
+
+        while retired != limit:
+            block = blocks.get(pc)
+            if block is None:
+                block = get_block(pc)
+            if block is None or (limit >= 0 and block.length > limit - retired):
+                # Sin bloque (PC no decodificado o fin del programa) o no cabe entero: una instrucción
+                self.pc = pc
+                if not self._interpret(1):
+                    break
+                retired += 1
+                interpreted += 1
+                pc = self.pc
+                continue
+            pc = block.run(values, data_mem)
+            retired += block.length
+
+        self.pc = pc
+        self.instructions += retired - interpreted
+        self.registers.all_dirty = True
+        return retired
+
+    def _interpret(self, max_instructions: int = None) -> int:
+        """
+        Function: _interpret
+        Intérprete de una instrucción por paso (ver run).
+        """
+        if self.halted:
+            return 0
+        entries = self.decode_cache.entries
+        values = self.registers.values
+        data_mem = self.data_mem
+        jal = Opcode.JAL
+        jalr = Opcode.JALR
+        pc = self.pc
+        retired = 0
+        limit = max_instructions if max_instructions is not None else -1
+
+        while retired != limit:
+            index = pc >> 2
+            uop = entries[index] if 0 <= index < len(entries) else None
+            if uop is None:
+                uop = self._fetch_uop(pc)
+                if uop is None:
+                    self.halted = True
+                    break
+                entries = self.decode_cache.entries  # fill() puede haber agrandado la tabla
+            retired += 1
+            control = uop.signals
+            next_pc = pc + 4
+
+            # ID: lectura de registros (x0 y operandos ausentes valen 0)
+            rs1_val = values[uop.rs1] if uop.rs1 else 0
+            rs2_val = values[uop.rs2] if uop.rs2 else 0
+
+            # EX: misma semántica que ExecuteStage
+            imm = uop.imm
+            alu_result = uop.alu(rs1_val, imm if control.ALUSrc else rs2_val, pc)
+            branch_condition = uop.branch_condition
+            if branch_condition is not None:
+                if branch_condition(rs1_val, rs2_val):
+                    next_pc = pc + imm
+            elif uop.op == jal:
+                alu_result = pc + 4
+                next_pc = pc + imm
+            elif uop.op == jalr:
+                alu_result = pc + 4
+                next_pc = (rs1_val + imm) & ~1
+
+            # MEM y WB
+            if control.MemRead:
+                if control.MemWidth == 4:
+                    alu_result = data_mem.load_word(alu_result)
+                else:
+                    alu_result = data_mem.load(alu_result, control.MemWidth, control.MemSigned)
+            elif control.MemWrite:
+                if control.MemWidth == 4:
+                    data_mem.store_word(alu_result, rs2_val)
+                else:
+                    data_mem.store(alu_result, rs2_val, control.MemWidth)
+            if control.RegWrite and uop.rd:
+                values[uop.rd] = alu_result
+            pc = next_pc
+
+        self.pc = pc
+        self.instructions += retired
+        self.registers.all_dirty = True  # los registros se escribieron sin pasar por write()
+        return retired
+
+    def handoff(self, cpu):
+        """
+        Function: handoff
+        Entrega el estado arquitectónico a un procesador con pipeline (PipelineEngine) que todavía no
+        empezó a ejecutar: PC, registros, memoria de instrucciones y memoria de datos. El procesador
+        debe usar la misma configuración de memoria de datos (tamaño y tipo).
+        Params:
+        - cpu: PipelineEngine - procesador que continúa la ejecución con el pipeline.
+        Example:
+            fast.handoff(cpu)
+            cpu.run()
+        """
+        cpu.instr_mem.ensure_words(self.instr_mem.size)
+        cpu.instr_mem.data[:self.instr_mem.size] = self.instr_mem.data
+        cpu.instr_mem.extended = dict(self.instr_mem.extended)
+        cpu.decode_cache.entries = list(self.decode_cache.entries)
+        cpu.registers.restore(self.registers.snapshot())
+        cpu.data_mem.restore(self.data_mem.snapshot())
+        cpu.if_stage.pc = self.pc
+        cpu.if_stage.halted = self.halted
@@ -0,0 +1,169 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from bisect import bisect_right
+from config import HISTORY_CHECKPOINT_INTERVAL, HISTORY_BUDGET_CYCLES
+
+"""
+Class: CycleHistory
+Historial para ejecución inversa (paso atrás) de un PipelineEngine.
+
+Combina dos registros:
+- Checkpoints cada checkpoint_interval ciclos con el estado completo del procesador salvo la memoria
+  de datos (registros, PC, latches, predictor, métricas y reloj; ver PipelineEngine.capture_state).
+- Un delta por ciclo: PC al iniciar el ciclo, escrituras de registros (rd, valor anterior) y
+  escrituras de memoria (dirección, ancho, valor anterior), anotadas por las etapas WB y MEM.
+
+Para volver al ciclo N se deshacen las escrituras de memoria hasta el checkpoint más cercano
+anterior a N, se restaura ese checkpoint y se vuelven a ejecutar los ciclos que faltan hasta N.
+El costo de un paso atrás queda acotado por checkpoint_interval en lugar de por la longitud de la traza.
+
+El historial conserva como máximo budget_cycles ciclos: al excederse descarta el checkpoint más
+antiguo junto con sus deltas (siempre queda al menos uno).
+
+Attributes:
+- checkpoint_interval: int - ciclos entre checkpoints.
+- budget_cycles: int - ciclos de historial que se conservan.
+- checkpoints: list - pares (ciclo, estado) ordenados por ciclo.
+- deltas: list - deltas[i] son los cambios del ciclo base_cycle + i → base_cycle + i + 1.
+- base_cycle: int - ciclo del checkpoint más antiguo conservado.
+
+Methods:
+- begin_cycle: Registra un checkpoint si corresponde y abre el delta del ciclo.
+- rewind: Devuelve el procesador a un ciclo anterior.
+- get_delta: Devuelve los cambios de un ciclo.
+- oldest_cycle: Ciclo más antiguo al que se puede volver.
+- clear: Vacía el historial.
+
+Example:
+    cpu.enable_history(checkpoint_interval=64)
+    for _ in range(100):
+        cpu.run_one_cycle()
+    cpu.step_back(10)  # ciclo 90
+"""
+
+class CycleHistory:
+    def __init__(self, checkpoint_interval: int = None, budget_cycles: int = None):
+        """
+        Function: __init__
+        Inicializa un historial vacío.
+        Params:
+        - checkpoint_interval: int - ciclos entre checkpoints (por defecto HISTORY_CHECKPOINT_INTERVAL).
+        - budget_cycles: int - ciclos de historial conservados (por defecto HISTORY_BUDGET_CYCLES).
+        """
+        self.checkpoint_interval = max(1, checkpoint_interval or HISTORY_CHECKPOINT_INTERVAL)
+        self.budget_cycles = max(self.checkpoint_interval, budget_cycles or HISTORY_BUDGET_CYCLES)
+        self.clear()
+
+    def clear(self):
+        """
+        Function: clear
+        Descarta todos los checkpoints y deltas.
+        """
+        self.checkpoints = []
+        self.deltas = []
+        self.base_cycle = 0
+
+    def oldest_cycle(self) -> int:
+        """
+        Function: oldest_cycle
+        Devuelve el ciclo más antiguo al que se puede volver (None si el historial está vacío).
+        """
+        return self.checkpoints[0][0] if self.checkpoints else None
+
+    def begin_cycle(self, cpu):
+        """
+        Function: begin_cycle
+        Se llama al inicio de cada ciclo: toma un checkpoint cada checkpoint_interval ciclos,
+        abre el delta del ciclo y conecta sus listas a las etapas MEM y WB.
+        Params:
+        - cpu: PipelineEngine - procesador que está por ejecutar el ciclo.
+        """
+        cycle = cpu.metrics.ciclos_totales
+        if not self.checkpoints:
+            self.base_cycle = cycle
+            self.checkpoints.append((cycle, cpu.capture_state()))
+        elif cycle % self.checkpoint_interval == 0 and self.checkpoints[-1][0] != cycle:
+            self.checkpoints.append((cycle, cpu.capture_state()))
+            self._enforce_budget(cycle)
+
+        reg_writes = []
+        mem_writes = []
+        cpu.wb_stage.journal = reg_writes
+        cpu.mem_stage.journal = mem_writes
+        self.deltas.append((cpu.if_stage.pc, reg_writes, mem_writes))
+
+    def _enforce_budget(self, cycle: int):
+        """
+        Function: _enforce_budget
+        Descarta los checkpoints (y deltas) más antiguos mientras se exceda budget_cycles.
+        """
+        while len(self.checkpoints) > 1 and cycle - self.checkpoints[1][0] >= self.budget_cycles:
+            del self.checkpoints[0]
+            new_base = self.checkpoints[0][0]
+            del self.deltas[:new_base - self.base_cycle]
+            self.base_cycle = new_base
+
+    def get_delta(self, cycle: int):
+        """
+        Function: get_delta
+        Devuelve los cambios del ciclo que termina en 'cycle' (el ciclo número 'cycle', desde 1).
+        Params:
+        - cycle: int - número de ciclo.
+        Returns:
+        - tuple o None: (pc, [(rd, anterior)], [(addr, ancho, anterior)]), o None si no está en el historial.
+        """
+        index = cycle - 1 - self.base_cycle
+        if 0 <= index < len(self.deltas):
+            return self.deltas[index]
+        return None
+
+    def rewind(self, cpu, target_cycle: int) -> int:
+        """
+        Function: rewind
+        Devuelve el procesador al ciclo target_cycle: deshace las escrituras de memoria hasta el
+        checkpoint más cercano, lo restaura y vuelve a ejecutar los ciclos restantes.
+        Params:
+        - cpu: PipelineEngine - procesador con este historial.
+        - target_cycle: int - ciclo destino (se limita al más antiguo disponible).
+        Returns:
+        - int: ciclo en el que quedó el procesador.
+        Example:
+            history.rewind(cpu, cpu.metrics.ciclos_totales - 1)
+        """
+        current = cpu.metrics.ciclos_totales
+        if not self.checkpoints or target_cycle >= current:
+            return current
+        target_cycle = max(target_cycle, self.checkpoints[0][0])
+
+        index = bisect_right(self.checkpoints, target_cycle, key=lambda checkpoint: checkpoint[0]) - 1
+        checkpoint_cycle, state = self.checkpoints[index]
+
+        # Deshacer escrituras de memoria, de la más reciente a la más antigua
+        data_mem = cpu.data_mem
+        first = checkpoint_cycle - self.base_cycle
+        for _, _, mem_writes in reversed(self.deltas[first:]):
+            for addr, width, old in reversed(mem_writes):
+                if width == 4:
+                    data_mem.store_word(addr, old)
+                else:
+                    data_mem.store(addr, old, width)
+        del self.deltas[first:]
+        del self.checkpoints[index + 1:]
+
+        cpu.restore_state(state)
+        cpu.wb_stage.journal = None
+        cpu.mem_stage.journal = None
+
+        # Volver a ejecutar desde el checkpoint (registra de nuevo los deltas)
+        while cpu.metrics.ciclos_totales < target_cycle and not cpu.pipeline.is_done():
+            cpu._cycle()
+        return cpu.metrics.ciclos_totales
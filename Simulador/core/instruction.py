@@ -1,4 +1,5 @@
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
+from components.register_file import register_index
 class InstructionType(Enum):
     R_TYPE = auto()
     I_TYPE = auto()
@@ -8,15 +9,184 @@ class InstructionType(Enum):
     U_TYPE = auto()
     INVALID = auto()
 
+
+class Opcode(IntEnum):
+    """
+    Codificación entera de los mnemónicos soportados. La etapa EX indexa sus tablas de
+    despacho con este valor en lugar de comparar cadenas.
+    """
+    NOP = 0
+    ADD = auto()
+    SUB = auto()
+    AND = auto()
+    OR = auto()
+    XOR = auto()
+    SLT = auto()
+    SLL = auto()
+    SRL = auto()
+    SRA = auto()
+    ADDI = auto()
+    ANDI = auto()
+    ORI = auto()
+    SLTI = auto()
+    SLLI = auto()
+    SRLI = auto()
+    SRAI = auto()
+    LW = auto()
+    SW = auto()
+    LB = auto()
+    LH = auto()
+    LBU = auto()
+    LHU = auto()
+    SB = auto()
+    SH = auto()
+    BEQ = auto()
+    BNE = auto()
+    BLT = auto()
+    BGE = auto()
+    BLTU = auto()
+    BGEU = auto()
+    JAL = auto()
+    JALR = auto()
+    LUI = auto()
+    AUIPC = auto()
+
+
+class AluOp(IntEnum):
+    """
+    Codificación entera de la operación de la ALU (señal ALUOp de la unidad de control).
+    """
+    NOP = 0
+    ADD = auto()
+    SUB = auto()
+    AND = auto()
+    OR = auto()
+    XOR = auto()
+    SLT = auto()
+    SLL = auto()
+    SRL = auto()
+    SRA = auto()
+    ADDI = auto()
+    ANDI = auto()
+    ORI = auto()
+    SLTI = auto()
+    SLLI = auto()
+    SRLI = auto()
+    SRAI = auto()
+    LUI = auto()
+    AUIPC = auto()
+
+
+# Opcode → mnemónico (una sola cadena por opcode, compartida por todas las micro-ops)
+OPCODE_NAMES = tuple(op.name.lower() for op in Opcode)
+# Mnemónico en texto → Opcode (se resuelve una sola vez, al parsear)
+OPCODE_BY_NAME = {name: op for name, op in zip(OPCODE_NAMES, Opcode)}
+
+# Accesos a memoria de datos: formato "rd, imm(rs1)" / "rs2, imm(rs1)"
+LOAD_OPCODES = {"lw", "lh", "lb", "lhu", "lbu"}
+STORE_OPCODES = {"sw", "sh", "sb"}
+
+
+def _compile_functions(expressions, params: str) -> tuple:
+    """
+    Function: _compile_functions
+    Genera, una sola vez al importar el módulo, una lambda por expresión de la tabla.
+    Params:
+    - expressions: tuple[str | None] - expresiones de Python sobre los nombres de params.
+    - params: str - parámetros de las lambdas, p. ej. "a, b, pc".
+    Returns:
+    - tuple: la función de cada expresión, o None donde la expresión es None.
+    """
+    source = ", ".join(f"lambda {params}: {expr}" if expr is not None else "None" for expr in expressions)
+    return eval(compile(f"({source},)", "<tablas de instruction.py>", "eval"), {})
+
+
+"""
+Tabla: ALU_EXPRESSIONS
+Semántica de cada AluOp escrita como expresión de Python sobre a (operando1), b (operando2) y pc.
+Es la única definición: ALU_FUNCTIONS se genera a partir de ella y la caché de bloques
+(core/block_cache.py) la escribe en línea en el código que genera.
+"""
+_ALU_BY_OP = {
+    AluOp.NOP: "0",
+    AluOp.ADD: "a + b",
+    AluOp.SUB: "a - b",
+    AluOp.AND: "a & b",
+    AluOp.OR: "a | b",
+    AluOp.XOR: "a ^ b",
+    AluOp.SLT: "int(a < b)",
+    AluOp.SLL: "a << (b & 0x1F)",
+    AluOp.SRL: "(a % (1 << 32)) >> (b & 0x1F)",
+    AluOp.SRA: "a >> (b & 0x1F)",
+    AluOp.ADDI: "a + b",
+    AluOp.ANDI: "a & b",
+    AluOp.ORI: "a | b",
+    AluOp.SLTI: "int(a < b)",
+    AluOp.SLLI: "a << (b & 0x1F)",
+    AluOp.SRLI: "(a % (1 << 32)) >> (b & 0x1F)",
+    AluOp.SRAI: "a >> (b & 0x1F)",
+    # lui/auipc: b es el campo de 20 bits sin signo; el valor se extiende con signo desde 32 bits
+    AluOp.LUI: "((b << 12) ^ 0x80000000) - 0x80000000",
+    AluOp.AUIPC: "pc + (((b << 12) ^ 0x80000000) - 0x80000000)",
+}
+ALU_EXPRESSIONS = tuple(_ALU_BY_OP[op] for op in AluOp)
+
+"""
+Tabla: ALU_FUNCTIONS
+Funciones de la ALU indexadas por AluOp, generadas desde ALU_EXPRESSIONS. Todas reciben
+(operando1, operando2, pc), donde operando2 ya es el inmediato o rs2 según ALUSrc.
+
+Example:
+    alu_result = ALU_FUNCTIONS[AluOp.ADD](rs1_val, operand2, pc)
+"""
+ALU_FUNCTIONS = _compile_functions(ALU_EXPRESSIONS, "a, b, pc")
+
+"""
+Tabla: BRANCH_CONDITIONS
+Condición de salto indexada por Opcode: función (rs1_val, rs2_val) -> bool para los saltos
+condicionales (tipo B) y None para el resto de instrucciones. Se genera desde BRANCH_EXPRESSIONS,
+la misma condición como expresión sobre a y b que usa la caché de bloques.
+"""
+_BRANCH_BY_OP = {
+    Opcode.BEQ: "a == b",
+    Opcode.BNE: "a != b",
+    Opcode.BLT: "a < b",
+    Opcode.BGE: "a >= b",
+    Opcode.BLTU: "(a & 0xFFFFFFFF) < (b & 0xFFFFFFFF)",
+    Opcode.BGEU: "(a & 0xFFFFFFFF) >= (b & 0xFFFFFFFF)",
+}
+BRANCH_EXPRESSIONS = tuple(_BRANCH_BY_OP.get(op) for op in Opcode)
+BRANCH_CONDITIONS = _compile_functions(BRANCH_EXPRESSIONS, "a, b")
+
+"""
+Tabla: OPCODE_ALU_OP
+Operación de ALU que ejecuta cada Opcode en los procesadores sin unidad de control
+(ExecuteStageBasic). Los saltos no usan la ALU: su resultado queda en 0 o en pc + 4.
+"""
+_ALU_OP_BY_OPCODE = {
+    Opcode.ADD: AluOp.ADD, Opcode.SUB: AluOp.SUB, Opcode.AND: AluOp.AND,
+    Opcode.OR: AluOp.OR, Opcode.XOR: AluOp.XOR, Opcode.SLT: AluOp.SLT,
+    Opcode.SLL: AluOp.SLL, Opcode.SRL: AluOp.SRL, Opcode.SRA: AluOp.SRA,
+    Opcode.ADDI: AluOp.ADDI, Opcode.ANDI: AluOp.ANDI, Opcode.ORI: AluOp.ORI,
+    Opcode.SLTI: AluOp.SLTI, Opcode.SLLI: AluOp.SLLI, Opcode.SRLI: AluOp.SRLI,
+    Opcode.SRAI: AluOp.SRAI, Opcode.LW: AluOp.ADD, Opcode.SW: AluOp.ADD,
+    Opcode.LB: AluOp.ADD, Opcode.LH: AluOp.ADD, Opcode.LBU: AluOp.ADD,
+    Opcode.LHU: AluOp.ADD, Opcode.SB: AluOp.ADD, Opcode.SH: AluOp.ADD,
+    Opcode.LUI: AluOp.LUI, Opcode.AUIPC: AluOp.AUIPC,
+}
+OPCODE_ALU_OP = tuple(_ALU_OP_BY_OPCODE.get(op, AluOp.NOP) for op in Opcode)
+
+
 class Instruction:
     def __init__(self, raw_text: str, address: int):
         self.raw_text = raw_text.strip() # Línea original
         self.address = address  # Dirección en memoria (PC)
         self.opcode = None
+        self.op = None  # Opcode entero (None si el mnemónico no es soportado)
         self.operands = []  # Lista de registros o valores
         self.type = InstructionType.INVALID # Tipo de instrucción (determinado por el opcode)
 
-        # Campos decodificados
+        # Campos decodificados (registros como número 0-31, alias ABI ya resueltos)
         self.rd = None
         self.rs1 = None
         self.rs2 = None
@@ -24,6 +194,58 @@ class Instruction:
 
         self._parse_instruction()
 
+    @classmethod
+    def from_fields(cls, raw_text: str, address: int, opcode: str, instr_type: InstructionType,
+                    rd: int = None, rs1: int = None, rs2: int = None, imm: int = None) -> "Instruction":
+        """
+        Function: from_fields
+        Crea una instrucción con los campos ya decodificados, sin parsear el texto (lo usa el
+        decodificador de código máquina, core/rv32i.py).
+        Params:
+        - raw_text: str - texto de la instrucción (desensamblado).
+        - address: int - dirección en memoria (PC).
+        - opcode: str - mnemónico.
+        - instr_type: InstructionType - formato de la instrucción.
+        - rd, rs1, rs2: int o None - números de registro.
+        - imm: int o None - inmediato.
+        Example:
+            instr = Instruction.from_fields("addi x1, x0, 5", 0, "addi", InstructionType.I_TYPE, rd=1, rs1=0, imm=5)
+        """
+        instr = cls.__new__(cls)
+        instr.raw_text = raw_text
+        instr.address = address
+        instr.opcode = opcode
+        instr.op = OPCODE_BY_NAME.get(opcode)
+        instr.operands = raw_text.replace(',', '').split()[1:]
+        instr.type = instr_type
+        instr.rd = rd
+        instr.rs1 = rs1
+        instr.rs2 = rs2
+        instr.imm = imm
+        return instr
+
+    @classmethod
+    def from_operands(cls, raw_text: str, address: int, opcode: str, operands: list) -> "Instruction":
+        """
+        Function: from_operands
+        Crea una instrucción a partir del mnemónico y los operandos ya separados, sin volver a
+        dividir el texto (lo usa la pasada 2 del ensamblador, InOut/assembler.py).
+        Params:
+        - raw_text: str - texto de la instrucción (se muestra y se guarda tal cual).
+        - address: int - dirección en memoria (PC).
+        - opcode: str - mnemónico.
+        - operands: list[str] - operandos en texto ("x1", "-8", "4(sp)").
+        Example:
+            instr = Instruction.from_operands("beq x1, x2, -8", 12, "beq", ["x1", "x2", "-8"])
+        """
+        instr = cls.__new__(cls)
+        instr.raw_text = raw_text
+        instr.address = address
+        instr.type = InstructionType.INVALID
+        instr.rd = instr.rs1 = instr.rs2 = instr.imm = None
+        instr._parse_operands(opcode, operands)
+        return instr
+
     def _parse_instruction(self):
         
         if not self.raw_text:
@@ -33,10 +255,14 @@ class Instruction:
         if len(parts) == 0:
             return
 
-        self.opcode = parts[0]
-        self.operands = parts[1:]
+        self._parse_operands(parts[0], parts[1:])
+
+    def _parse_operands(self, opcode: str, operands: list):
+        self.opcode = opcode
+        self.op = OPCODE_BY_NAME.get(self.opcode)
+        self.operands = operands
 
-        # Clasificación por opcode (ampliada, solo lw/sw para memoria)
+        # Clasificación por opcode (memoria: palabra, media palabra y byte)
         if self.opcode in {"add", "sub", "and", "or", "slt", "xor", "sll", "srl", "sra"}:
             self.type = InstructionType.R_TYPE
             self.rd, self.rs1, self.rs2 = self.operands
@@ -46,15 +272,15 @@ class Instruction:
             self.rd, self.rs1, imm = self.operands
             self.imm = int(imm)
 
-        elif self.opcode == "lw":
+        elif self.opcode in LOAD_OPCODES:
             self.type = InstructionType.I_TYPE
             self.rd, mem = self.operands
-            # formato lw rd, imm(rs1)
+            # formato lw/lh/lb/lhu/lbu rd, imm(rs1)
             imm_part, rs1_part = mem.replace(')', '').split('(')
             self.rs1 = rs1_part
             self.imm = int(imm_part)
 
-        elif self.opcode == "sw":
+        elif self.opcode in STORE_OPCODES:
             self.type = InstructionType.S_TYPE
             self.rs2, mem = self.operands
             imm_part, rs1_part = mem.replace(')', '').split('(')
@@ -83,9 +309,20 @@ class Instruction:
             self.type = InstructionType.U_TYPE
             self.rd, imm = self.operands
             self.imm = int(imm)
+            if -(1 << 19) <= self.imm < 0:
+                self.imm &= 0xFFFFF  # Campo de 20 bits sin signo: un negativo de 20 bits se enmascara
 
         else:
             self.type = InstructionType.INVALID
+            return
+
+        # Resolver nombres de registro (x5, t0, sp...) a su número una sola vez
+        if self.rd is not None:
+            self.rd = register_index(self.rd)
+        if self.rs1 is not None:
+            self.rs1 = register_index(self.rs1)
+        if self.rs2 is not None:
+            self.rs2 = register_index(self.rs2)
 
     def __str__(self):
         return f"[{self.address:#04x}] {self.raw_text}"
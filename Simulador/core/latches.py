@@ -0,0 +1,181 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+"""
+Module: latches
+Registros inter-etapa del pipeline (IF/ID, ID/EX, EX/MEM, MEM/WB) como objetos con __slots__.
+Cada procesador los reserva una sola vez y las etapas los sobrescriben en sitio en cada ciclo,
+evitando crear y consultar diccionarios nuevos en el ciclo interno.
+
+Para la GUI y el código existente, cada latch se comporta como un diccionario de solo lectura
+(latch["instr"], latch.get("pc"), "instr" in latch) y puede convertirse con as_dict().
+
+Classes:
+- PipelineLatch: base común con la interfaz compatible con diccionarios.
+- IFIDLatch: registro IF/ID (instr, pc).
+- IDEXLatch: registro ID/EX (micro-op, operandos, inmediato, señales de control, predicción).
+- EXMEMLatch: registro EX/MEM (resultado ALU, salto, flush).
+- MEMWBLatch: registro MEM/WB (dato de memoria, resultado ALU).
+
+Example:
+    latch = IDEXLatch()
+    latch.reset(nop, 0)
+    latch.rs1_val = 5
+    print(latch["rs1_val"], latch.as_dict())
+"""
+from components.control_unit import NOP_SIGNALS
+from core.decode_cache import NOP_UOP
+
+
+class PipelineLatch:
+    """
+    Class: PipelineLatch
+    Base de los registros inter-etapa. Las subclases definen __slots__ y sobrescriben reset()
+    con el valor inicial de cada campo propio.
+
+    Methods:
+    - reset: Sobrescribe todos los campos con su valor por defecto.
+    - copy_from: Copia instr y pc desde otro latch (avance del pipeline).
+    - fields: Devuelve los nombres de los campos.
+    - snapshot / restore: Copia y restaura los valores de los campos (historial inverso).
+    - get / __getitem__ / __setitem__ / __contains__: acceso compatible con diccionarios.
+    - as_dict: Devuelve una copia del latch como diccionario.
+    """
+    __slots__ = ("instr", "pc")
+
+    def __init__(self, instr=None, pc: int = 0):
+        self.reset(instr, pc)
+
+    def reset(self, instr, pc: int):
+        """
+        Function: reset
+        Carga la instrucción y el PC, y restablece el resto de campos a su valor por defecto.
+        Params:
+        - instr: MicroOp - instrucción (pre-decodificada) que ocupa el latch.
+        - pc: int - dirección de la instrucción.
+        """
+        self.instr = instr
+        self.pc = pc
+
+    def copy_from(self, other: "PipelineLatch"):
+        """
+        Function: copy_from
+        Copia la instrucción y el PC de otro latch. Los latches de Pipeline solo transportan
+        estos dos campos; el resto conserva el valor asignado en reset().
+        Params:
+        - other: PipelineLatch - latch de la etapa anterior.
+        """
+        self.instr = other.instr
+        self.pc = other.pc
+
+    def fields(self) -> tuple:
+        """
+        Function: fields
+        Devuelve los nombres de todos los campos del latch.
+        """
+        return PipelineLatch.__slots__ + type(self).__slots__
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value):
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.fields()
+
+    def snapshot(self) -> tuple:
+        """
+        Function: snapshot
+        Devuelve los valores de todos los campos, en el orden de fields() (historial inverso).
+        Returns:
+        - tuple: valores de los campos.
+        """
+        return tuple([getattr(self, name) for name in self.fields()])
+
+    def restore(self, values: tuple):
+        """
+        Function: restore
+        Sobrescribe los campos con valores tomados con snapshot().
+        Params:
+        - values: tuple - valores en el orden de fields().
+        """
+        for name, value in zip(self.fields(), values):
+            setattr(self, name, value)
+
+    def as_dict(self) -> dict:
+        """
+        Function: as_dict
+        Devuelve el contenido del latch como diccionario (para GUI o depuración).
+        Returns:
+        - dict: campo → valor.
+        """
+        return {name: getattr(self, name) for name in self.fields()}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.as_dict()})"
+
+
+class IFIDLatch(PipelineLatch):
+    __slots__ = ()
+
+
+class IDEXLatch(PipelineLatch):
+    __slots__ = ("uop", "rs1_val", "rs2_val", "imm", "rd", "rs1", "rs2",
+                 "control_signals", "predicted_taken", "predicted_target")
+
+    def reset(self, instr, pc: int):
+        self.instr = instr
+        self.pc = pc
+        self.uop = NOP_UOP
+        self.rs1_val = 0
+        self.rs2_val = 0
+        self.imm = 0
+        self.rd = None
+        self.rs1 = None
+        self.rs2 = None
+        self.control_signals = NOP_SIGNALS
+        self.predicted_taken = False
+        self.predicted_target = None
+
+
+class EXMEMLatch(PipelineLatch):
+    __slots__ = ("alu_result", "rs2_val", "rd", "branch_taken", "target_address",
+                 "flush_required", "control_signals")
+
+    def reset(self, instr, pc: int):
+        self.instr = instr
+        self.pc = pc
+        self.alu_result = 0
+        self.rs2_val = 0
+        self.rd = None
+        self.branch_taken = False
+        self.target_address = None
+        self.flush_required = False
+        self.control_signals = NOP_SIGNALS
+
+
+class MEMWBLatch(PipelineLatch):
+    __slots__ = ("rd", "alu_result", "mem_data", "control_signals")
+
+    def reset(self, instr, pc: int):
+        self.instr = instr
+        self.pc = pc
+        self.rd = None
+        self.alu_result = 0
+        self.mem_data = None
+        self.control_signals = NOP_SIGNALS
@@ -9,17 +9,19 @@ Consulta el archivo LICENSE para más detalles.
 ==========================================================================
 """
 
-from core.instruction import Instruction
+from core.decode_cache import MicroOp, NOP_UOP
+from core.latches import IFIDLatch, IDEXLatch, EXMEMLatch, MEMWBLatch
 
 """
 Class: Pipeline
 Clase que simula el pipeline de un procesador, gestionando el avance de instrucciones por las etapas clásicas.
 
 Attributes:
-- IF_ID: dict - registro entre las etapas IF e ID, contiene al menos la instrucción y el PC.
-- ID_EX: dict - registro entre las etapas ID y EX.
-- EX_MEM: dict - registro entre las etapas EX y MEM.
-- MEM_WB: dict - registro entre las etapas MEM y WB.
+- IF_ID: IFIDLatch - registro entre las etapas IF e ID, contiene al menos la instrucción (MicroOp) y el PC.
+- ID_EX: IDEXLatch - registro entre las etapas ID y EX.
+- EX_MEM: EXMEMLatch - registro entre las etapas EX y MEM.
+- MEM_WB: MEMWBLatch - registro entre las etapas MEM y WB.
+Los cuatro latches se crean una sola vez y se sobrescriben en sitio en cada ciclo.
 - completed: bool - indica si el pipeline está vacío (todas las etapas con NOP).
 - cycles: int - número de ciclos ejecutados.
 
@@ -30,7 +32,7 @@ Methods:
 - init_pipeline: Inicializa los registros del pipeline con instrucciones NOP.
 - step: Simula un ciclo del pipeline, avanzando las instrucciones una etapa.
 - dump_pipeline: Devuelve el estado actual de todas las etapas.
-- _create_nop_instruction: Crea una instrucción NOP interna.
+- _create_nop_instruction: Devuelve la micro-op NOP interna.
 - is_done: Indica si el pipeline está vacío.
 - get_cycle: Devuelve el número de ciclos ejecutados.
 - insert_stall: Inserta una burbuja (NOP) en la etapa ID/EX para resolver hazards.
@@ -40,7 +42,7 @@ Example:
     pipe = Pipeline()
     pipe.init_pipeline()
     while not pipe.is_done():
-        pipe.step(Instruction("add x1, x2, x3", 0), 0)
+        pipe.step(cache.fill(0, Instruction("add x1, x2, x3", 0)), 0)
 """
 
 class Pipeline:
@@ -49,48 +51,15 @@ class Pipeline:
         Function: __init__
         Inicializa los registros del pipeline y los contadores de estado.
         """
-        # Representan los registros entre etapas
-        # cada uno es un diccionario con al menos una clave 'instr' que contiene la instrucción
-        self._IF_ID = None
-        self._ID_EX = None
-        self._EX_MEM = None
-        self._MEM_WB = None
+        # Representan los registros entre etapas; se reservan una vez y se sobrescriben en sitio
+        self._nop = self._create_nop_instruction()
+        self.IF_ID = IFIDLatch(self._nop, 0)
+        self.ID_EX = IDEXLatch(self._nop, None)
+        self.EX_MEM = EXMEMLatch(self._nop, None)
+        self.MEM_WB = MEMWBLatch(self._nop, None)
         self.completed = False
         self.cycles = 0
 
-    # --- Propiedades para acceso externo seguro ---
-    @property
-    def IF_ID(self):
-        return self._IF_ID
-
-    @IF_ID.setter
-    def IF_ID(self, value):
-        self._IF_ID = value
-
-    @property
-    def ID_EX(self):
-        return self._ID_EX
-
-    @ID_EX.setter
-    def ID_EX(self, value):
-        self._ID_EX = value
-
-    @property
-    def EX_MEM(self):
-        return self._EX_MEM
-
-    @EX_MEM.setter
-    def EX_MEM(self, value):
-        self._EX_MEM = value
-
-    @property
-    def MEM_WB(self):
-        return self._MEM_WB
-
-    @MEM_WB.setter
-    def MEM_WB(self, value):
-        self._MEM_WB = value
-
     def init_pipeline(self):
         """
         Function: init_pipeline
@@ -98,20 +67,20 @@ class Pipeline:
         Example:
             pipe.init_pipeline()
         """
-        nop = self._create_nop_instruction()
-        self.IF_ID = {"instr": nop, "pc": 0}
-        self.ID_EX = {"instr": nop}
-        self.EX_MEM = {"instr": nop}
-        self.MEM_WB = {"instr": nop}
+        nop = self._nop
+        self.IF_ID.reset(nop, 0)
+        self.ID_EX.reset(nop, None)
+        self.EX_MEM.reset(nop, None)
+        self.MEM_WB.reset(nop, None)
         self.completed = False
         self.cycles = 0
 
-    def step(self, fetched_instr: Instruction, pc: int):
+    def step(self, fetched_instr: MicroOp, pc: int):
         """
         Function: step
         Simula un paso del pipeline, avanzando las instrucciones una etapa hacia adelante.
         Params:
-        - fetched_instr: Instruction - instrucción obtenida en la etapa IF.
+        - fetched_instr: MicroOp - instrucción obtenida en la etapa IF.
         - pc: int - dirección de la instrucción obtenida.
         Example:
             pipe.step(instr, 0)
@@ -119,14 +88,14 @@ class Pipeline:
         self.cycles += 1
 
         # Avanzar pipeline (WB ya sale del sistema)
-        self.MEM_WB = self.EX_MEM
-        self.EX_MEM = self.ID_EX
-        self.ID_EX = self.IF_ID
-        self.IF_ID = {"instr": fetched_instr, "pc": pc}
+        self.MEM_WB.copy_from(self.EX_MEM)
+        self.EX_MEM.copy_from(self.ID_EX)
+        self.ID_EX.copy_from(self.IF_ID)
+        self.IF_ID.reset(fetched_instr, pc)
 
         # Verificar si se ha completado (todas son NOP)
-        if all(stage["instr"].opcode == "nop" for stage in
-               [self.IF_ID, self.ID_EX, self.EX_MEM, self.MEM_WB]):
+        if (fetched_instr.opcode == "nop" and self.ID_EX.instr.opcode == "nop"
+                and self.EX_MEM.instr.opcode == "nop" and self.MEM_WB.instr.opcode == "nop"):
             self.completed = True
 
     def dump_pipeline(self):
@@ -134,27 +103,27 @@ class Pipeline:
         Function: dump_pipeline
         Retorna el estado actual de todas las etapas del pipeline para depuración o visualización.
         Returns:
-        - dict: estado de los registros inter-etapas.
+        - dict: estado de los registros inter-etapas, cada uno como diccionario (copia).
         Example:
             estado = pipe.dump_pipeline()
         """
         return {
-            "IF_ID": self.IF_ID,
-            "ID_EX": self.ID_EX,
-            "EX_MEM": self.EX_MEM,
-            "MEM_WB": self.MEM_WB
+            "IF_ID": self.IF_ID.as_dict(),
+            "ID_EX": self.ID_EX.as_dict(),
+            "EX_MEM": self.EX_MEM.as_dict(),
+            "MEM_WB": self.MEM_WB.as_dict()
         }
 
-    def _create_nop_instruction(self) -> Instruction:
+    def _create_nop_instruction(self) -> MicroOp:
         """
         Function: _create_nop_instruction
-        Crea una instrucción NOP simulada (interna).
+        Devuelve la micro-op NOP simulada (interna).
         Returns:
-        - Instruction: instrucción NOP.
+        - MicroOp: NOP_UOP.
         Example:
             nop = self._create_nop_instruction()
         """
-        return Instruction("nop", address=0)
+        return NOP_UOP
 
     def is_done(self) -> bool:
         """
@@ -187,22 +156,11 @@ class Pipeline:
         Example:
             pipe.insert_stall()
         """
-        nop = self._create_nop_instruction()
-
         self.cycles += 1
 
-        self.MEM_WB = self.EX_MEM
-        self.EX_MEM = self.ID_EX
-        self.ID_EX = {
-            "instr": nop,
-            "pc": self.IF_ID["pc"],
-            "rd": None,
-            "rs1": None,
-            "rs2": None,
-            "rs1_val": None,
-            "rs2_val": None,
-            "imm": None
-        }
+        self.MEM_WB.copy_from(self.EX_MEM)
+        self.EX_MEM.copy_from(self.ID_EX)
+        self.ID_EX.reset(self._nop, self.IF_ID.pc)
     # IF_ID no se modifica → mismo fetch, se repite la instrucción
 
     def flush(self):
@@ -212,16 +170,5 @@ class Pipeline:
         Example:
             pipe.flush()
         """
-        nop = self._create_nop_instruction()
-
-        self.IF_ID = {"instr": nop, "pc": 0}
-        self.ID_EX = {
-            "instr": nop,
-            "pc": 0,
-            "rd": None,
-            "rs1": None,
-            "rs2": None,
-            "rs1_val": None,
-            "rs2_val": None,
-            "imm": None
-        }
+        self.IF_ID.reset(self._nop, 0)
+        self.ID_EX.reset(self._nop, 0)
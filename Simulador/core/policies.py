@@ -0,0 +1,170 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+"""
+Module: policies
+Estrategias intercambiables del motor de pipeline (core/engine.py). Cada variante de procesador
+es una combinación de una política de riesgos, una de forwarding y una de control de saltos/flush,
+más un predictor de saltos opcional.
+
+Classes:
+- NoHazardDetection / HazardUnitPolicy: deciden si el ciclo actual debe insertar un stall.
+- NoForwarding / ForwardingUnit: caminos de bypass EX/MEM y MEM/WB hacia EX (solo temporización y
+  reporte: no sustituyen valores, ver ForwardingUnit).
+- RedirectOnTakenBranch / FlushOnMispredict: redirigen el PC (y vacían el pipeline) al inicio del ciclo.
+
+Example:
+    hazards = HazardUnitPolicy(HazardUnit())
+    if hazards.must_stall(pipeline):
+        pipeline.insert_stall()
+"""
+
+from components.hazard_unit import HazardUnit
+from InOut.trace import FLAG_FORWARD_A, FLAG_FORWARD_B
+
+
+class NoHazardDetection:
+    """
+    Class: NoHazardDetection
+    Sin unidad de riesgos: nunca se insertan stalls.
+    """
+    hazard_unit = None
+
+    def must_stall(self, pipeline) -> bool:
+        return False
+
+
+class HazardUnitPolicy:
+    """
+    Class: HazardUnitPolicy
+    Consulta la HazardUnit con los latches actuales e inserta un stall cuando ésta lo pide.
+
+    Attributes:
+    - hazard_unit: HazardUnit - unidad de detección de riesgos.
+    """
+    def __init__(self, hazard_unit: HazardUnit = None):
+        self.hazard_unit = hazard_unit if hazard_unit is not None else HazardUnit()
+
+    def must_stall(self, pipeline) -> bool:
+        """
+        Function: must_stall
+        Params:
+        - pipeline: Pipeline - latches del ciclo anterior.
+        Returns:
+        - bool: True si la instrucción en IF/ID debe esperar (stall).
+        """
+        return self.hazard_unit.detect_hazard(
+            pipeline.IF_ID,
+            pipeline.ID_EX,
+            pipeline.EX_MEM,
+            pipeline.MEM_WB
+        )["stall"]
+
+
+class NoForwarding:
+    """
+    Class: NoForwarding
+    Sin caminos de bypass: los operandos se leen solo del banco de registros en ID.
+    El motor no llama a forward() cuando enabled es False.
+    """
+    enabled = False
+
+    def forward(self, id_ex, pipeline) -> int:
+        return 0  # FLAG_FORWARD_A / FLAG_FORWARD_B aplicados (InOut/trace.py)
+
+
+class ForwardingUnit:
+    """
+    Class: ForwardingUnit
+    Forwarding desde EX/MEM (productor una instrucción adelante) y MEM/WB (dos adelante) hacia los
+    operandos de EX. Es el único componente que decide los caminos de bypass; con esta política
+    la HazardUnit solo pide stall en riesgos load-use.
+
+    En este simulador cada instrucción completa MEM y WB en el mismo ciclo en que pasa por EX, así
+    que el banco de registros ya contiene el valor del productor y EX nunca lee un dato viejo. Por
+    eso esta política no mueve valores: su efecto es de temporización (quita los stalls RAW entre
+    instrucciones de ALU en el conteo de ciclos) y de reporte (forward() devuelve la máscara de los
+    operandos que en el hardware real llegarían por bypass, para el evento "forward" y la traza).
+    """
+    enabled = True
+
+    def forward(self, id_ex, pipeline) -> int:
+        """
+        Function: forward
+        Params:
+        - id_ex: IDEXLatch - operandos de la instrucción que entra a EX (la de IF/ID).
+        - pipeline: Pipeline - latches ya avanzados: ID/EX y EX/MEM tienen a los productores.
+        Returns:
+        - int: FLAG_FORWARD_A si rs1 llegaría por bypass, FLAG_FORWARD_B si rs2 (InOut/trace.py).
+          Solo informa el camino; los operandos de EX no se modifican.
+        """
+        rs1 = id_ex.rs1
+        rs2 = id_ex.rs2
+        if not rs1 and not rs2:
+            return 0
+        mask = 0
+        for producer in (pipeline.ID_EX.instr, pipeline.EX_MEM.instr):
+            rd = producer.rd
+            if rd:
+                if rd == rs1:
+                    mask |= FLAG_FORWARD_A
+                if rd == rs2:
+                    mask |= FLAG_FORWARD_B
+        return mask
+
+
+class RedirectOnTakenBranch:
+    """
+    Class: RedirectOnTakenBranch
+    Procesadores sin predicción ni flush: si el salto que pasó por EX en el ciclo anterior
+    se tomó, IF continúa desde su destino. No se anulan instrucciones.
+    apply() devuelve False (nunca vacía el pipeline).
+    """
+    def apply(self, last_id_ex, last_ex_mem, if_stage, pipeline) -> bool:
+        if last_ex_mem is not None and last_id_ex.uop.predicted and last_ex_mem.branch_taken:
+            target = last_ex_mem.target_address
+            if target is not None:
+                if_stage.jump(target)
+        return False
+
+
+class FlushOnMispredict:
+    """
+    Class: FlushOnMispredict
+    Si EX marcó flush_required en el ciclo anterior (predicción errónea), IF salta al destino
+    real y se vacían IF/ID e ID/EX. Con follow_prediction=True, cuando no hay flush y ID predijo
+    "tomado", IF salta de inmediato al destino predicho. apply() devuelve True si vació el pipeline.
+
+    Attributes:
+    - follow_prediction: bool - seguir las predicciones "tomado" hechas en ID.
+    """
+    def __init__(self, follow_prediction: bool = True):
+        self.follow_prediction = follow_prediction
+
+    def apply(self, last_id_ex, last_ex_mem, if_stage, pipeline) -> bool:
+        if last_ex_mem is None:
+            return False
+        if last_ex_mem.flush_required:
+            # Mala predicción: continuar en el destino real, o tras el salto si no se tomó
+            if last_ex_mem.branch_taken:
+                target = last_ex_mem.target_address
+            else:
+                target = last_ex_mem.pc + 4
+            if target is not None:
+                if_stage.jump(target)
+            pipeline.flush()
+            return True
+        if self.follow_prediction and last_id_ex.uop.predicted and last_id_ex.predicted_taken:
+            # Predicción "tomado" hecha en ID: saltar al destino predicho
+            predicted_target = last_id_ex.predicted_target
+            if predicted_target is not None:
+                if_stage.jump(predicted_target)
+        return False
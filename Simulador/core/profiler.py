@@ -0,0 +1,138 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+import cProfile
+from time import perf_counter_ns
+
+# Sección → métodos medidos, como (atributo del procesador, método)
+PROFILE_SECTIONS = {
+    "fetch": (("if_stage", "fetch"),),
+    "decode": (("id_stage", "decode"),),
+    "execute": (("ex_stage", "execute"),),
+    "memory": (("mem_stage", "access"),),
+    "writeback": (("wb_stage", "write_back"),),
+    "hazards": (("hazard_policy", "must_stall"), ("forwarding_policy", "forward"), ("flush_policy", "apply")),
+    "metrics": (("metrics", "tick"), ("metrics", "track_writeback"), ("metrics", "track_branch"),
+                ("metrics", "track_simulated_time")),
+}
+
+"""
+Class: StageProfiler
+Perfilador opcional del motor: acumula el tiempo real del host (perf_counter_ns) que pasa en cada
+etapa (fetch/decode/execute/memory/writeback), en la detección de riesgos (hazards: stall,
+forwarding y flush) y en las métricas. No modifica el ciclo del motor: attach() reemplaza los
+métodos medidos por envolturas en los atributos de cada objeto y detach() las quita, así que
+sin perfilador el ciclo no paga nada.
+
+"cycle" es el tiempo total de _cycle y "otros" lo que queda fuera de las secciones (el propio
+motor, el reloj simulado, eventos y cachés). Los tiempos incluyen el costo de las envolturas.
+Opcionalmente graba un perfil de cProfile de toda la ejecución (dump_pstats); conviene pedirlo
+sin stages, porque cada medición infla a la otra.
+
+Attributes:
+- times: dict - sección → nanosegundos acumulados.
+- calls: dict - sección → llamadas.
+- stages: bool - medir las secciones (False = solo cProfile).
+- cprofile: cProfile.Profile o None - perfil detallado (con pstats=True).
+
+Methods:
+- attach / detach: Instalan y quitan las envolturas en un procesador.
+- report: Tiempos por sección como diccionario serializable.
+- dump_pstats: Escribe el perfil de cProfile (formato pstats).
+
+Example:
+    cpu.enable_profiling()
+    cpu.run()
+    cpu.disable_profiling()
+    print(cpu.metrics.to_dict()["perfil"])
+"""
+
+class StageProfiler:
+    def __init__(self, stages: bool = True, pstats: bool = False):
+        self.stages = stages
+        self.times = dict.fromkeys(("cycle", *PROFILE_SECTIONS), 0)
+        self.calls = dict.fromkeys(self.times, 0)
+        self.cprofile = cProfile.Profile() if pstats else None
+        self._wrapped = []
+
+    def _timed(self, section: str, method):
+        times = self.times
+        calls = self.calls
+        counter = perf_counter_ns
+
+        def timed(*args):
+            start = counter()
+            result = method(*args)
+            times[section] += counter() - start
+            calls[section] += 1
+            return result
+        return timed
+
+    def _wrap(self, owner, name: str, section: str):
+        method = getattr(owner, name, None)
+        if method is None:
+            return
+        setattr(owner, name, self._timed(section, method))
+        self._wrapped.append((owner, name))
+
+    def attach(self, cpu):
+        """
+        Function: attach
+        Envuelve los métodos de PROFILE_SECTIONS y el ciclo del procesador; arranca cProfile si corresponde.
+        Params:
+        - cpu: PipelineEngine - procesador a medir.
+        """
+        if self.stages:
+            self._wrap(cpu, "_cycle", "cycle")
+            for section, methods in PROFILE_SECTIONS.items():
+                for attribute, name in methods:
+                    self._wrap(getattr(cpu, attribute), name, section)
+        if self.cprofile is not None:
+            self.cprofile.enable()
+
+    def detach(self):
+        """
+        Function: detach
+        Quita las envolturas (vuelven los métodos de la clase) y detiene cProfile.
+        """
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        for owner, name in self._wrapped:
+            delattr(owner, name)
+        self._wrapped = []
+
+    def report(self) -> dict:
+        """
+        Function: report
+        Returns:
+        - dict: sección → {"ns", "llamadas", "porcentaje"} (porcentaje del tiempo de "cycle"),
+          más "otros" con el tiempo del ciclo fuera de las secciones.
+        """
+        total = self.times["cycle"]
+        sections = {name: ns for name, ns in self.times.items() if name != "cycle"}
+        report = {
+            name: {"ns": ns, "llamadas": self.calls[name],
+                   "porcentaje": (ns / total) * 100 if total else None}
+            for name, ns in sections.items()
+        }
+        other = max(total - sum(sections.values()), 0)
+        report["otros"] = {"ns": other, "llamadas": None, "porcentaje": (other / total) * 100 if total else None}
+        report["cycle"] = {"ns": total, "llamadas": self.calls["cycle"], "porcentaje": 100.0 if total else None}
+        return report
+
+    def dump_pstats(self, path: str):
+        """
+        Function: dump_pstats
+        Escribe el perfil de cProfile en path (leer con pstats o snakeviz).
+        """
+        if self.cprofile is None:
+            raise RuntimeError("El perfilador se creó sin cProfile (pstats=False)")
+        self.cprofile.dump_stats(path)
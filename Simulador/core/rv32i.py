@@ -0,0 +1,277 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from core.instruction import Instruction, InstructionType
+
+"""
+Tabla: ENCODINGS
+Codificación RV32I de cada mnemónico soportado: (formato, opcode, funct3, funct7). funct3 y
+funct7 valen None cuando el formato no los usa. Los formatos son los de la especificación más
+dos variantes del tipo I según el texto de la instrucción:
+- "I_SHIFT": slli/srli/srai (shamt de 5 bits, funct7 en imm[11:5]).
+- "I_MEM": loads y jalr ("rd, imm(rs1)").
+"""
+ENCODINGS = {
+    "add": ("R", 0b0110011, 0b000, 0b0000000),
+    "sub": ("R", 0b0110011, 0b000, 0b0100000),
+    "sll": ("R", 0b0110011, 0b001, 0b0000000),
+    "slt": ("R", 0b0110011, 0b010, 0b0000000),
+    "xor": ("R", 0b0110011, 0b100, 0b0000000),
+    "srl": ("R", 0b0110011, 0b101, 0b0000000),
+    "sra": ("R", 0b0110011, 0b101, 0b0100000),
+    "or": ("R", 0b0110011, 0b110, 0b0000000),
+    "and": ("R", 0b0110011, 0b111, 0b0000000),
+    "addi": ("I", 0b0010011, 0b000, None),
+    "slti": ("I", 0b0010011, 0b010, None),
+    "ori": ("I", 0b0010011, 0b110, None),
+    "andi": ("I", 0b0010011, 0b111, None),
+    "slli": ("I_SHIFT", 0b0010011, 0b001, 0b0000000),
+    "srli": ("I_SHIFT", 0b0010011, 0b101, 0b0000000),
+    "srai": ("I_SHIFT", 0b0010011, 0b101, 0b0100000),
+    "lb": ("I_MEM", 0b0000011, 0b000, None),
+    "lh": ("I_MEM", 0b0000011, 0b001, None),
+    "lw": ("I_MEM", 0b0000011, 0b010, None),
+    "lbu": ("I_MEM", 0b0000011, 0b100, None),
+    "lhu": ("I_MEM", 0b0000011, 0b101, None),
+    "jalr": ("I_MEM", 0b1100111, 0b000, None),
+    "sb": ("S", 0b0100011, 0b000, None),
+    "sh": ("S", 0b0100011, 0b001, None),
+    "sw": ("S", 0b0100011, 0b010, None),
+    "beq": ("B", 0b1100011, 0b000, None),
+    "bne": ("B", 0b1100011, 0b001, None),
+    "blt": ("B", 0b1100011, 0b100, None),
+    "bge": ("B", 0b1100011, 0b101, None),
+    "bltu": ("B", 0b1100011, 0b110, None),
+    "bgeu": ("B", 0b1100011, 0b111, None),
+    "jal": ("J", 0b1101111, None, None),
+    "lui": ("U", 0b0110111, None, None),
+    "auipc": ("U", 0b0010111, None, None),
+}
+
+# nop se codifica como la instrucción canónica de RV32I, addi x0, x0, 0
+NOP_WORD = 0x00000013
+
+# Formato → tipo de Instruction
+_TYPE_BY_FORMAT = {
+    "R": InstructionType.R_TYPE, "I": InstructionType.I_TYPE, "I_SHIFT": InstructionType.I_TYPE,
+    "I_MEM": InstructionType.I_TYPE, "S": InstructionType.S_TYPE, "B": InstructionType.B_TYPE,
+    "J": InstructionType.J_TYPE, "U": InstructionType.U_TYPE,
+}
+
+# Formato → (mínimo, máximo, múltiplo) del inmediato codificable. El de tipo U es el campo de 20 bits
+# sin signo (0 a 0xFFFFF); también se aceptan negativos de 20 bits, que se enmascaran.
+_IMM_RANGES = {
+    "I": (-2048, 2047, 1), "I_MEM": (-2048, 2047, 1), "S": (-2048, 2047, 1),
+    "I_SHIFT": (0, 31, 1), "B": (-4096, 4094, 2), "J": (-(1 << 20), (1 << 20) - 2, 2),
+    "U": (-(1 << 19), 0xFFFFF, 1),
+}
+
+"""
+Tabla: DECODE_TABLE
+(opcode, funct3, funct7) → mnemónico, con None en los campos que el formato no usa. decode()
+busca primero la clave completa, luego sin funct7 y por último solo con el opcode.
+"""
+DECODE_TABLE = {(opcode, funct3, funct7): name for name, (_, opcode, funct3, funct7) in ENCODINGS.items()}
+
+
+def _sign_extend(value: int, bits: int) -> int:
+    sign = 1 << (bits - 1)
+    return (value & (sign - 1)) - (value & sign)
+
+
+def encode(instr: Instruction) -> int:
+    """
+    Function: encode
+    Codifica una instrucción parseada como palabra RV32I de 32 bits.
+    Params:
+    - instr: Instruction - instrucción válida.
+    Returns:
+    - int: palabra sin signo (0 a 2**32 - 1).
+    Restriction:
+    Lanza ValueError si el mnemónico no tiene codificación o el inmediato no cabe en su campo.
+    Example:
+        encode(Instruction("addi x1, x0, 5", 0))  # 0x00500093
+    """
+    if instr.opcode == "nop":
+        return NOP_WORD
+    encoding = ENCODINGS.get(instr.opcode)
+    if encoding is None:
+        raise ValueError(f"Instrucción sin codificación RV32I en PC={instr.address}: {instr.opcode}")
+    fmt, opcode, funct3, funct7 = encoding
+    rd = instr.rd or 0
+    rs1 = instr.rs1 or 0
+    rs2 = instr.rs2 or 0
+    imm = instr.imm or 0
+    if fmt != "R":
+        low, high, step = _IMM_RANGES[fmt]
+        if not low <= imm <= high or imm % step:
+            raise ValueError(f"Inmediato fuera de rango para {instr.opcode} en PC={instr.address}: {imm}")
+
+    if fmt == "R":
+        return funct7 << 25 | rs2 << 20 | rs1 << 15 | funct3 << 12 | rd << 7 | opcode
+    if fmt == "I_SHIFT":
+        return funct7 << 25 | imm << 20 | rs1 << 15 | funct3 << 12 | rd << 7 | opcode
+    if fmt in ("I", "I_MEM"):
+        return (imm & 0xFFF) << 20 | rs1 << 15 | funct3 << 12 | rd << 7 | opcode
+    if fmt == "S":
+        imm &= 0xFFF
+        return (imm >> 5) << 25 | rs2 << 20 | rs1 << 15 | funct3 << 12 | (imm & 0x1F) << 7 | opcode
+    if fmt == "B":
+        imm &= 0x1FFF
+        return ((imm >> 12) << 31 | ((imm >> 5) & 0x3F) << 25 | rs2 << 20 | rs1 << 15 | funct3 << 12
+                | ((imm >> 1) & 0xF) << 8 | ((imm >> 11) & 1) << 7 | opcode)
+    if fmt == "J":
+        imm &= 0x1FFFFF
+        return ((imm >> 20) << 31 | ((imm >> 1) & 0x3FF) << 21 | ((imm >> 11) & 1) << 20
+                | ((imm >> 12) & 0xFF) << 12 | rd << 7 | opcode)
+    return (imm & 0xFFFFF) << 12 | rd << 7 | opcode  # U
+
+
+def decode(word: int, address: int = 0) -> Instruction:
+    """
+    Function: decode
+    Decodifica una palabra RV32I con DECODE_TABLE. Los campos se extraen directamente de los bits
+    (sin volver a parsear texto); raw_text queda con el desensamblado.
+    Params:
+    - word: int - palabra de 32 bits.
+    - address: int - dirección de la instrucción (PC).
+    Returns:
+    - Instruction: instrucción decodificada.
+    Restriction:
+    Lanza ValueError si la palabra no es una instrucción soportada (por ejemplo 0, el fin del programa).
+    NOP_WORD se decodifica como nop, no como addi x0, x0, 0.
+    Example:
+        decode(0x00500093).raw_text  # "addi x1, x0, 5"
+    """
+    word &= 0xFFFFFFFF
+    if word == NOP_WORD:
+        return Instruction("nop", address)
+    opcode = word & 0x7F
+    funct3 = (word >> 12) & 0x7
+    funct7 = word >> 25
+    name = (DECODE_TABLE.get((opcode, funct3, funct7)) or DECODE_TABLE.get((opcode, funct3, None))
+            or DECODE_TABLE.get((opcode, None, None)))
+    if name is None:
+        raise ValueError(f"Palabra no decodificable en PC={address}: {word:#010x}")
+    fmt = ENCODINGS[name][0]
+    rd = (word >> 7) & 0x1F
+    rs1 = (word >> 15) & 0x1F
+    rs2 = (word >> 20) & 0x1F
+
+    if fmt == "R":
+        return Instruction.from_fields(f"{name} x{rd}, x{rs1}, x{rs2}", address, name, _TYPE_BY_FORMAT[fmt],
+                                       rd=rd, rs1=rs1, rs2=rs2)
+    if fmt == "I_SHIFT":
+        return Instruction.from_fields(f"{name} x{rd}, x{rs1}, {rs2}", address, name, _TYPE_BY_FORMAT[fmt],
+                                       rd=rd, rs1=rs1, imm=rs2)
+    if fmt == "I":
+        imm = _sign_extend(word >> 20, 12)
+        return Instruction.from_fields(f"{name} x{rd}, x{rs1}, {imm}", address, name, _TYPE_BY_FORMAT[fmt],
+                                       rd=rd, rs1=rs1, imm=imm)
+    if fmt == "I_MEM":
+        imm = _sign_extend(word >> 20, 12)
+        return Instruction.from_fields(f"{name} x{rd}, {imm}(x{rs1})", address, name, _TYPE_BY_FORMAT[fmt],
+                                       rd=rd, rs1=rs1, imm=imm)
+    if fmt == "S":
+        imm = _sign_extend((word >> 25) << 5 | rd, 12)
+        return Instruction.from_fields(f"{name} x{rs2}, {imm}(x{rs1})", address, name, _TYPE_BY_FORMAT[fmt],
+                                       rs1=rs1, rs2=rs2, imm=imm)
+    if fmt == "B":
+        imm = _sign_extend((word >> 31) << 12 | ((word >> 7) & 1) << 11 | ((word >> 25) & 0x3F) << 5
+                           | ((word >> 8) & 0xF) << 1, 13)
+        return Instruction.from_fields(f"{name} x{rs1}, x{rs2}, {imm}", address, name, _TYPE_BY_FORMAT[fmt],
+                                       rs1=rs1, rs2=rs2, imm=imm)
+    if fmt == "J":
+        imm = _sign_extend((word >> 31) << 20 | ((word >> 12) & 0xFF) << 12 | ((word >> 20) & 1) << 11
+                           | ((word >> 21) & 0x3FF) << 1, 21)
+        return Instruction.from_fields(f"{name} x{rd}, {imm}", address, name, _TYPE_BY_FORMAT[fmt],
+                                       rd=rd, imm=imm)
+    imm = word >> 12  # U: campo de 20 bits sin signo, como lo deja Instruction al parsear
+    return Instruction.from_fields(f"{name} x{rd}, {imm}", address, name, _TYPE_BY_FORMAT[fmt], rd=rd, imm=imm)
+
+
+def to_memory_word(instr: Instruction):
+    """
+    Function: to_memory_word
+    Valor a guardar en la memoria de instrucciones: la palabra RV32I, o la propia Instruction si no
+    se puede codificar (inmediato fuera del rango del formato, por ejemplo addi x1, x0, 5000 o un
+    salto a una etiqueta lejana), para que esos programas se sigan ejecutando igual. Solo esas
+    instrucciones ocupan un objeto (InstructionMemory.extended); no se pueden guardar en un .bin.
+    Returns:
+    - int o Instruction.
+    """
+    try:
+        return encode(instr)
+    except ValueError:
+        if instr.op is None:
+            raise  # Mnemónico no soportado: no es un problema de rango
+        return instr
+
+
+def from_memory_word(value, address: int) -> Instruction:
+    """
+    Function: from_memory_word
+    Convierte el contenido de la memoria de instrucciones en una Instruction: decodifica las
+    palabras y deja pasar las Instruction sin codificación tal cual.
+    Restriction:
+    Lanza ValueError si la palabra no es decodificable (las etapas lo toman como fin del programa).
+    """
+    if isinstance(value, Instruction):
+        return value
+    return decode(value, address)
+
+
+def store_instruction(instr: Instruction, instr_mem, decode_cache=None):
+    """
+    Function: store_instruction
+    Guarda una instrucción ya parseada en su dirección de la memoria de instrucciones (ver
+    to_memory_word) y llena su micro-op en la caché de decodificación.
+    Params:
+    - instr: Instruction - instrucción válida (address = su PC).
+    - instr_mem: InstructionMemory - memoria destino (ya dimensionada).
+    - decode_cache: DecodeCache o None.
+    Returns:
+    - int o Instruction: valor guardado.
+    Restriction:
+    Lanza ValueError si el mnemónico no tiene codificación RV32I.
+    """
+    word = to_memory_word(instr)
+    instr_mem.store_word(instr.address, word)
+    if decode_cache is not None:
+        decode_cache.fill(instr.address, instr, word)
+    return word
+
+
+def load_words(words, instr_mem, decode_cache=None, start_address: int = 0) -> int:
+    """
+    Function: load_words
+    Carga código máquina en la memoria de instrucciones y pre-decodifica las palabras válidas en la
+    caché de decodificación (las que no decodifican quedan sin micro-op: datos o fin del programa).
+    Params:
+    - words: list[int] - palabras RV32I.
+    - instr_mem: InstructionMemory - memoria destino (crece si hace falta).
+    - decode_cache: DecodeCache o None.
+    - start_address: int - dirección de la primera palabra.
+    Returns:
+    - int: cantidad de palabras cargadas.
+    Example:
+        load_words(ProgramLoader.load_binary("programa.bin"), cpu.instr_mem, cpu.decode_cache)
+    """
+    instr_mem.ensure_words((start_address >> 2) + len(words))
+    instr_mem.load_program(words, start_address)
+    if decode_cache is not None:
+        for offset, word in enumerate(words):
+            pc = start_address + offset * 4
+            try:
+                decode_cache.fill_word(pc, word)
+            except ValueError:
+                continue
+    return len(words)
@@ -1,71 +1,254 @@
 """
 SimulatorManager: ejecuta múltiples versiones del procesador RISC-V en paralelo
 para comparar sus resultados (básico, sin hazards, completo).
+Las ejecuciones sin GUI (run_headless, run_parallel, run_batch) se reparten entre procesos con
+ProcessPoolExecutor y devuelven registros serializables (diccionarios de tipos básicos).
 """
 
 import copy
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 from core.processor import Processor
 from core.processor_basic import ProcessorBasic
 from core.processor_no_hazards import ProcessorNoHazards
 from core.processor_no_predictor import ProcessorNoPredictor
+from core.functional import FunctionalSimulator
+from InOut.program_loader import ProgramLoader
 from InOut.metrics import Metrics
 from InOut.execution_history import ExecutionHistory
+from core.events import ConsoleLogger, INFO
+
+# Mismo orden que SimulatorManager.CPU_NAMES
+CPU_CLASSES = [ProcessorBasic, ProcessorNoHazards, ProcessorNoPredictor, Processor]
+CPU_CONFIGS = [
+    {"Hazards": False, "Predictor": False},
+    {"Hazards": False, "Predictor": True},
+    {"Hazards": True, "Predictor": False},
+    {"Hazards": True, "Predictor": True}
+]
+
+
+def run_cpu_silently(cpu, max_cycles: int = None) -> bool:
+    """
+    Function: run_cpu_silently
+    Avanza el procesador ciclo a ciclo sin salida por consola (nadie se suscribe a sus eventos).
+    Returns:
+    - bool: True si el pipeline terminó, False si se alcanzó max_cycles.
+    """
+    if max_cycles is None:
+        while not cpu.run_one_cycle():
+            pass
+        return True
+    while cpu.metrics.ciclos_totales < max_cycles:
+        if cpu.run_one_cycle():
+            return True
+    cpu.metrics.stop_timer()
+    return cpu.pipeline.is_done()
+
+
+def load_job_program(target, job: dict):
+    """
+    Function: load_job_program
+    Carga el programa de un trabajo: las líneas de program_lines si vienen, si no el archivo
+    program (.s/.asm ensamblado directo a memoria con load_program_file, .bin con load_binary_file).
+    Params:
+    - target: PipelineEngine o FunctionalSimulator - destino del programa.
+    - job: dict - trabajo de simulate_job.
+    """
+    lines = job.get("program_lines")
+    if lines is not None:
+        target.load_program(lines)
+    elif os.path.splitext(job["program"])[1] in ProgramLoader.BINARY_EXTENSIONS:
+        target.load_binary_file(job["program"])
+    else:
+        target.load_program_file(job["program"])
+
+
+def simulate_job(job: dict) -> dict:
+    """
+    Function: simulate_job
+    Ejecuta una combinación programa × procesador y devuelve su registro de resultados.
+    Es una función de módulo para que ProcessPoolExecutor pueda enviarla a otros procesos.
+    Params:
+    - job: dict - claves: index, program, program_lines (None = cargar el archivo program),
+      memory_options, max_cycles, registers, memory, include_state, trace_path (traza binaria
+      opcional, InOut/trace.py) y fast_forward (instrucciones a ejecutar en modo funcional antes de
+      pasar al pipeline), profile (tiempo del host por etapa en "perfil") y pstats_path (perfil de
+      cProfile opcional).
+    Returns:
+    - dict: métricas, configuración, registros finales y resumen (SHA-256) de la memoria de datos.
+      Si el programa no se pudo cargar, solo programa, procesador, clave y "error" (el mensaje).
+    Example:
+        record = simulate_job({"index": 3, "program": "p.s", "program_lines": lines})
+        record = simulate_job({"index": 3, "program": "programa.s", "program_lines": None})
+    """
+    idx = job["index"]
+    memory_options = job.get("memory_options", {})
+    cpu = CPU_CLASSES[idx](**memory_options)
+    target = cpu
+    if job.get("fast_forward"):
+        # Las primeras instrucciones corren en modo funcional y su estado pasa luego al pipeline
+        target = FunctionalSimulator(memory_options.get("instr_mem_words"),
+                                     memory_options.get("data_mem_words"),
+                                     memory_options.get("sparse_memory"))
+    try:
+        load_job_program(target, job)
+    except (OSError, ValueError) as e:
+        return {
+            "programa": job.get("program"),
+            "procesador": SimulatorManager.CPU_NAMES[idx],
+            "clave": SimulatorManager.CPU_KEYS[idx],
+            "error": str(e),
+        }
+    if job.get("registers"):
+        target.preload_registers(job["registers"])
+    if job.get("memory"):
+        target.preload_data_memory(job["memory"])
+    if target is not cpu:
+        target.run(job["fast_forward"])
+        target.handoff(cpu)
+    if job.get("trace_path"):
+        cpu.start_trace(job["trace_path"])
+    if job.get("profile") or job.get("pstats_path"):
+        cpu.enable_profiling(stages=bool(job.get("profile")), pstats=bool(job.get("pstats_path")))
+    try:
+        completed = run_cpu_silently(cpu, job.get("max_cycles"))
+    finally:
+        cpu.stop_trace()
+        cpu.disable_profiling(job.get("pstats_path"))
+    record = build_record(idx, cpu, completed, job.get("include_state"), job.get("program"))
+    if job.get("trace_path"):
+        record["traza"] = job["trace_path"]
+    if target is not cpu:
+        record["instrucciones_adelantadas"] = target.instructions
+    if job.get("pstats_path"):
+        record["pstats"] = job["pstats_path"]
+    return record
+
+
+def pipeline_strings(pipeline) -> dict:
+    """
+    Function: pipeline_strings
+    Describe cada latch del pipeline como texto "instrucción @ PC=0x..." (formato de ViewStatus).
+    Params:
+    - pipeline: Pipeline - pipeline del procesador.
+    Returns:
+    - dict: IF_ID, ID_EX, EX_MEM, MEM_WB → texto.
+    """
+    return {
+        stage: (str(latch.instr) if latch.instr is not None else "nop")
+               + (f" @ PC={latch.pc:#x}" if latch.pc is not None else "")
+        for stage, latch in (("IF_ID", pipeline.IF_ID), ("ID_EX", pipeline.ID_EX),
+                             ("EX_MEM", pipeline.EX_MEM), ("MEM_WB", pipeline.MEM_WB))
+    }
+
+
+def build_record(idx: int, cpu, completed: bool, include_state: bool = False, program: str = None) -> dict:
+    """
+    Function: build_record
+    Arma el registro de resultados (solo tipos básicos, serializable y picklable) de un procesador.
+    Params:
+    - idx: int - índice del procesador en CPU_NAMES.
+    - cpu: PipelineEngine - procesador ya ejecutado.
+    - completed: bool - True si el pipeline terminó.
+    - include_state: bool - incluir memoria (palabras no nulas), PC y pipeline finales.
+    - program: str o None - nombre del programa ejecutado.
+    Returns:
+    - dict: métricas, configuración, registros finales y resumen (SHA-256) de la memoria de datos.
+    """
+    record = {
+        "programa": program,
+        "procesador": SimulatorManager.CPU_NAMES[idx],
+        "clave": SimulatorManager.CPU_KEYS[idx],
+        "config": dict(CPU_CONFIGS[idx]),
+        "completado": completed,
+    }
+    record.update(cpu.metrics.to_dict())
+    record["registros"] = cpu.registers.dump()
+    record["memoria_digest"] = cpu.data_mem.digest()
+    if include_state:
+        record["memoria"] = {addr: value for addr, value in cpu.data_mem.dump().items() if value}
+        record["pc"] = cpu.pipeline.IF_ID.pc
+        record["pipeline"] = pipeline_strings(cpu.pipeline)
+    return record
+
 
 class SimulatorManager:
     """
     active_indices: lista de índices de procesadores activos (ej: [0,3])
-    0: Básico (sin unidad de riesgos)
-    1: Con unidad de riesgos
-    2: Con predicción de saltos
-    3: Completo (unidad de riesgos + predicción de saltos)
+    0: Básico (sin unidad de riesgos, sin forwarding ni predicción)
+    1: Sin unidad de riesgos (sin stalls ni forwarding), redirección en saltos tomados
+    2: Con unidad de riesgos (stalls RAW y load-use, sin forwarding), sin predicción
+    3: Completo (unidad de riesgos + forwarding + predicción de saltos)
     """
     # --- Agrega la variable de clase para los nombres ---
     CPU_NAMES = [
         "Procesador Básico (sin hazards ni predicción)",
-        "Procesador Sin Hazards (con forwarding)",
+        "Procesador Sin Hazards (sin forwarding)",
         "Procesador Sin Predictor (con hazards)",
         "Procesador Completo"
     ]
+    # Nombres cortos para la línea de comandos (mismo orden que CPU_NAMES)
+    CPU_KEYS = ["basic", "no_hazards", "no_predictor", "full"]
 
-    def __init__(self, program_lines: list[str], active_indices=None):
+    def __init__(self, program_lines: list[str], active_indices=None, instr_mem_words: int = None,
+                 data_mem_words: int = None, sparse_memory: bool = None, caches: bool = None):
+        """
+        instr_mem_words / data_mem_words: tamaño de las memorias en palabras (None = config.py).
+        sparse_memory: True para usar memoria de datos dispersa (páginas de 4 KiB bajo demanda).
+        caches: True para modelar la jerarquía de cachés de config.py (None = CACHES_ENABLED).
+        """
         self.program_lines = program_lines
+        self.memory_options = {
+            "instr_mem_words": instr_mem_words,
+            "data_mem_words": data_mem_words,
+            "sparse_memory": sparse_memory,
+            "caches": caches,
+        }
         if active_indices is None:
             active_indices = [0, 3]  # por defecto: básico y completo
 
         self.active_indices = active_indices
 
         # Diccionario de procesadores y sus metadatos
-        self.cpu_classes = [
-            ProcessorBasic,         # 0
-            ProcessorNoHazards,     # 1
-            ProcessorNoPredictor,   # 2
-            Processor               # 3
-        ]
+        self.cpu_classes = CPU_CLASSES  # 0: básico, 1: sin hazards, 2: sin predictor, 3: completo
         # Cambia a usar la variable de clase
         self.cpu_names = SimulatorManager.CPU_NAMES
-        self.cpu_configs = [
-            {"Hazards": False, "Predictor": False},
-            {"Hazards": False, "Predictor": True},
-            {"Hazards": True, "Predictor": False},
-            {"Hazards": True, "Predictor": True}
-        ]
+        self.cpu_configs = CPU_CONFIGS
 
         # Instanciar solo los procesadores seleccionados
         self.cpus = []
         self.metrics = []
         for idx in self.active_indices:
-            cpu = self.cpu_classes[idx]()
+            cpu = self.cpu_classes[idx](**self.memory_options)
             self.cpus.append(cpu)
             self.metrics.append(Metrics(name=self.cpu_names[idx]))
 
         #Historial de ejecuciones
         self.history = ExecutionHistory(num_procs=len(self.cpus))
 
-    def load_and_run(self, modo="full", delay_seg=1.0):
+    def load_and_run(self, modo="full", delay_seg=1.0, parallel=False, logger: ConsoleLogger = None):
         # Ejecutar los procesadores seleccionados (asumiendo que ya tienen el programa cargado)
+        # La salida por consola la hace un ConsoleLogger suscrito a los eventos de cada procesador
+        logger = logger if logger is not None else ConsoleLogger()
+        if parallel:
+            # Cada procesador corre en su propio proceso; no hay salida paso a paso
+            for idx, record in zip(self.active_indices, self.run_parallel()):
+                if "error" in record:
+                    logger.log(INFO, f"Error al ejecutar {self.cpu_names[idx]}: {record['error']}")
+                    continue
+                self.history.add_execution(
+                    processor_name=self.cpu_names[idx],
+                    metrics=record,
+                    config=self.cpu_configs[idx]
+                )
+            logger.log(INFO, "\n=== Comparación completada ===")
+            return
         for i, idx in enumerate(self.active_indices):
             cpu = self.cpus[i]
-            print(f"\n=== Ejecutando {self.cpu_names[idx]} ===")
+            logger.log(INFO, f"\n=== Ejecutando {self.cpu_names[idx]} ===")
+            logger.attach(cpu)
             try:
                 cpu.run(modo=modo, delay_seg=delay_seg)
                 self.history.add_execution(
@@ -74,5 +257,127 @@ class SimulatorManager:
                     config=self.cpu_configs[idx]
                 )
             except Exception as e:
-                print(f"Error al ejecutar {self.cpu_names[idx]}: {e}")
-        print("\n=== Comparación completada ===")
+                logger.log(INFO, f"Error al ejecutar {self.cpu_names[idx]}: {e}")
+            finally:
+                logger.detach(cpu)
+        logger.log(INFO, "\n=== Comparación completada ===")
+
+    def run_headless(self, max_cycles: int = None, registers: dict = None, memory: dict = None,
+                     include_state: bool = False, max_workers: int = 1) -> list[dict]:
+        """
+        Ejecuta los procesadores seleccionados sin GUI ni salida por consola y devuelve un registro
+        (diccionario serializable) por procesador, en el orden de active_indices.
+        Params:
+        - max_cycles: int o None - corta la ejecución al llegar a esta cantidad de ciclos.
+        - registers: dict o None - valores iniciales de registros (nombre o número → valor).
+        - memory: dict o None - palabras iniciales de memoria de datos (dirección → valor).
+        - include_state: bool - incluir memoria de datos (palabras no nulas) y pipeline finales.
+        - max_workers: int o None - procesos a usar; 1 ejecuta en este mismo proceso.
+        Returns:
+        - list[dict]: un registro por procesador activo.
+        """
+        return self.run_batch([(None, self.program_lines)], self.active_indices,
+                              max_cycles=max_cycles, registers=registers, memory=memory,
+                              include_state=include_state, max_workers=max_workers,
+                              **self.memory_options)
+
+    def run_parallel(self, max_cycles: int = None, registers: dict = None, memory: dict = None,
+                     include_state: bool = False, max_workers: int = None) -> list[dict]:
+        """
+        Igual que run_headless, pero cada procesador corre en su propio proceso.
+        """
+        return self.run_headless(max_cycles, registers, memory, include_state, max_workers)
+
+    @staticmethod
+    def output_stems(programs: list) -> list[str]:
+        """
+        Devuelve el nombre base de los archivos de salida de cada programa de un lote: el nombre
+        del archivo sin extensión, más un hash corto de la ruta completa si otro programa del lote
+        tiene el mismo nombre (/a/p.s y /b/p.s), y su posición si la misma ruta se repite.
+        Example:
+            SimulatorManager.output_stems(["/a/p.s", "/b/p.s"])  # ["p_a8b31910", "p_3b1f6a21"]
+        """
+        stems = [os.path.splitext(os.path.basename(program or "programa"))[0] for program in programs]
+        paths = [os.path.abspath(program) if program else "" for program in programs]
+        unique = []
+        for position, (stem, path) in enumerate(zip(stems, paths)):
+            if stems.count(stem) > 1:
+                stem = f"{stem}_{hashlib.sha1(path.encode()).hexdigest()[:8]}"
+                if paths.count(path) > 1:
+                    stem = f"{stem}_{position}"
+            unique.append(stem)
+        return unique
+
+    @classmethod
+    def output_path(cls, directory: str, stem: str, idx: int, extension: str) -> str:
+        """
+        Devuelve la ruta de un archivo de salida por programa y procesador: <directory>/<stem>_<clave><extension>
+        (stem de output_stems).
+        """
+        return os.path.join(directory, f"{stem}_{cls.CPU_KEYS[idx]}{extension}")
+
+    @classmethod
+    def trace_path(cls, trace_dir: str, stem: str, idx: int) -> str:
+        """
+        Devuelve la ruta de la traza de un programa en un procesador: <trace_dir>/<stem>_<clave>.rvtrace.
+        """
+        return cls.output_path(trace_dir, stem, idx, ".rvtrace")
+
+    @classmethod
+    def run_batch(cls, programs: list, active_indices: list, max_cycles: int = None,
+                  registers: dict = None, memory: dict = None, include_state: bool = False,
+                  max_workers: int = None, instr_mem_words: int = None, data_mem_words: int = None,
+                  sparse_memory: bool = None, trace_dir: str = None, caches: bool = None,
+                  fast_forward: int = None, profile: bool = False, pstats_dir: str = None) -> list[dict]:
+        """
+        Ejecuta cada programa en cada procesador seleccionado (programas × configuraciones),
+        repartiendo los trabajos en un ProcessPoolExecutor.
+        Params:
+        - programs: list - pares (nombre, líneas del programa). Con líneas None el nombre es la ruta
+          de un archivo .s/.asm o .bin, que cada trabajo carga directo a su memoria de instrucciones
+          (un registro con "error" si no se puede cargar).
+        - active_indices: list[int] - procesadores a ejecutar (índices de CPU_NAMES).
+        - max_workers: int o None - procesos (None = núcleos disponibles, 1 = sin procesos extra).
+        - trace_dir: str o None - carpeta donde grabar una traza binaria por combinación
+          (<programa>_<clave>.rvtrace; ver output_stems si dos programas se llaman igual).
+        - fast_forward: int o None - instrucciones ejecutadas en modo funcional (core/functional.py)
+          antes de continuar con el pipeline; las métricas cubren solo la parte con pipeline.
+        - profile: bool - medir el tiempo del host por etapa (core/profiler.py, clave "perfil").
+        - pstats_dir: str o None - carpeta donde escribir un perfil de cProfile por combinación
+          (<programa>_<clave>.pstats).
+        - resto: como en run_headless y __init__.
+        Returns:
+        - list[dict]: registros en orden programa → procesador.
+        Example:
+            records = SimulatorManager.run_batch([("p.s", lines)], [0, 3])
+            records = SimulatorManager.run_batch([("programa.s", None)], [0, 3])
+        """
+        memory_options = {
+            "instr_mem_words": instr_mem_words,
+            "data_mem_words": data_mem_words,
+            "sparse_memory": sparse_memory,
+            "caches": caches,
+        }
+        stems = cls.output_stems([name for name, _ in programs])
+        jobs = [
+            {
+                "index": idx,
+                "program": name,
+                "program_lines": lines,
+                "memory_options": memory_options,
+                "max_cycles": max_cycles,
+                "registers": registers,
+                "memory": memory,
+                "include_state": include_state,
+                "trace_path": cls.trace_path(trace_dir, stem, idx) if trace_dir else None,
+                "fast_forward": fast_forward,
+                "profile": profile,
+                "pstats_path": cls.output_path(pstats_dir, stem, idx, ".pstats") if pstats_dir else None,
+            }
+            for (name, lines), stem in zip(programs, stems)
+            for idx in active_indices
+        ]
+        if max_workers == 1 or len(jobs) <= 1:
+            return [simulate_job(job) for job in jobs]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(simulate_job, jobs))
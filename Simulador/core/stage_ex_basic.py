@@ -2,106 +2,57 @@
 ExecuteStageBasic: Etapa EX sin predicción de saltos
 """
 
-import time
+from components.clock import SimulatedClock
+from core.latches import IDEXLatch, EXMEMLatch
+from core.instruction import Opcode
 from config import LATENCY_EX
 
 class ExecuteStageBasic:
-    def __init__(self, latency: float = None):
+    def __init__(self, latency: float = None, clock: SimulatedClock = None):
         """
         Versión básica de la etapa EX: sin lógica de predicción de saltos.
         """
         self.latency = latency if latency is not None else LATENCY_EX
+        self.clock = clock if clock is not None else SimulatedClock()
+        self.out = EXMEMLatch()  # Latch EX/MEM reutilizado en cada ciclo
 
-    def execute(self, id_ex: dict) -> dict:
-        instr = id_ex["instr"]
-        opcode = instr.opcode
+    def execute(self, id_ex: IDEXLatch) -> EXMEMLatch:
+        uop = id_ex.uop  # Micro-op pre-decodificada (caché de decodificación)
+        instr = id_ex.instr
+        opcode = uop.op
 
-        alu_result = 0
         branch_taken = False
         target_address = None
 
-        rs1_val = id_ex.get("rs1_val", 0)
-        rs2_val = id_ex.get("rs2_val", 0)
-        imm = id_ex.get("imm", 0)
-        pc = id_ex["pc"]
+        rs1_val = id_ex.rs1_val
+        rs2_val = id_ex.rs2_val
+        imm = uop.imm
+        pc = id_ex.pc
 
-        if opcode == "add":
-            alu_result = rs1_val + rs2_val
-        elif opcode == "sub":
-            alu_result = rs1_val - rs2_val
-        elif opcode == "and":
-            alu_result = rs1_val & rs2_val
-        elif opcode == "or":
-            alu_result = rs1_val | rs2_val
-        elif opcode == "xor":
-            alu_result = rs1_val ^ rs2_val
-        elif opcode == "slt":
-            alu_result = int(rs1_val < rs2_val)
-        elif opcode == "sll":
-            alu_result = rs1_val << (rs2_val & 0x1F)
-        elif opcode == "srl":
-            alu_result = (rs1_val % (1 << 32)) >> (rs2_val & 0x1F)
-        elif opcode == "sra":
-            alu_result = rs1_val >> (rs2_val & 0x1F)
-        elif opcode == "addi":
-            alu_result = rs1_val + imm
-        elif opcode == "andi":
-            alu_result = rs1_val & imm
-        elif opcode == "ori":
-            alu_result = rs1_val | imm
-        elif opcode == "slti":
-            alu_result = int(rs1_val < imm)
-        elif opcode == "slli":
-            alu_result = rs1_val << (imm & 0x1F)
-        elif opcode == "srli":
-            alu_result = (rs1_val % (1 << 32)) >> (imm & 0x1F)
-        elif opcode == "srai":
-            alu_result = rs1_val >> (imm & 0x1F)
-        elif opcode in {"lw", "sw"}:
-            alu_result = rs1_val + imm
-        elif opcode == "beq":
-            branch_taken = rs1_val == rs2_val
-            target_address = pc + imm
-        elif opcode == "bne":
-            branch_taken = rs1_val != rs2_val
-            target_address = pc + imm
-        elif opcode == "blt":
-            branch_taken = rs1_val < rs2_val
-            target_address = pc + imm
-        elif opcode == "bge":
-            branch_taken = rs1_val >= rs2_val
-            target_address = pc + imm
-        elif opcode == "bltu":
-            branch_taken = (rs1_val & 0xFFFFFFFF) < (rs2_val & 0xFFFFFFFF)
-            target_address = pc + imm
-        elif opcode == "bgeu":
-            branch_taken = (rs1_val & 0xFFFFFFFF) >= (rs2_val & 0xFFFFFFFF)
+        # ALU según el opcode (tabla indexada por Opcode, sin unidad de control)
+        operand2 = imm if uop.signals.ALUSrc else rs2_val
+        alu_result = uop.basic_alu(rs1_val, operand2, pc)
+
+        branch_condition = uop.branch_condition
+        if branch_condition is not None:
+            branch_taken = branch_condition(rs1_val, rs2_val)
             target_address = pc + imm
-        elif opcode == "jal":
+        elif opcode == Opcode.JAL:
             alu_result = pc + 4
             target_address = pc + imm
             branch_taken = True
-        elif opcode == "jalr":
+        elif opcode == Opcode.JALR:
             alu_result = pc + 4
             target_address = (rs1_val + imm) & ~1
             branch_taken = True
-        elif opcode == "lui":
-            alu_result = imm << 12
-        elif opcode == "auipc":
-            alu_result = pc + (imm << 12)
-        elif opcode == "nop":
-            pass
-        else:
-            raise ValueError(f"Operación no soportada: {opcode}")
 
-        time.sleep(self.latency)
-        return {
-            "instr": instr,
-            "alu_result": alu_result,
-            "rs2_val": rs2_val,
-            "rd": id_ex.get("rd"),
-            "pc": pc,
-            "branch_taken": branch_taken,
-            "target_address": target_address,
-            "flush_required": False  
-        }
+        self.clock.stage(self.latency)
+        ex_mem = self.out
+        ex_mem.reset(instr, pc)
+        ex_mem.alu_result = alu_result
+        ex_mem.rs2_val = rs2_val
+        ex_mem.rd = id_ex.rd
+        ex_mem.branch_taken = branch_taken
+        ex_mem.target_address = target_address
+        ex_mem.control_signals = uop.signals  # Propagar señales a MEM
+        return ex_mem
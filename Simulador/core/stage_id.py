@@ -1,56 +1,62 @@
-from core.instruction import Instruction
+from core.instruction import Opcode
+from core.latches import IFIDLatch, IDEXLatch
+from core.decode_cache import MicroOp
 from components.register_file import RegisterFile
 from components.branch_predictor import BranchPredictor
 from components.control_unit import ControlUnit  
-import time
+from components.clock import SimulatedClock
 from config import LATENCY_ID
 
 class InstructionDecode:
-    def __init__(self, register_file: RegisterFile, branch_predictor: BranchPredictor, control_unit: ControlUnit, latency: float = None):
+    def __init__(self, register_file: RegisterFile, branch_predictor: BranchPredictor, control_unit: ControlUnit, latency: float = None, clock: SimulatedClock = None):
         """
         Inicializa la etapa ID con acceso al banco de registros, predictor de saltos y unidad de control.
+        Las instrucciones llegan pre-decodificadas: IF deja en IF/ID la micro-op de la caché de decodificación.
         """
         self.reg_file = register_file
         self.branch_predictor = branch_predictor
         self.control_unit = control_unit 
         self.latency = latency if latency is not None else LATENCY_ID
+        self.clock = clock if clock is not None else SimulatedClock()
+        self.out = IDEXLatch()  # Latch ID/EX reutilizado en cada ciclo
 
-    def decode(self, if_id: dict) -> dict:
-        instr: Instruction = if_id["instr"]
-        pc = if_id["pc"]
+    def decode(self, if_id: IFIDLatch) -> IDEXLatch:
+        uop: MicroOp = if_id.instr  # Micro-op que IF tomó de la caché de decodificación
+        pc = if_id.pc
+        id_ex = self.out
+        id_ex.reset(uop, pc)
 
-        if instr.opcode == "nop":
-            return {"instr": instr, "pc": pc}
+        if uop.opcode == "nop":
+            return id_ex
 
-        # Leer operandos del banco de registros
-        rs1_val = self.reg_file.read(instr.rs1) if instr.rs1 else 0
-        rs2_val = self.reg_file.read(instr.rs2) if instr.rs2 else 0
+        # Micro-op pre-decodificada: registros, inmediato y señales de control ya calculados
+        id_ex.uop = uop
 
-        # Generar señales de control según el tipo de instrucción
-        control_signals = self.control_unit.generate_signals(instr.opcode)
+        # Leer operandos del banco de registros
+        id_ex.rs1_val = self.reg_file.read(uop.rs1) if uop.rs1 else 0
+        id_ex.rs2_val = self.reg_file.read(uop.rs2) if uop.rs2 else 0
 
         # Armar paquete para la etapa EX
-        id_ex = {
-            "instr": instr,
-            "pc": pc,
-            "rs1_val": rs1_val,
-            "rs2_val": rs2_val,
-            "imm": instr.imm,
-            "rd": instr.rd,
-            "rs1": instr.rs1,
-            "rs2": instr.rs2,
-            "control_signals": control_signals 
-        }
-
-        # Predicción de saltos si aplica
-        if instr.opcode in {"beq", "bne", "jal"}:
+        id_ex.control_signals = uop.signals
+        id_ex.imm = uop.imm
+        id_ex.rd = uop.rd
+        id_ex.rs1 = uop.rs1
+        id_ex.rs2 = uop.rs2
+
+        # Predicción de saltos (tipo B, jal y jalr): destino del BTB o, si no lo tiene, PC + imm.
+        # jalr sin destino en el BTB no se puede seguir y se predice como no tomado.
+        if uop.predicted:
             prediction = self.branch_predictor.predict(pc)
-            id_ex["predicted_taken"] = prediction["taken"]
-
-            if prediction["taken"]:
-                id_ex["predicted_target"] = pc + instr.imm
+            taken = prediction["taken"]
+            target = prediction["target"]
+            if target is None and uop.op != Opcode.JALR:
+                target = pc + uop.imm
+            if taken and target is not None:
+                id_ex.predicted_taken = True
+                id_ex.predicted_target = target
             else:
-                id_ex["predicted_target"] = pc + 4
+                id_ex.predicted_taken = False
+                id_ex.predicted_target = pc + 4
 
-        time.sleep(self.latency)
+        self.clock.stage(self.latency)
         return id_ex
@@ -3,42 +3,46 @@ InstructionDecodeBasic: Versión simplificada de la etapa ID
 Sin predicción de saltos ni unidad de control
 """
 
-from core.instruction import Instruction
+from core.latches import IFIDLatch, IDEXLatch
+from core.decode_cache import MicroOp
 from components.register_file import RegisterFile
-import time
+from components.clock import SimulatedClock
 from config import LATENCY_ID
 
 class InstructionDecodeBasic:
-    def __init__(self, register_file: RegisterFile, latency: float = None):
+    def __init__(self, register_file: RegisterFile, latency: float = None, clock: SimulatedClock = None):
         """
         Inicializa la etapa ID solo con acceso al banco de registros.
+        Las instrucciones llegan pre-decodificadas: IF deja en IF/ID la micro-op de la caché de decodificación.
         """
         self.reg_file = register_file
         self.latency = latency if latency is not None else LATENCY_ID
+        self.clock = clock if clock is not None else SimulatedClock()
+        self.out = IDEXLatch()  # Latch ID/EX reutilizado en cada ciclo
 
-    def decode(self, if_id: dict) -> dict:
+    def decode(self, if_id: IFIDLatch) -> IDEXLatch:
         """
         Decodifica la instrucción y lee los valores de los registros fuente.
         No aplica predicción de saltos ni control.
         """
-        instr: Instruction = if_id["instr"]
-        pc = if_id["pc"]
+        uop: MicroOp = if_id.instr  # Micro-op que IF tomó de la caché de decodificación
+        pc = if_id.pc
+        id_ex = self.out
+        id_ex.reset(uop, pc)
 
-        if instr.opcode == "nop":
-            return {"instr": instr, "pc": pc}
+        if uop.opcode == "nop":
+            return id_ex
 
-        rs1_val = self.reg_file.read(instr.rs1) if instr.rs1 else 0
-        rs2_val = self.reg_file.read(instr.rs2) if instr.rs2 else 0
+        id_ex.uop = uop
 
-        time.sleep(self.latency)
-        return {
-            "instr": instr,
-            "pc": pc,
-            "rs1_val": rs1_val,
-            "rs2_val": rs2_val,
-            "imm": instr.imm,
-            "rd": instr.rd,
-            "rs1": instr.rs1,
-            "rs2": instr.rs2,
-            # "control_signals": {}  # Si quieres agregar señales de control aquí
-        }
+        id_ex.rs1_val = self.reg_file.read(uop.rs1) if uop.rs1 else 0
+        id_ex.rs2_val = self.reg_file.read(uop.rs2) if uop.rs2 else 0
+        id_ex.imm = uop.imm
+        id_ex.rd = uop.rd
+        id_ex.rs1 = uop.rs1
+        id_ex.rs2 = uop.rs2
+        # Señales pre-calculadas al cargar el programa (solo se usan en MEM/WB)
+        id_ex.control_signals = uop.signals
+
+        self.clock.stage(self.latency)
+        return id_ex
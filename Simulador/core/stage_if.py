@@ -9,9 +9,10 @@ Consulta el archivo LICENSE para más detalles.
 ==========================================================================
 """
 
-from core.instruction import Instruction
-from components.memory import Memory
-import time
+from core.latches import IFIDLatch
+from core.decode_cache import DecodeCache, MicroOp, NOP_UOP
+from components.memory import InstructionMemory
+from components.clock import SimulatedClock
 from config import LATENCY_IF
 
 """
@@ -19,17 +20,21 @@ Class: InstructionFetch
 Clase que representa la etapa de búsqueda de instrucciones (IF) del pipeline, encargada de obtener la instrucción desde memoria y avanzar el PC.
 
 Attributes:
-- instr_mem: Memory - referencia a la memoria de instrucciones.
+- instr_mem: InstructionMemory - referencia a la memoria de instrucciones.
 - pc: int - contador de programa (dirección de la siguiente instrucción).
 - halted: bool - indica si se ha alcanzado el final del programa.
+- out: IFIDLatch - latch de salida, reutilizado en cada ciclo.
+- decode_cache: DecodeCache - caché de instrucciones pre-decodificadas, consultada antes que la memoria.
+- cache: Cache o None - caché L1 de instrucciones (modelo de tiempo, components/cache.py).
+- miss_cycles: int - ciclos de fallo de caché acumulados; el motor los convierte en stall y los pone en 0.
 
 Constructor:
 - __init__: Inicializa la etapa IF con la memoria de instrucciones.
 
 Methods:
-- fetch: Obtiene la instrucción actual y avanza el PC.
+- fetch: Obtiene la micro-op de la instrucción actual y avanza el PC.
 - jump: Modifica el PC para saltos de control.
-- _create_nop: Crea una instrucción NOP.
+- _create_nop: Devuelve la micro-op NOP.
 - reset: Restablece el PC y el estado de halted.
 - get_pc: Devuelve el valor actual del PC.
 
@@ -39,12 +44,15 @@ Example:
 """
 
 class InstructionFetch:
-    def __init__(self, instruction_memory: Memory, latency: float = None):
+    def __init__(self, instruction_memory: InstructionMemory, latency: float = None, clock: SimulatedClock = None, decode_cache: DecodeCache = None):
         """
         Function: __init__
         Inicializa la etapa IF con acceso a la memoria de instrucciones.
         Params:
-        - instruction_memory: Memory - memoria de instrucciones.
+        - instruction_memory: InstructionMemory - memoria de instrucciones.
+        - latency: float - latencia de la etapa en segundos (por defecto LATENCY_IF).
+        - clock: SimulatedClock - reloj simulado compartido con las demás etapas.
+        - decode_cache: DecodeCache - caché de decodificación compartida con ID.
         Example:
             if_stage = InstructionFetch(mem)
         """
@@ -52,35 +60,44 @@ class InstructionFetch:
         self.pc = 0  # PC inicia en 0
         self.halted = False
         self.latency = latency if latency is not None else LATENCY_IF
+        self.clock = clock if clock is not None else SimulatedClock()
+        self.out = IFIDLatch()
+        self.decode_cache = decode_cache if decode_cache is not None else DecodeCache()
+        self.cache = None
+        self.miss_cycles = 0
 
-    def fetch(self) -> dict:
+    def fetch(self) -> IFIDLatch:
         """
         Function: fetch
         Obtiene la instrucción actual y avanza el PC para el siguiente ciclo.
         Si no hay más instrucciones, devuelve una instrucción NOP y marca el estado como halted.
         Returns:
-        - dict: contiene 'instr' (Instruction) y 'pc' (int).
+        - IFIDLatch: latch de salida con 'instr' (MicroOp) y 'pc' (int), sobrescrito en cada llamada.
         Example:
             resultado = if_stage.fetch()
         """
+        out = self.out
         if self.halted:
-            return {"instr": self._create_nop(), "pc": self.pc}
+            out.reset(self._create_nop(), self.pc)
+            return out
 
-        try:
-            instr_line = self.instr_mem.load_word(self.pc)
-            if isinstance(instr_line, Instruction):
-                instr = instr_line
-            else:
-                instr = Instruction(instr_line, self.pc)
-        except Exception:
-            instr = self._create_nop()
-            self.halted = True
+        uop = self.decode_cache.lookup(self.pc)
+        if uop is None:
+            try:
+                # Palabra RV32I; una palabra no decodificable es el fin del programa
+                uop = self.decode_cache.fill_word(self.pc, self.instr_mem.load_word(self.pc))
+            except Exception:
+                uop = self._create_nop()
+                self.halted = True
 
         current_pc = self.pc
+        if self.cache is not None:
+            self.miss_cycles += self.cache.access(current_pc)
         self.pc += 4  # Avanza a la siguiente instrucción
-        time.sleep(self.latency)
+        self.clock.stage(self.latency)
 
-        return {"instr": instr, "pc": current_pc}
+        out.reset(uop, current_pc)
+        return out
 
     def jump(self, new_address: int):
         """
@@ -93,16 +110,16 @@ class InstructionFetch:
         """
         self.pc = new_address
 
-    def _create_nop(self) -> Instruction:
+    def _create_nop(self) -> MicroOp:
         """
         Function: _create_nop
-        Crea una instrucción NOP en la dirección actual del PC.
+        Devuelve la micro-op NOP (compartida; el PC lo lleva el latch).
         Returns:
-        - Instruction: instrucción NOP.
+        - MicroOp: NOP_UOP.
         Example:
             nop = self._create_nop()
         """
-        return Instruction("nop", self.pc)
+        return NOP_UOP
 
     def reset(self):
         """
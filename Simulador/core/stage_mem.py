@@ -1,35 +1,50 @@
 from components.memory import Memory
-import time
+from core.latches import EXMEMLatch, MEMWBLatch
+from components.clock import SimulatedClock
 from config import LATENCY_MEM
 
 class MemoryAccessStage:
-    def __init__(self, data_memory: Memory, latency: float = None):
+    def __init__(self, data_memory: Memory, latency: float = None, clock: SimulatedClock = None):
         self.data_mem = data_memory
         self.latency = latency if latency is not None else LATENCY_MEM
+        self.clock = clock if clock is not None else SimulatedClock()
+        self.out = MEMWBLatch()  # Latch MEM/WB reutilizado en cada ciclo
+        self.journal = None  # lista de (addr, ancho, valor anterior) si hay historial inverso
+        self.cache = None  # caché L1 de datos (modelo de tiempo, components/cache.py)
+        self.miss_cycles = 0  # ciclos de fallo acumulados; el motor los convierte en stall
 
-    def access(self, ex_mem: dict) -> dict:
-        instr = ex_mem["instr"]
-        rd = ex_mem.get("rd")
-        pc = ex_mem["pc"]
-        alu_result = ex_mem.get("alu_result", 0)
-        rs2_val = ex_mem.get("rs2_val", 0)
-        control = ex_mem.get("control_signals", {})
+    def access(self, ex_mem: EXMEMLatch) -> MEMWBLatch:
+        alu_result = ex_mem.alu_result
+        control = ex_mem.control_signals
 
         mem_data = None
+        if self.cache is not None and (control.MemRead or control.MemWrite):
+            self.miss_cycles += self.cache.access(alu_result, control.MemWrite)
 
         # Solo accede si la señal lo indica
-        if control.get("MemRead", False):
-            mem_data = self.data_mem.load_word(alu_result)
+        if control.MemRead:
+            if control.MemWidth == 4:
+                mem_data = self.data_mem.load_word(alu_result)
+            else:  # lh/lhu/lb/lbu
+                mem_data = self.data_mem.load(alu_result, control.MemWidth, control.MemSigned)
 
-        if control.get("MemWrite", False):
-            self.data_mem.store_word(alu_result, rs2_val)
+        if control.MemWrite:
+            journal = self.journal
+            if journal is not None:
+                width = control.MemWidth
+                old = self.data_mem.load_word(alu_result) if width == 4 else self.data_mem.load(alu_result, width, False)
+                journal.append((alu_result, width, old))
+            if control.MemWidth == 4:
+                self.data_mem.store_word(alu_result, ex_mem.rs2_val)
+            else:  # sh/sb
+                self.data_mem.store(alu_result, ex_mem.rs2_val, control.MemWidth)
 
-        time.sleep(self.latency)
-        return {
-            "instr": instr,
-            "rd": rd,
-            "alu_result": alu_result,
-            "mem_data": mem_data,
-            "pc": pc,
-            "control_signals": control  #Propagar señales a WB
-        }
+        self.clock.stage(self.latency)
+        mem_wb = self.out
+        mem_wb.instr = ex_mem.instr
+        mem_wb.rd = ex_mem.rd
+        mem_wb.alu_result = alu_result
+        mem_wb.mem_data = mem_data
+        mem_wb.pc = ex_mem.pc
+        mem_wb.control_signals = control  #Propagar señales a WB
+        return mem_wb
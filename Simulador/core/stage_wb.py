@@ -1,28 +1,32 @@
-import time
+from components.clock import SimulatedClock
 from components.register_file import RegisterFile
+from core.latches import MEMWBLatch
 from config import LATENCY_WB
 
 class WriteBackStage:
-    def __init__(self, register_file: RegisterFile, latency: float = None):
+    def __init__(self, register_file: RegisterFile, latency: float = None, clock: SimulatedClock = None):
         self.reg_file = register_file
         self.latency = latency if latency is not None else LATENCY_WB
+        self.clock = clock if clock is not None else SimulatedClock()
+        self.journal = None  # lista de (rd, valor anterior) si hay historial inverso
 
-    def write_back(self, mem_wb: dict):
-        instr = mem_wb["instr"]
-        rd = mem_wb.get("rd")
-        control = mem_wb.get("control_signals", {})
+    def write_back(self, mem_wb: MEMWBLatch):
+        rd = mem_wb.rd
+        control = mem_wb.control_signals
 
-        if not control.get("RegWrite", False):
+        if not control.RegWrite:
             return  # No se debe escribir en registros
 
-        if rd is None or rd == "x0":
+        if not rd:
             return  # Nunca escribir en x0
 
         # Selección de fuente según MemToReg
-        if control.get("MemToReg", False):
-            value = mem_wb.get("mem_data")
+        if control.MemToReg:
+            value = mem_wb.mem_data
         else:
-            value = mem_wb.get("alu_result")
+            value = mem_wb.alu_result
 
-        time.sleep(self.latency)
+        self.clock.stage(self.latency)
+        if self.journal is not None:
+            self.journal.append((rd, self.reg_file.values[rd]))
         self.reg_file.write(rd, value)
@@ -1,3 +1,4 @@
+import queue
 import tkinter as tk
 from tkinter import ttk, messagebox
 # Importación de vistas
@@ -6,10 +7,72 @@ from .view_status import ViewStatus
 from collections import deque
 
 from InOut.parser import Parser
-from core.simulator_manager import SimulatorManager
+from core.simulator_manager import SimulatorManager, pipeline_strings
+from core.events import ConsoleLogger
+from components.memory import SparseMemory, PAGE_BITS, PAGE_SIZE
+from .sim_worker import SimulationWorker
 from InOut.execution_history import ExecutionHistory
 
 
+# Componentes de cada etapa del pipeline (tags definidos en cada SimView)
+STAGE_UNITS = {
+    "IF_ID": ("instruction_mem", "mux_pc", "reg_pc", "adder"),
+    "ID_EX": ("register_file", "reg1", "reg2", "extend"),
+    "EX_MEM": ("alu", "adderPC", "mux_srcB", "mux_ForwardAE", "mux_ForwardBE"),
+    "MEM_WB": ("data_mem", "mux_result", "reg3", "reg4"),
+}
+
+# Componentes adicionales según el tipo de instrucción
+INSTR_TYPE_UNITS = {
+    "R": ("register_file", "alu", "mux_result"),
+    "I": ("register_file", "extend", "alu", "mux_result"),
+    "S": ("register_file", "extend", "data_mem"),
+    "B": ("register_file", "extend", "adderPC"),
+    "U": ("register_file", "extend", "mux_result"),
+    "J": ("register_file", "extend", "mux_result"),
+    "LW": ("register_file", "extend", "data_mem", "mux_result"),
+    "SW": ("register_file", "extend", "data_mem"),
+}
+
+INSTR_TYPES = {}
+for _ops, _kind in (
+    (("add", "sub", "and", "or", "xor", "slt", "sll", "srl", "sra"), "R"),
+    (("addi", "andi", "ori", "slti", "slli", "srli", "srai", "jalr"), "I"),
+    (("lw", "lh", "lb", "lhu", "lbu"), "LW"),
+    (("sw", "sh", "sb"), "SW"),
+    (("beq", "bne", "blt", "bge", "bltu", "bgeu"), "B"),
+    (("lui", "auipc"), "U"),
+    (("jal",), "J"),
+):
+    INSTR_TYPES.update(dict.fromkeys(_ops, _kind))
+
+
+def active_units(pipe) -> set:
+    """
+    Devuelve los componentes a iluminar según la instrucción que ocupa cada etapa del pipeline.
+    """
+    units = set()
+    for stage, stage_units in STAGE_UNITS.items():
+        latch = getattr(pipe, stage, None)
+        instr = latch.instr if latch is not None else None
+        opcode = getattr(instr, "opcode", "nop")
+        if opcode != "nop":
+            units.update(stage_units)
+            units.update(INSTR_TYPE_UNITS.get(INSTR_TYPES.get(opcode), ()))
+    return units
+
+
+def memory_layout(data_mem):
+    """
+    Direcciones de la memoria de datos que muestra la vista, una por fila: toda la memoria plana
+    (range) o las palabras de las páginas reservadas de una SparseMemory.
+    """
+    if isinstance(data_mem, SparseMemory):
+        return [(number << PAGE_BITS) + offset for number in sorted(data_mem.pages)
+                for offset in range(0, PAGE_SIZE, 4)]
+    return range(0, len(data_mem), 4)
+
+
 class RiscVSimulatorApp(tk.Tk):
     """Ventana principal del simulador RISC-V."""
 
@@ -75,6 +138,7 @@ class RiscVSimulatorApp(tk.Tk):
         self._step_manager = None
         self._step_initialized = False
         self._step_program_lines = None
+        self._step_history_saved = False  # la ejecución paso a paso ya se guardó en el historial
 
         # Control de ejecución rítmica
         self._timed_exec_running = False
@@ -83,8 +147,13 @@ class RiscVSimulatorApp(tk.Tk):
         self._timed_exec_program_lines = None
         self._timed_exec_delay = None
 
-        self._highlight_timers = {}  # {(sim_number, unit_tag): after_id}
-        self._pending_highlights = set()  # {(sim_number, unit_tag)}
+        # Ejecución completa en segundo plano (Run-All)
+        self._worker = None
+        self._worker_after_id = None
+
+        # Distribución de la memoria mostrada en cada vista (tamaño o páginas reservadas)
+        self._memory_layout_keys = {}
+
 
     # PRUEBA DE HISTORIAL - Borrar despues
         #self.update_history(1, 1, 0, 0, 0, 0, 0)
@@ -97,8 +166,39 @@ class RiscVSimulatorApp(tk.Tk):
     """
 
     def _step_backward(self):
-        # Falta para implementar el paso atrás
-        print("Step backward un ciclo")
+        """Retrocede un ciclo en cada procesador del modo paso a paso (checkpoints + deltas)."""
+        if not self._step_initialized or self._step_manager is None:
+            print("No hay una ejecución paso a paso para retroceder.")
+            return
+
+        for view_idx, sim_idx in enumerate(self.active_indices):
+            cpu_name = self._step_manager.cpu_names[sim_idx]
+            cpu = self._step_manager.cpus[view_idx]
+            try:
+                oldest = cpu.history.oldest_cycle() if cpu.history is not None else None
+                if oldest is None or cpu.metrics.ciclos_totales <= oldest:
+                    print(f"{cpu_name}: no hay ciclos anteriores en el historial.")
+                    continue
+                ciclos = cpu.step_back(1)
+            except Exception as e:
+                print(f"Error al retroceder {cpu_name}: {e}")
+                continue
+
+            metrics = cpu.metrics
+            inst = metrics.instrucciones_retiradas
+            cpi = ciclos / inst if inst else 0
+            if metrics.branches_totales:
+                precision = (metrics.branches_acertados / metrics.branches_totales) * 100
+            else:
+                precision = 0.0
+            pc = cpu.pipeline.IF_ID.pc or 0
+
+            self.update_metrics_sim(view_idx+1, ciclos, inst, cpi, metrics.branches_totales,
+                                    metrics.branches_acertados, precision)
+            self.update_system_state_sim(view_idx+1, ciclos, metrics.get_elapsed_time(), pc)
+            self._push_state_changes(view_idx+1, cpu)
+            self.update_pipeline_sim(view_idx+1, pipeline_strings(cpu.pipeline), ciclos)
+            self._highlight_pipeline_units_step(view_idx+1, cpu.pipeline)
 
     def _step_forward(self):
         code = self.code_space.get("1.0", tk.END)
@@ -126,8 +226,11 @@ class RiscVSimulatorApp(tk.Tk):
                 self._step_manager = SimulatorManager(program_lines, active_indices=self.active_indices)
                 for cpu in self._step_manager.cpus:
                     cpu.load_program(program_lines)
+                    cpu.enable_history()  # permite el paso atrás (_step_backward)
+                    ConsoleLogger().attach(cpu)  # stalls y predicciones incorrectas por consola
                 self._step_program_lines = program_lines
                 self._step_initialized = True
+                self._step_history_saved = False
             except Exception as e:
                 print(f"Error al inicializar el simulador: {e}")
                 return
@@ -182,19 +285,8 @@ class RiscVSimulatorApp(tk.Tk):
                 self.update_metrics_sim(view_idx+1, ciclos, inst, cpi, branch_total, branch_acertados, precision)
                 self.update_system_state_sim(view_idx+1, ciclos, tiempo, pc)
 
-                # --- Actualizar registros en tiempo real ---
-                if hasattr(cpu, "registers") and hasattr(cpu.registers, "dump"):
-                    reg_dict = cpu.registers.dump()
-                    self.update_registers_sim(view_idx+1, reg_dict)
-                else:
-                    self.update_registers_sim(view_idx+1, {f"x{i}": 0 for i in range(32)})
-
-                # --- Actualizar memoria en tiempo real ---
-                if hasattr(cpu, "data_mem") and hasattr(cpu.data_mem, "dump"):
-                    mem_dict = cpu.data_mem.dump()
-                    self.update_memory_sim(view_idx+1, mem_dict)
-                else:
-                    self.update_memory_sim(view_idx+1, {addr: 0 for addr in range(0, 4096, 4)})
+                # --- Actualizar registros y memoria en tiempo real (solo lo modificado) ---
+                self._push_state_changes(view_idx+1, cpu)
 
                 # --- Actualizar pipeline en tiempo real ---
                 if hasattr(cpu, "pipeline"):
@@ -221,7 +313,7 @@ class RiscVSimulatorApp(tk.Tk):
                         "IF_ID": "nop", "ID_EX": "nop", "EX_MEM": "nop", "MEM_WB": "nop"
                     }, ciclos)
 
-                # Si terminó, reiniciar para el próximo step
+                # Si terminó, avisar (el estado final se conserva para poder retroceder)
                 if finished:
                     print(f"{cpu_name} ha finalizado la ejecución.")
                 else:
@@ -230,8 +322,9 @@ class RiscVSimulatorApp(tk.Tk):
                 print(f"Error al ejecutar {cpu_name}: {e}")
                 all_finished = False
 
-        # --- Guardar historial solo si TODOS han terminado ---
-        if all_finished:
+        # --- Guardar historial solo si TODOS han terminado (una vez por ejecución) ---
+        # El simulador paso a paso se conserva: desde el final se puede seguir retrocediendo
+        if all_finished and not self._step_history_saved:
             history = ExecutionHistory()
             for view_idx, sim_idx in enumerate(self.active_indices):
                 cpu_name = self._step_manager.cpu_names[sim_idx]
@@ -243,7 +336,7 @@ class RiscVSimulatorApp(tk.Tk):
                     metrics=metrics,
                     config=config
                 )
-            self._step_initialized = False
+            self._step_history_saved = True
 
     def _start_timed_exec(self):
         # Si ya está corriendo la ejecución rítmica, no hacer nada
@@ -276,6 +369,7 @@ class RiscVSimulatorApp(tk.Tk):
             self._timed_exec_manager = SimulatorManager(program_lines, active_indices=self.active_indices)
             for cpu in self._timed_exec_manager.cpus:
                 cpu.load_program(program_lines)
+                ConsoleLogger().attach(cpu)
             self._timed_exec_program_lines = program_lines
         except Exception as e:
             print(f"Error al inicializar el simulador: {e}")
@@ -288,118 +382,11 @@ class RiscVSimulatorApp(tk.Tk):
     def _highlight_pipeline_units(self, sim_number, pipe):
         """
         Ilumina los componentes relevantes según la instrucción en cada etapa del pipeline.
-        Apaga los que ya no están activos.
+        Los que ya no están activos se apagan en el mismo cuadro (HighlightScheduler).
         """
-        # Mapeo de etapas a posibles componentes por tipo de instrucción
-        # Puedes ajustar los nombres según los tags definidos en cada SimView
-        stage_unit_map = {
-            "IF_ID": ["instruction_mem", "mux_pc", "reg_pc", "adder"],
-            "ID_EX": ["register_file", "reg1", "reg2", "extend"],
-            "EX_MEM": ["alu", "adderPC", "mux_srcB", "mux_ForwardAE", "mux_ForwardBE"],
-            "MEM_WB": ["data_mem", "mux_result", "reg3", "reg4"]
-        }
-
-        # Mapeo de tipo de instrucción a componentes adicionales
-        instr_type_map = {
-            "R": ["register_file", "alu", "mux_result"],
-            "I": ["register_file", "extend", "alu", "mux_result"],
-            "S": ["register_file", "extend", "data_mem"],
-            "B": ["register_file", "extend", "adderPC"],
-            "U": ["register_file", "extend", "mux_result"],
-            "J": ["register_file", "extend", "mux_result"],
-            "LW": ["register_file", "extend", "data_mem", "mux_result"],
-            "SW": ["register_file", "extend", "data_mem"],
-        }
-
-        # Helper para determinar tipo de instrucción
-        def get_instr_type(instr):
-            op = getattr(instr, "opcode", "nop")
-            if op in {"add", "sub", "and", "or", "xor", "slt", "sll", "srl", "sra"}:
-                return "R"
-            elif op in {"addi", "andi", "ori", "slti", "slli", "srli", "srai", "jalr"}:
-                return "I"
-            elif op in {"lw"}:
-                return "LW"
-            elif op in {"sw"}:
-                return "SW"
-            elif op in {"beq", "bne", "blt", "bge", "bltu", "bgeu"}:
-                return "B"
-            elif op in {"lui", "auipc"}:
-                return "U"
-            elif op in {"jal"}:
-                return "J"
-            else:
-                return None
-
-        # Primero, limpiar todos los highlights
-        self.clear_highlight_for_sim(sim_number)
-
-        # Para cada etapa, iluminar si hay instrucción activa
-        for stage, units in stage_unit_map.items():
-            stage_dict = getattr(pipe, stage, None)
-            if stage_dict and "instr" in stage_dict:
-                instr = stage_dict["instr"]
-                if getattr(instr, "opcode", "nop") != "nop":
-                    # Iluminar todos los componentes de la etapa
-                    for unit in units:
-                        self._highlight_with_auto_clear(sim_number, unit)
-                    # Iluminar componentes adicionales según tipo de instrucción
-                    instr_type = get_instr_type(instr)
-                    if instr_type and instr_type in instr_type_map:
-                        for unit in instr_type_map[instr_type]:
-                            self._highlight_with_auto_clear(sim_number, unit)
-
-    def _highlight_with_auto_clear(self, sim_number, unit_tag, delay_on=400, delay_off=400):
-        """
-        Ilumina un componente, lo mantiene encendido delay_on ms, lo apaga delay_off ms,
-        y luego repite el ciclo si sigue activo.
-        Solo aplica el ciclo en modo delay.
-        """
-        key = (sim_number, unit_tag)
-        # Si ya está pendiente de highlight, no lo enciendas de nuevo hasta que termine el ciclo
-        if self._timed_exec_running and key in self._pending_highlights:
-            return
-        self.highlight_for_sim(sim_number, unit_tag)
-        
-        # Programa apagado después de delay_on ms
-        self._highlight_timers[key] = self.after(
-            delay_on,
-            lambda: self._auto_clear_and_reschedule(sim_number, unit_tag, delay_on, delay_off)
-        )
-
-    def _auto_clear_and_reschedule(self, sim_number, unit_tag, delay_on, delay_off):
-        """
-        Apaga el highlight y, si sigue en modo delay, espera delay_off antes de volver a encenderlo.
-        """
-        key = (sim_number, unit_tag)
-        frame = self._tabs.get(sim_number - 1)
+        frame = self._sim_frame(sim_number)
         if frame:
-            frame.clear_highlight(unit_tag)
-        if key in self._highlight_timers:
-            self.after_cancel(self._highlight_timers[key])
-            del self._highlight_timers[key]
-        # Marca como pendiente para evitar doble highlight
-        if self._timed_exec_running:
-            self._pending_highlights.add(key)
-            # Espera delay_off antes de volver a encender si sigue en modo delay
-            self._highlight_timers[key] = self.after(
-                delay_off,
-                lambda: self._resume_highlight(sim_number, unit_tag, delay_on, delay_off)
-            )
-        else:
-            if key in self._pending_highlights:
-                self._pending_highlights.remove(key)
-
-    def _resume_highlight(self, sim_number, unit_tag, delay_on, delay_off):
-        """
-        Vuelve a encender el highlight si sigue en modo delay.
-        """
-        key = (sim_number, unit_tag)
-        if self._timed_exec_running:
-            self._pending_highlights.discard(key)
-            self._highlight_with_auto_clear(sim_number, unit_tag, delay_on, delay_off)
-        else:
-            self._pending_highlights.discard(key)
+            frame.set_highlighted(active_units(pipe))
 
     def _timed_exec_step(self):
         if not self._timed_exec_running:
@@ -443,19 +430,8 @@ class RiscVSimulatorApp(tk.Tk):
                 self.update_metrics_sim(view_idx+1, ciclos, inst, cpi, branch_total, branch_acertados, precision)
                 self.update_system_state_sim(view_idx+1, ciclos, tiempo, pc)
 
-                # --- Actualizar registros en tiempo real ---
-                if hasattr(cpu, "registers") and hasattr(cpu.registers, "dump"):
-                    reg_dict = cpu.registers.dump()
-                    self.update_registers_sim(view_idx+1, reg_dict)
-                else:
-                    self.update_registers_sim(view_idx+1, {f"x{i}": 0 for i in range(32)})
-
-                # --- Actualizar memoria en tiempo real ---
-                if hasattr(cpu, "data_mem") and hasattr(cpu.data_mem, "dump"):
-                    mem_dict = cpu.data_mem.dump()
-                    self.update_memory_sim(view_idx+1, mem_dict)
-                else:
-                    self.update_memory_sim(view_idx+1, {addr: 0 for addr in range(0, 4096, 4)})
+                # --- Actualizar registros y memoria en tiempo real (solo lo modificado) ---
+                self._push_state_changes(view_idx+1, cpu)
 
                 # --- Actualizar pipeline y resaltar bloques en tiempo real ---
                 if hasattr(cpu, "pipeline"):
@@ -537,117 +513,127 @@ class RiscVSimulatorApp(tk.Tk):
             print(f"Error al inicializar el simulador: {e}")
             return
 
-        # --- Integración con ExecutionHistory ---
-        history = manager.history
-
-        # Ejecutar cada procesador y actualizar interfaz
-        pipeline_states = []
-        for view_idx, sim_idx in enumerate(self.active_indices):
-            cpu_name = manager.cpu_names[sim_idx]
-            cpu = manager.cpus[view_idx]
+        # La simulación corre en un hilo aparte; la GUI solo vacía su cola con after()
+        self._cancel_full_exec()
+        self._worker = SimulationWorker(manager, program_lines)
+        self._worker.start()
+        self._pause_button.config(text="Pause")
+        self._worker_after_id = self.after(self.WORKER_POLL_MS, self._drain_worker_queue)
+
+    # Milisegundos entre lecturas de la cola del hilo de simulación
+    WORKER_POLL_MS = 30
+    # Mensajes procesados como máximo por lectura, para no bloquear el ciclo de eventos de Tk
+    WORKER_MAX_MESSAGES = 200
+
+    def _drain_worker_queue(self):
+        """Aplica a la interfaz los mensajes pendientes del hilo de simulación."""
+        self._worker_after_id = None
+        worker = self._worker
+        if worker is None:
+            return
+        for _ in range(self.WORKER_MAX_MESSAGES):
             try:
-                cpu.load_program(program_lines)
-                cpu.run(modo="full", delay_seg=0)
-                metrics = cpu.metrics
-
-                ciclos = metrics.ciclos_totales
-                inst = metrics.instrucciones_retiradas
-                cpi = metrics.ciclos_totales / metrics.instrucciones_retiradas if metrics.instrucciones_retiradas else 0
-                branch_total = metrics.branches_totales
-                branch_acertados = metrics.branches_acertados
-
-                if hasattr(metrics, "get_elapsed_time"):
-                    tiempo = metrics.get_elapsed_time()
-                elif hasattr(metrics, "elapsed_time"):
-                    tiempo = metrics.elapsed_time
-                else:
-                    tiempo = 0.0
-
-                pc = 0
-                if hasattr(cpu, "pipeline") and hasattr(cpu.pipeline, "IF_ID"):
-                    if hasattr(cpu.pipeline.IF_ID, "pc"):
-                        pc = cpu.pipeline.IF_ID.pc
-                    elif isinstance(cpu.pipeline.IF_ID, dict) and "pc" in cpu.pipeline.IF_ID:
-                        pc = cpu.pipeline.IF_ID["pc"]
-                elif hasattr(cpu, "pc"):
-                    pc = cpu.pc
-
-                print(f"\n--- Métricas para {cpu_name} ---")
-                print(f"Ciclos totales: {ciclos}")
-                print(f"Instrucciones retiradas: {inst}")
-                print(f"CPI: {cpi:.2f}")
-                print(f"Branches totales: {branch_total}")
-                print(f"Branches acertados: {branch_acertados}")
-                if metrics.branches_totales:
-                    precision = (metrics.branches_acertados / metrics.branches_totales) * 100
-                else:
-                    precision = 0.0
-                print(f"Precisión del predictor: {precision:.2f}%")
-
-                self.update_metrics_sim(view_idx+1, ciclos, inst, cpi, branch_total, branch_acertados, precision)
-                self.update_system_state_sim(view_idx+1, ciclos, tiempo, pc)
-
-                # --- Guardar en historial de ejecuciones ---
-                config = manager.cpu_configs[sim_idx]
-                history.add_execution(
-                    processor_name=cpu_name,
-                    metrics=metrics,
-                    config=config
-                )
-
-                # --- Actualizar registros en la interfaz gráfica ---
-                if hasattr(cpu, "registers") and hasattr(cpu.registers, "dump"):
-                    reg_dict = cpu.registers.dump()
-                    self.update_registers_sim(view_idx+1, reg_dict)
-                else:
-                    self.update_registers_sim(view_idx+1, {f"x{i}": 0 for i in range(32)})
-
-                # --- Guardar estado del pipeline para mostrarlo luego ---
-                if hasattr(cpu, "pipeline"):
-                    pipe = cpu.pipeline
-                    def instr_str(stage):
-                        instr = stage.get("instr", None)
-                        pc_val = stage.get("pc", None)
-                        s = str(instr) if instr is not None else "nop"
-                        if pc_val is not None:
-                            s += f" @ PC={pc_val:#x}"
-                        return s
-                    pipeline_info = {
-                        "IF_ID": instr_str(pipe.IF_ID) if pipe.IF_ID else "nop",
-                        "ID_EX": instr_str(pipe.ID_EX) if pipe.ID_EX else "nop",
-                        "EX_MEM": instr_str(pipe.EX_MEM) if pipe.EX_MEM else "nop",
-                        "MEM_WB": instr_str(pipe.MEM_WB) if pipe.MEM_WB else "nop"
-                    }
-                    pipeline_states.append((view_idx+1, pipeline_info, ciclos))
+                kind, view_number, payload = worker.messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "state":
+                self._apply_worker_state(view_number, payload)
+            elif kind == "done":
+                self._apply_worker_result(view_number, payload)
+            elif kind == "error":
+                print(f"Error al ejecutar la simulación {view_number}: {payload}")
+            elif kind == "finished":
+                if payload:
+                    print("Ejecución cancelada")
+                self._worker = None
+                self._pause_button.config(text="Pause")
+                return
+        self._worker_after_id = self.after(self.WORKER_POLL_MS, self._drain_worker_queue)
+
+    def _apply_worker_state(self, view_number: int, snapshot: dict):
+        """Actualiza una vista con una instantánea intermedia (solo registros modificados)."""
+        metrics = snapshot["metricas"]
+        self.update_metrics_sim(view_number, metrics["ciclos_totales"], metrics["instrucciones_retiradas"],
+                                metrics["cpi"], metrics["branches_totales"], metrics["branches_acertados"],
+                                metrics["branch_accuracy"] or 0.0)
+        self.update_system_state_sim(view_number, snapshot["ciclo"], snapshot["tiempo"], snapshot["pc"])
+        if snapshot["registros"]:
+            self.update_registers_sim(view_number, snapshot["registros"])
+        self.update_pipeline_sim(view_number, snapshot["pipeline"], snapshot["ciclo"])
+
+    def _apply_worker_result(self, view_number: int, record: dict):
+        """Muestra el resultado final de un procesador y lo guarda en el historial."""
+        cpu_name = record["procesador"]
+        ciclos = record["ciclos_totales"]
+        inst = record["instrucciones_retiradas"]
+        cpi = record["cpi"]
+        branch_total = record["branches_totales"]
+        branch_acertados = record["branches_acertados"]
+        precision = record["branch_accuracy"] or 0.0
+
+        print(f"\n--- Métricas para {cpu_name} ---")
+        print(f"Ciclos totales: {ciclos}")
+        print(f"Instrucciones retiradas: {inst}")
+        print(f"CPI: {cpi:.2f}")
+        print(f"Branches totales: {branch_total}")
+        print(f"Branches acertados: {branch_acertados}")
+        print(f"Precisión del predictor: {precision:.2f}%")
+
+        self.update_metrics_sim(view_number, ciclos, inst, cpi, branch_total, branch_acertados, precision)
+        self.update_system_state_sim(view_number, ciclos, record["tiempo_ejecucion"], record["pc"])
+
+        # --- Guardar en historial de ejecuciones ---
+        self._worker.manager.history.add_execution(
+            processor_name=cpu_name,
+            metrics=record,
+            config=record["config"]
+        )
 
-                    # Iluminar todos los componentes relevantes según la instrucción en cada etapa
-                    self._highlight_pipeline_units(view_idx+1, pipe)
-                else:
-                    pipeline_states.append((view_idx+1, {
-                        "IF_ID": "nop", "ID_EX": "nop", "EX_MEM": "nop", "MEM_WB": "nop"
-                    }, ciclos))
+        # --- Actualizar registros y memoria en la interfaz gráfica ---
+        self.update_registers_sim(view_number, record["registros"])
+        mem_dict = {addr: 0 for addr in range(0, 4096, 4)}
+        mem_dict.update(record["memoria"])
+        self.update_memory_sim(view_number, mem_dict)
 
-            except Exception as e:
-                print(f"Error al ejecutar {cpu_name}: {e}")
+        # --- Pipeline final (tras completar, todas las etapas quedan vacías) ---
+        self.clear_highlight_for_sim(view_number)
+        self.update_pipeline_sim(view_number, record["pipeline"], ciclos)
 
-        # --- Actualizar memoria en la interfaz gráfica después de la ejecución ---
-        for view_idx, sim_idx in enumerate(self.active_indices):
-            cpu = manager.cpus[view_idx]
-            if hasattr(cpu, "data_mem") and hasattr(cpu.data_mem, "dump"):
-                mem_dict = cpu.data_mem.dump()
-                self.update_memory_sim(view_idx+1, mem_dict)
-            else:
-                self.update_memory_sim(view_idx+1, {addr: 0 for addr in range(0, 4096, 4)})
+    def _toggle_pause_full_exec(self):
+        """Pausa o reanuda la ejecución completa en segundo plano."""
+        if self._worker is None:
+            return
+        if self._worker.is_paused():
+            self._worker.resume()
+            self._pause_button.config(text="Pause")
+        else:
+            self._worker.pause()
+            self._pause_button.config(text="Resume")
 
-        # --- Actualizar pipeline en la interfaz gráfica después de la ejecución ---
-        for view_number, pipeline_info, ciclo in pipeline_states:
-            self.update_pipeline_sim(view_number, pipeline_info, ciclo)
+    def _cancel_full_exec(self):
+        """Cancela la ejecución completa en segundo plano, si existe."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        if self._worker_after_id is not None:
+            self.after_cancel(self._worker_after_id)
+            self._worker_after_id = None
+        self._worker = None
+        self._pause_button.config(text="Pause")
+
+    def _stop_execution(self):
+        """Detiene la ejecución rítmica y la ejecución completa en segundo plano."""
+        self._stop_timed_exec()
+        self._cancel_full_exec()
 
     def _reset_simulation(self):
         """Reinicia la simulación, limpiando el código y el estado de las vistas."""
         print("Reiniciar simulación")
-        # Detener ejecución rítmica si está corriendo
-        self._stop_timed_exec()
+        # Detener ejecución rítmica o en segundo plano si está corriendo
+        self._stop_execution()
+        # Descartar la ejecución paso a paso (ya no se reinicia sola al terminar)
+        self._step_manager = None
+        self._step_initialized = False
         # 1. Borra el área de código
         self.code_space.delete("1.0", tk.END)
 
@@ -682,32 +668,35 @@ class RiscVSimulatorApp(tk.Tk):
             self.view_status_2.update_metrics(*default_metrics)
             self.view_status_2.update_pipeline(estado_pipeline_inicial, ciclo=0)
 
-        # 4. Limpia historial
+        # 4. Limpia historial y la distribución de memoria de las vistas
+        self._memory_layout_keys = {}
         self._history = {1: deque(maxlen=10), 2: deque(maxlen=10)}
         self._refresh_history_window()
 
+    def _sim_frame(self, sim_number: int):
+        """Devuelve la vista (BaseSimView) activa que corresponde a sim_number (1..2), o None."""
+        # sim_number es 1 o 2, mapea a self.active_indices
+        if 1 <= sim_number <= len(self.active_indices):
+            return self._tabs.get(self.active_indices[sim_number - 1])
+        return None
+
     def highlight_for_sim(self, sim_number: int, unit_tag: str):
         """
         Resalta en la vista activa que corresponda a sim_number (1..2).
         Si la vista no está activa, no hace nada.
         """
-        # sim_number es 1 o 2, mapea a self.active_indices
-        if 1 <= sim_number <= len(self.active_indices):
-            sim_idx = self.active_indices[sim_number - 1]
-            frame = self._tabs.get(sim_idx)
-            if frame:
-                frame.highlight(unit_tag)
+        frame = self._sim_frame(sim_number)
+        if frame:
+            frame.highlight(unit_tag)
 
     def clear_highlight_for_sim(self, sim_number: int):
         """
         Limpia el resaltado en la vista activa que corresponda a sim_number (1..2).
         Si la vista no está activa, no hace nada.
         """
-        if 1 <= sim_number <= len(self.active_indices):
-            sim_idx = self.active_indices[sim_number - 1]
-            frame = self._tabs.get(sim_idx)
-            if frame:
-                frame.clear_highlights()
+        frame = self._sim_frame(sim_number)
+        if frame:
+            frame.clear_highlights()
 
     def update_system_state_sim(self, view_number: int, ciclo: int, tiempo: float, pc: int):
         """
@@ -757,6 +746,53 @@ class RiscVSimulatorApp(tk.Tk):
         else:
             print(f"Vista {view_number} no está activa o no existe.")
 
+    def set_memory_layout_sim(self, view_number: int, addresses):
+        """
+        Define las direcciones (una por fila) que recorre la memoria de la vista view_number.
+        """
+        if view_number == 1 and self.active_views[self.active_indices[0]]:
+            self.view_status_1.set_memory_layout(addresses)
+        elif view_number == 2 and len(self.active_indices) > 1 and self.active_views[self.active_indices[1]]:
+            self.view_status_2.set_memory_layout(addresses)
+
+    def patch_memory_sim(self, view_number: int, changes: dict):
+        """
+        Actualiza solo las palabras de memoria indicadas (dirección → valor) en la vista view_number.
+        """
+        if view_number == 1 and self.active_views[self.active_indices[0]]:
+            self.view_status_1.patch_memory(changes)
+        elif view_number == 2 and len(self.active_indices) > 1 and self.active_views[self.active_indices[1]]:
+            self.view_status_2.patch_memory(changes)
+
+    def _push_state_changes(self, view_number: int, cpu):
+        """
+        Envía a la vista solo los registros y palabras de memoria modificados desde la última
+        actualización (seguimiento de cambios de RegisterFile y Memory). Si cambió todo
+        (procesador nuevo, restore), redibuja el estado completo.
+        """
+        registers = cpu.registers
+        dirty_regs = registers.take_dirty()
+        if dirty_regs is None:
+            self.update_registers_sim(view_number, registers.dump())
+        elif dirty_regs:
+            self.update_registers_sim(view_number, {f"x{i}": registers.values[i] for i in dirty_regs})
+
+        data_mem = cpu.data_mem
+        dirty_words = data_mem.take_dirty()
+        # La vista recorre toda la memoria plana, o las páginas reservadas de una SparseMemory
+        if isinstance(data_mem, SparseMemory):
+            layout_key = tuple(sorted(data_mem.pages))
+        else:
+            layout_key = len(data_mem)
+        if self._memory_layout_keys.get(view_number) != layout_key:
+            self._memory_layout_keys[view_number] = layout_key
+            self.set_memory_layout_sim(view_number, memory_layout(data_mem))
+            dirty_words = None  # filas nuevas: redibujar todo
+        if dirty_words is None:
+            self.update_memory_sim(view_number, data_mem.dump())
+        elif dirty_words:
+            self.patch_memory_sim(view_number, {addr: data_mem.load_word(addr) for addr in dirty_words})
+
     def update_pipeline_sim(self, view_number: int, pipeline_info: dict, ciclo: int):
         """
         Actualiza la sección pipeline de la vista view_number.
@@ -992,9 +1028,11 @@ class RiscVSimulatorApp(tk.Tk):
 
         # c) Ejecución completa
         tk.Button(bar, text="Run-All", command=self._run_full_exec).pack(side="left", padx=2)
+        self._pause_button = tk.Button(bar, text="Pause", width=6, command=self._toggle_pause_full_exec)
+        self._pause_button.pack(side="left", padx=2)
 
-        # d) Detener ejecución continua
-        tk.Button(bar, text="Stop", command=self._stop_timed_exec).pack(side="left", padx=2)
+        # d) Detener ejecución continua (rítmica o completa)
+        tk.Button(bar, text="Stop", command=self._stop_execution).pack(side="left", padx=2)
 
         # e) Reset
         tk.Button(bar, text="Reset", command=self._reset_simulation).pack(side="left", padx=2)
@@ -1101,70 +1139,14 @@ class RiscVSimulatorApp(tk.Tk):
 
     # --- NUEVO: Highlight para modo STEP (paso a paso) ---
 
+    # Milisegundos que permanece encendido un bloque en modo step
+    STEP_HIGHLIGHT_MS = 400
+
     def _highlight_pipeline_units_step(self, sim_number, pipe):
         """
         Ilumina los componentes relevantes según la instrucción en cada etapa del pipeline SOLO para modo step.
         El highlight se apaga automáticamente tras un breve tiempo.
         """
-        stage_unit_map = {
-            "IF_ID": ["instruction_mem", "mux_pc", "reg_pc", "adder"],
-            "ID_EX": ["register_file", "reg1", "reg2", "extend"],
-            "EX_MEM": ["alu", "adderPC", "mux_srcB", "mux_ForwardAE", "mux_ForwardBE"],
-            "MEM_WB": ["data_mem", "mux_result", "reg3", "reg4"]
-        }
-        instr_type_map = {
-            "R": ["register_file", "alu", "mux_result"],
-            "I": ["register_file", "extend", "alu", "mux_result"],
-            "S": ["register_file", "extend", "data_mem"],
-            "B": ["register_file", "extend", "adderPC"],
-            "U": ["register_file", "extend", "mux_result"],
-            "J": ["register_file", "extend", "mux_result"],
-            "LW": ["register_file", "extend", "data_mem", "mux_result"],
-            "SW": ["register_file", "extend", "data_mem"],
-        }
-        def get_instr_type(instr):
-            op = getattr(instr, "opcode", "nop")
-            if op in {"add", "sub", "and", "or", "xor", "slt", "sll", "srl", "sra"}:
-                return "R"
-            elif op in {"addi", "andi", "ori", "slti", "slli", "srli", "srai", "jalr"}:
-                return "I"
-            elif op in {"lw"}:
-                return "LW"
-            elif op in {"sw"}:
-                return "SW"
-            elif op in {"beq", "bne", "blt", "bge", "bltu", "bgeu"}:
-                return "B"
-            elif op in {"lui", "auipc"}:
-                return "U"
-            elif op in {"jal"}:
-                return "J"
-            else:
-                return None
-
-        # Limpiar highlights previos SOLO para step (no afecta delay)
-        self.clear_highlight_for_sim(sim_number)
-        # Para cada etapa, iluminar si hay instrucción activa
-        for stage, units in stage_unit_map.items():
-            stage_dict = getattr(pipe, stage, None)
-            if stage_dict and "instr" in stage_dict:
-                instr = stage_dict["instr"]
-                if getattr(instr, "opcode", "nop") != "nop":
-                    for unit in units:
-                        self._highlight_with_auto_clear_step(sim_number, unit)
-                    instr_type = get_instr_type(instr)
-                    if instr_type and instr_type in instr_type_map:
-                        for unit in instr_type_map[instr_type]:
-                            self._highlight_with_auto_clear_step(sim_number, unit)
-
-    def _highlight_with_auto_clear_step(self, sim_number, unit_tag, delay=400):
-        """
-        Ilumina un componente para modo step y lo apaga automáticamente tras 'delay' ms.
-        """
-        self.highlight_for_sim(sim_number, unit_tag)
-        self.after(delay, lambda: self._auto_clear_highlight_step(sim_number, unit_tag))
-
-    def _auto_clear_highlight_step(self, sim_number, unit_tag):
-        """
-        Apaga el highlight de un componente para modo step.
-        """
-        self.clear_highlight_for_sim(sim_number)
\ No newline at end of file
+        frame = self._sim_frame(sim_number)
+        if frame:
+            frame.set_highlighted(active_units(pipe), hold_ms=self.STEP_HIGHLIGHT_MS)
\ No newline at end of file
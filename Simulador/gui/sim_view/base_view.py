@@ -1,5 +1,6 @@
 import tkinter as tk
 from abc import ABC, abstractmethod
+from .highlight_scheduler import HighlightScheduler
 
 class BaseSimView(tk.Frame, ABC):
     """Canvas con zoom + paneo + scrollbars."""
@@ -26,6 +27,9 @@ class BaseSimView(tk.Frame, ABC):
 
         self._scale = 1.0
 
+        # Resaltados agrupados por cuadros (un solo tick de after() por vista)
+        self.highlights = HighlightScheduler(self)
+
         # Eventos mouse para zoom y paneo
         self.canvas.bind("<ButtonPress-1>", self._on_pan_start)
         self.canvas.bind("<B1-Motion>", self._on_pan_move)
@@ -67,20 +71,31 @@ class BaseSimView(tk.Frame, ABC):
     def _on_pan_move(self, event):
         self.canvas.scan_dragto(event.x, event.y, gain=1)
 
-    def highlight(self, unit):
+    def _paint_unit(self, unit, on: bool):
+        """Aplica el color de un bloque; solo lo llama HighlightScheduler al dibujar un cuadro."""
         block = self.units.get(unit)
         if block and block.tag:
-            self.canvas.itemconfig(block.tag, fill="lightblue")
+            self.canvas.itemconfig(block.tag, fill="lightblue" if on else "lightgray")
+
+    def set_highlighted(self, units, hold_ms=None):
+        """
+        Define los bloques encendidos en este ciclo (el resto se apaga) y, si se indica hold_ms,
+        los apaga automáticamente después de ese tiempo.
+        """
+        self.highlights.set_units(units, hold_ms)
+
+    def highlight(self, unit):
+        self.highlights.highlight(unit)
 
     def clear_highlights(self):
-        for block in self.units.values():
-            if block.tag:
-                self.canvas.itemconfig(block.tag, fill="lightgray")
+        self.highlights.clear_all()
 
     def clear_highlight(self, unit):
         """
         Apaga el highlight de un solo bloque identificado por unit (unit_tag).
         """
-        block = self.units.get(unit)
-        if block and block.tag:
-            self.canvas.itemconfig(block.tag, fill="lightgray")
+        self.highlights.clear(unit)
+
+    def destroy(self):
+        self.highlights.cancel()
+        super().destroy()
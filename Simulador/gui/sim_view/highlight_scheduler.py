@@ -0,0 +1,122 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+"""
+Class: HighlightScheduler
+Planificador de resaltados por cuadros para un BaseSimView. La simulación solo declara qué
+bloques deben estar encendidos (estado objetivo); el planificador aplica los cambios en un único
+tick de after() a una tasa máxima de cuadros, comparando con el último cuadro dibujado y llamando
+a itemconfig solo para los bloques que cambiaron.
+
+Así cada vista tiene como máximo dos callbacks pendientes en Tk (el próximo cuadro y el apagado
+automático), sin importar cuántos bloques o ciclos se resalten.
+
+Attributes:
+- view: BaseSimView - vista dueña del canvas (usa view.after y view._paint_unit).
+- frame_ms: int - milisegundos mínimos entre cuadros.
+- target: set - bloques que deben quedar encendidos en el próximo cuadro.
+- applied: set - bloques encendidos en el último cuadro dibujado.
+
+Methods:
+- set_units: Reemplaza el estado objetivo (opcionalmente con apagado automático).
+- highlight / clear / clear_all: Modifican el estado objetivo.
+- cancel: Cancela los callbacks pendientes.
+
+Example:
+    scheduler = HighlightScheduler(view)
+    scheduler.set_units({"alu", "register_file"}, hold_ms=400)
+"""
+
+class HighlightScheduler:
+    FRAME_MS = 33  # ~30 cuadros por segundo
+
+    def __init__(self, view, frame_ms: int = None):
+        """
+        Function: __init__
+        Inicializa el planificador sin bloques encendidos.
+        Params:
+        - view: BaseSimView - vista a redibujar.
+        - frame_ms: int - tiempo mínimo entre cuadros (por defecto FRAME_MS).
+        """
+        self.view = view
+        self.frame_ms = frame_ms if frame_ms is not None else self.FRAME_MS
+        self.target = set()
+        self.applied = set()
+        self._frame_id = None
+        self._hold_id = None
+
+    def set_units(self, units, hold_ms: int = None):
+        """
+        Function: set_units
+        Define los bloques encendidos del ciclo actual; el resto se apaga en el próximo cuadro.
+        Params:
+        - units: iterable - tags de los bloques a encender.
+        - hold_ms: int o None - si se indica, los bloques se apagan solos tras hold_ms ms.
+        Example:
+            scheduler.set_units({"alu"}, hold_ms=400)
+        """
+        self.target = set(units)
+        self._cancel_hold()
+        if hold_ms is not None:
+            self._hold_id = self.view.after(hold_ms, self._on_hold_expired)
+        self._request_frame()
+
+    def highlight(self, unit: str):
+        self.target.add(unit)
+        self._request_frame()
+
+    def clear(self, unit: str):
+        self.target.discard(unit)
+        self._request_frame()
+
+    def clear_all(self):
+        self.target = set()
+        self._cancel_hold()
+        self._request_frame()
+
+    def cancel(self):
+        """
+        Function: cancel
+        Cancela el cuadro y el apagado pendientes (por ejemplo, al destruir la vista).
+        """
+        self._cancel_hold()
+        if self._frame_id is not None:
+            self.view.after_cancel(self._frame_id)
+            self._frame_id = None
+
+    def _cancel_hold(self):
+        if self._hold_id is not None:
+            self.view.after_cancel(self._hold_id)
+            self._hold_id = None
+
+    def _on_hold_expired(self):
+        self._hold_id = None
+        self.target = set()
+        self._request_frame()
+
+    def _request_frame(self):
+        """Programa un cuadro si no hay uno pendiente; varios cambios se agrupan en el mismo cuadro."""
+        if self._frame_id is None:
+            self._frame_id = self.view.after(self.frame_ms, self._render_frame)
+
+    def _render_frame(self):
+        """
+        Function: _render_frame
+        Aplica la diferencia entre el estado objetivo y el último cuadro dibujado.
+        """
+        self._frame_id = None
+        target = self.target
+        applied = self.applied
+        for unit in applied - target:
+            self.view._paint_unit(unit, False)
+        for unit in target - applied:
+            self.view._paint_unit(unit, True)
+        self.applied = set(target)
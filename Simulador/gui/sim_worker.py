@@ -0,0 +1,138 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+import queue
+import threading
+import time
+
+from core.simulator_manager import build_record, pipeline_strings
+
+"""
+Class: SimulationWorker
+Hilo de fondo que ejecuta los procesadores de un SimulatorManager ciclo a ciclo, fuera del hilo
+de Tk. No toca widgets: publica mensajes en una cola que la GUI vacía con after().
+
+Los procesadores activos avanzan intercalados (un ciclo de cada uno por vuelta) y cada uno publica
+como máximo una instantánea por intervalo, para no saturar la cola ni la GUI.
+
+Mensajes (tuplas) publicados en la cola:
+- ("state", view_number, snapshot): snapshot = {"ciclo", "tiempo", "pc", "metricas", "pipeline",
+  "registros"}, donde "registros" solo contiene los registros que cambiaron desde la instantánea anterior.
+- ("done", view_number, record): registro final de build_record (métricas, registros, memoria).
+- ("error", view_number, mensaje): el procesador falló y se detuvo.
+- ("finished", None, cancelled): el hilo terminó (cancelled=True si se canceló).
+
+Attributes:
+- manager: SimulatorManager - procesadores ya creados (manager.cpus, manager.active_indices).
+- program_lines: list[str] - programa a cargar en cada procesador.
+- messages: queue.Queue - cola hacia la GUI.
+- interval: float - segundos mínimos entre instantáneas de un mismo procesador.
+- max_cycles: int o None - corta la ejecución al llegar a esta cantidad de ciclos.
+
+Methods:
+- run: Cuerpo del hilo.
+- pause / resume / cancel: Control desde la GUI.
+- is_paused: Indica si está en pausa.
+
+Example:
+    worker = SimulationWorker(manager, program_lines)
+    worker.start()
+    kind, view, payload = worker.messages.get_nowait()
+"""
+
+class SimulationWorker(threading.Thread):
+    def __init__(self, manager, program_lines: list, messages: queue.Queue = None,
+                 interval: float = 0.05, max_cycles: int = None):
+        super().__init__(name="SimulationWorker", daemon=True)
+        self.manager = manager
+        self.program_lines = program_lines
+        self.messages = messages if messages is not None else queue.Queue()
+        self.interval = interval
+        self.max_cycles = max_cycles
+        self._cancelled = threading.Event()
+        self._running = threading.Event()  # activo = no está en pausa
+        self._running.set()
+
+    def pause(self):
+        """Detiene la simulación al terminar el ciclo actual."""
+        self._running.clear()
+
+    def resume(self):
+        """Reanuda una simulación en pausa."""
+        self._running.set()
+
+    def is_paused(self) -> bool:
+        return not self._running.is_set()
+
+    def cancel(self):
+        """Cancela la simulación (también si está en pausa)."""
+        self._cancelled.set()
+        self._running.set()
+
+    def _post_state(self, view_number: int, cpu, last_registers: list):
+        """
+        Function: _post_state
+        Publica la instantánea de un procesador con solo los registros modificados.
+        Params:
+        - view_number: int - vista destino (1..n).
+        - cpu: PipelineEngine - procesador a describir.
+        - last_registers: list - valores publicados antes; se actualiza en sitio.
+        """
+        values = cpu.registers.values
+        changed = {f"x{i}": value for i, value in enumerate(values) if value != last_registers[i]}
+        last_registers[:] = values
+        self.messages.put(("state", view_number, {
+            "ciclo": cpu.metrics.ciclos_totales,
+            "tiempo": cpu.metrics.get_elapsed_time(),
+            "pc": cpu.pipeline.IF_ID.pc,
+            "metricas": cpu.metrics.to_dict(),
+            "pipeline": pipeline_strings(cpu.pipeline),
+            "registros": changed,
+        }))
+
+    def run(self):
+        cpus = self.manager.cpus
+        pending = []
+        for view_idx, cpu in enumerate(cpus):
+            try:
+                cpu.load_program(self.program_lines)
+            except Exception as e:
+                self.messages.put(("error", view_idx + 1, str(e)))
+                continue
+            pending.append(view_idx)
+
+        last_registers = [[None] * 32 for _ in cpus]
+        last_post = [0.0] * len(cpus)
+        while pending and not self._cancelled.is_set():
+            if not self._running.is_set():
+                self._running.wait()
+                continue
+            for view_idx in list(pending):
+                cpu = cpus[view_idx]
+                try:
+                    done = cpu.run_one_cycle()
+                except Exception as e:
+                    self.messages.put(("error", view_idx + 1, str(e)))
+                    pending.remove(view_idx)
+                    continue
+                limit = self.max_cycles is not None and cpu.metrics.ciclos_totales >= self.max_cycles
+                now = time.perf_counter()
+                if done or limit or now - last_post[view_idx] >= self.interval:
+                    last_post[view_idx] = now
+                    self._post_state(view_idx + 1, cpu, last_registers[view_idx])
+                if done or limit:
+                    if limit and not done:
+                        cpu.metrics.stop_timer()
+                    sim_idx = self.manager.active_indices[view_idx]
+                    self.messages.put(("done", view_idx + 1,
+                                       build_record(sim_idx, cpu, done, include_state=True)))
+                    pending.remove(view_idx)
+        self.messages.put(("finished", None, self._cancelled.is_set()))
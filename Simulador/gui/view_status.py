@@ -1,11 +1,20 @@
 import tkinter as tk
+import tkinter.font
+from bisect import bisect_left
 
 
 class ViewStatus(tk.Frame):
+    # Rango de memoria mostrado hasta conocer la memoria del procesador (set_memory_layout)
+    MEMORY_WORDS = 1024
+
     def __init__(self, parent, view_name="Vista", *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         self.view_name = view_name
-        self._latest_memory_data = []  # para mantener datos
+        self._latest_memory_data = {}  # dirección → valor de todo el rango (modelo de la vista)
+        self._mem_addresses = range(0, self.MEMORY_WORDS * 4, 4)  # dirección de cada fila, ordenadas
+        self._reg_values = [None] * 32  # último valor mostrado de cada registro
+        self._mem_first_row = 0  # primera fila visible de la memoria
+        self._mem_visible_rows = 0  # filas dibujadas en memory_text
 
         # ───── TOOLBAR SUPERIOR ─────
         toolbar = tk.Frame(self, relief=tk.RAISED, bd=2)
@@ -94,19 +103,26 @@ class ViewStatus(tk.Frame):
         self._memory_panel.rowconfigure(0, weight=1)
 
         hscroll_mem = tk.Scrollbar(self._memory_panel, orient="horizontal")
-        vscroll_mem = tk.Scrollbar(self._memory_panel, orient="vertical")
+        self._vscroll_mem = tk.Scrollbar(self._memory_panel, orient="vertical")
 
+        # Vista virtualizada: el Text solo contiene las filas visibles; la barra vertical
+        # recorre el rango completo y se redibuja la ventana al desplazarse.
         self.memory_text = tk.Text(
             self._memory_panel, wrap="none", font=("Courier", 9),
-            xscrollcommand=hscroll_mem.set, yscrollcommand=vscroll_mem.set
+            xscrollcommand=hscroll_mem.set, state="disabled"
         )
 
+        self._mem_font = tk.font.Font(font=self.memory_text.cget("font"))
         self.memory_text.grid(row=0, column=0, sticky="nsew")
-        vscroll_mem.grid(row=0, column=1, sticky="ns")
+        self._vscroll_mem.grid(row=0, column=1, sticky="ns")
         hscroll_mem.grid(row=1, column=0, columnspan=2, sticky="ew")
 
         hscroll_mem.config(command=self.memory_text.xview)
-        vscroll_mem.config(command=self.memory_text.yview)
+        self._vscroll_mem.config(command=self._on_memory_scroll)
+        self.memory_text.bind("<Configure>", lambda e: self._render_memory_window())
+        self.memory_text.bind("<MouseWheel>", self._on_memory_wheel)
+        self.memory_text.bind("<Button-4>", lambda e: self._scroll_memory_rows(-3))
+        self.memory_text.bind("<Button-5>", lambda e: self._scroll_memory_rows(3))
 
     # ------------------- Métodos para cambiar vista -------------------
 
@@ -136,50 +152,113 @@ class ViewStatus(tk.Frame):
         Actualiza los labels de registros según un diccionario con claves 'x0', 'x1', ... 'x31'.
 
         Params:
-        - reg_dict: dict con claves tipo 'x0'...'x31' y valores enteros.
+        - reg_dict: dict con claves tipo 'x0'...'x31' y valores enteros. Puede traer solo los
+          registros modificados.
 
-        Nota: Solo actualiza los registros visibles (x0 a x31).
+        Nota: Solo reconfigura los labels cuyo valor cambió respecto al último mostrado.
         """
-        for i in range(len(self.reg_labels)):  # i de 0 a 31
-            reg_name = f"x{i}"
-            if reg_name in reg_dict:
-                value = reg_dict[reg_name]
+        for reg_name, value in reg_dict.items():
+            i = int(reg_name[1:])
+            if 0 <= i < 32 and self._reg_values[i] != value:
+                self._reg_values[i] = value
                 self.reg_labels[i].config(text=f"{reg_name}: {value:#010x}")
 
+    def set_memory_layout(self, addresses):
+        """
+        Define las direcciones que recorre la vista de memoria, una por fila y en orden creciente:
+        range(0, len(memoria), 4) para una memoria plana o las palabras de las páginas reservadas
+        de una SparseMemory.
+        """
+        if addresses == self._mem_addresses:
+            return
+        self._mem_addresses = addresses
+        self._render_memory_window()
+
     def update_memory(self, mem):
         """
-        Refresca la ventana de memoria.
+        Reemplaza el contenido de la ventana de memoria.
 
         Formatos aceptados:
           1) Iterable de pares (addr, value)
           2) dict {addr: value}
-        El contenido se ordena por dirección antes de mostrarse.
+        Se muestran las direcciones de set_memory_layout; las que no tienen dato valen 0.
+        Solo se redibujan las filas visibles.
         """
-        # --- Limpiamos ------------------------------------------------------
-        self.memory_text.config(state='normal')  # por si está readonly
-        self.memory_text.delete('1.0', tk.END)
-
-        # --- Normalizamos y ordenamos --------------------------------------
-        # Siempre mostrar el rango completo de memoria (0 a 4092, 1024 palabras)
-        MEM_SIZE_WORDS = 1024
-        ADDR_START = 0
-        ADDR_END = (MEM_SIZE_WORDS - 1) * 4
-
-        # Convertir a diccionario si es iterable de pares
-        if isinstance(mem, dict):
+        # Copiar a un diccionario (dict o iterable de pares)
+        try:
             mem_dict = dict(mem)
+        except Exception:
+            mem_dict = {}
+        self._latest_memory_data = mem_dict
+        self._render_memory_window()
+
+    def _memory_row(self, addr: int):
+        """Fila de la vista que muestra addr, o None si la dirección no está en la vista."""
+        addresses = self._mem_addresses
+        row = bisect_left(addresses, addr)
+        if row < len(addresses) and addresses[row] == addr:
+            return row
+        return None
+
+    def patch_memory(self, changes: dict):
+        """
+        Actualiza solo las palabras indicadas (dirección → valor), por ejemplo las que devuelve
+        Memory.take_dirty(). Las filas fuera de la ventana visible solo se guardan en el modelo.
+        """
+        first = self._mem_first_row
+        last = first + self._mem_visible_rows
+        text = self.memory_text
+        text.config(state="normal")
+        for addr, val in changes.items():
+            row = self._memory_row(addr)
+            if row is None:
+                continue
+            self._latest_memory_data[addr] = val
+            if first <= row < last:
+                line = row - first + 1
+                text.delete(f"{line}.0", f"{line}.end")
+                text.insert(f"{line}.0", f"{addr:08X}: {val & 0xFFFFFFFF:08X}")
+        text.config(state="disabled")  # evita edición casual
+
+    def _render_memory_window(self):
+        """Dibuja solo las filas de memoria que caben en el widget, desde _mem_first_row."""
+        text = self.memory_text
+        line_height = max(1, self._mem_font.metrics("linespace"))
+        rows = max(1, text.winfo_height() // line_height)
+        addresses = self._mem_addresses
+        total = len(addresses)
+        first = max(0, min(self._mem_first_row, total - rows))
+        last = min(total, first + rows)
+        self._mem_first_row = first
+        self._mem_visible_rows = last - first
+
+        data = self._latest_memory_data
+        lines = [f"{addr:08X}: {data.get(addr, 0) & 0xFFFFFFFF:08X}" for addr in addresses[first:last]]
+        text.config(state="normal")
+        text.delete("1.0", tk.END)
+        text.insert("1.0", "\n".join(lines))
+        text.config(state="disabled")
+        if total:
+            self._vscroll_mem.set(first / total, last / total)
         else:
-            try:
-                mem_dict = dict(mem)
-            except Exception:
-                mem_dict = {}
-
-        # --- Mostramos el rango completo, aunque no todas las direcciones tengan datos ---
-        for addr in range(ADDR_START, ADDR_END + 1, 4):
-            val = mem_dict.get(addr, 0)
-            self.memory_text.insert(tk.END, f"{addr:08X}: {val:08X}\n")
-
-        self.memory_text.config(state='disabled')  # evita edición casual
+            self._vscroll_mem.set(0.0, 1.0)
+
+    def _scroll_memory_rows(self, delta: int):
+        self._mem_first_row += delta
+        self._render_memory_window()
+        return "break"
+
+    def _on_memory_wheel(self, event):
+        return self._scroll_memory_rows(-3 if event.delta > 0 else 3)
+
+    def _on_memory_scroll(self, *args):
+        """Comando de la barra vertical: 'moveto fracción' o 'scroll n units|pages'."""
+        if args[0] == "moveto":
+            self._mem_first_row = int(float(args[1]) * len(self._mem_addresses))
+        elif args[0] == "scroll":
+            step = max(1, self._mem_visible_rows - 1) if args[2] == "pages" else 1
+            self._mem_first_row += int(args[1]) * step
+        self._render_memory_window()
 
     def update_metrics(self, ciclos, instrucciones, cpi, branches, branches_ok, precision):
         self.metric_labels["ciclos"].config(text=f"Ciclos totales: {ciclos}")
@@ -0,0 +1,19 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from bisect import bisect_right
+
+"""
+Module: tests
+Pruebas de regresión del simulador (unittest). Se ejecutan desde la carpeta Simulador:
+    python -m pytest tests
+    python -m unittest discover -s tests -t .
+"""
@@ -0,0 +1,79 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from bisect import bisect_right
+
+import unittest
+from core.instruction import Instruction
+from core.rv32i import encode
+from core.simulator_manager import CPU_CLASSES
+from core.functional import FunctionalSimulator
+
+"""
+Module: test_decode_cache
+Invalidación de la caché de decodificación (core/decode_cache.py): al escribir la memoria de
+instrucciones se descarta la micro-op de esa dirección y la siguiente ejecución usa la instrucción
+nueva, tanto en el pipeline como en el modo funcional (con y sin caché de bloques).
+"""
+
+# Lazo de 3 vueltas (líneas de load_program: etiquetas ya resueltas). x2 suma 1 por vuelta; tras la
+# primera vuelta el cuerpo pasa a sumar 10 (1 + 10 + 10 = 21)
+PROGRAM = [
+    "addi x1, x0, 3",
+    "addi x2, x2, 1",
+    "addi x1, x1, -1",
+    "bne x1, x0, -8",
+]
+PATCHED_PC = 4
+PATCH = "addi x2, x2, 10"
+RETIRED_BEFORE_PATCH = 4
+EXPECTED_X2 = 21
+
+
+def patch(instr_mem):
+    instr_mem.store_word(PATCHED_PC, encode(Instruction(PATCH, PATCHED_PC)))
+
+
+class DecodeCacheInvalidationTest(unittest.TestCase):
+    def test_pipeline_refetches_written_instruction(self):
+        for cpu_class in CPU_CLASSES:
+            with self.subTest(cpu=cpu_class.__name__):
+                cpu = cpu_class()
+                cpu.load_program(PROGRAM)
+                while cpu.metrics.instrucciones_retiradas < RETIRED_BEFORE_PATCH:
+                    cpu.run_one_cycle()
+                self.assertIsNotNone(cpu.decode_cache.lookup(PATCHED_PC))
+                patch(cpu.instr_mem)
+                self.assertIsNone(cpu.decode_cache.lookup(PATCHED_PC))
+                while not cpu.run_one_cycle():
+                    pass
+                self.assertEqual(cpu.registers.read("x2"), EXPECTED_X2)
+
+    def test_functional_refetches_written_instruction(self):
+        for block_cache in (False, True):
+            with self.subTest(block_cache=block_cache):
+                fast = FunctionalSimulator(block_cache=block_cache)
+                fast.load_program(PROGRAM)
+                fast.run(RETIRED_BEFORE_PATCH)
+                patch(fast.instr_mem)
+                self.assertIsNone(fast.decode_cache.lookup(PATCHED_PC))
+                fast.run()
+                self.assertEqual(fast.registers.read("x2"), EXPECTED_X2)
+
+    def test_whole_cache_invalidation(self):
+        fast = FunctionalSimulator()
+        fast.load_program(PROGRAM)
+        fast.instr_mem.reset()
+        self.assertIsNone(fast.decode_cache.lookup(0))
+
+
+if __name__ == "__main__":
+    unittest.main()
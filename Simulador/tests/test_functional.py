@@ -0,0 +1,73 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from bisect import bisect_right
+
+import os
+import unittest
+from core.processor import Processor
+from core.functional import FunctionalSimulator
+
+"""
+Module: test_functional
+Modo funcional (core/functional.py), con y sin caché de bloques: después de N instrucciones tiene
+los mismos registros y memoria de datos que Processor al retirar N instrucciones, y el procesador
+que recibe el estado con handoff termina igual que una ejecución completa con pipeline.
+"""
+
+SIM_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROGRAMS = [
+    os.path.join(SIM_ROOT, "programa.s"),
+    os.path.join(SIM_ROOT, "benchmarks", "programs", "memcpy.s"),
+    os.path.join(SIM_ROOT, "benchmarks", "programs", "bubble_sort.s"),
+]
+HANDOFF_POINTS = (1, 7, 50, 333)
+
+
+def run_to_end(cpu):
+    while not cpu.run_one_cycle():
+        pass
+
+
+def architectural_state(cpu) -> tuple:
+    return list(cpu.registers.values), cpu.data_mem.digest()
+
+
+class FunctionalHandoffTest(unittest.TestCase):
+    def test_matches_processor_at_handoff(self):
+        for path in PROGRAMS:
+            reference = Processor()
+            reference.load_program_file(path)
+            run_to_end(reference)
+            final = architectural_state(reference)
+            for count in HANDOFF_POINTS:
+                # Processor detenido tras retirar count instrucciones
+                partial = Processor()
+                partial.load_program_file(path)
+                while partial.metrics.instrucciones_retiradas < count and not partial.run_one_cycle():
+                    pass
+                for block_cache in (False, True):
+                    with self.subTest(program=os.path.basename(path), count=count, block_cache=block_cache):
+                        fast = FunctionalSimulator(block_cache=block_cache)
+                        fast.load_program_file(path)
+                        fast.run(count)
+                        self.assertEqual(fast.instructions, partial.metrics.instrucciones_retiradas)
+                        self.assertEqual(architectural_state(fast), architectural_state(partial))
+
+                        cpu = Processor()
+                        fast.handoff(cpu)
+                        self.assertEqual(architectural_state(cpu), architectural_state(partial))
+                        run_to_end(cpu)
+                        self.assertEqual(architectural_state(cpu), final)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from bisect import bisect_right
+
+import os
+import unittest
+from core.simulator_manager import CPU_CLASSES
+
+"""
+Module: test_history
+Ejecución inversa (core/history.py): después de step_back el procesador queda exactamente en el
+estado que tenía en ese ciclo al avanzar (capture_state y memoria de datos), en todas las variantes.
+"""
+
+PROGRAM = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "programa.s")
+
+
+def full_state(cpu) -> tuple:
+    return cpu.capture_state(), cpu.data_mem.snapshot()
+
+
+class ReverseExecutionTest(unittest.TestCase):
+    def test_step_back_restores_exact_state(self):
+        for cpu_class in CPU_CLASSES:
+            with self.subTest(cpu=cpu_class.__name__):
+                cpu = cpu_class()
+                cpu.load_program_file(PROGRAM)
+                cpu.enable_history(checkpoint_interval=8)
+                states = {}
+                done = False
+                while not done:
+                    states[cpu.metrics.ciclos_totales] = full_state(cpu)
+                    done = cpu.run_one_cycle()
+                end = cpu.metrics.ciclos_totales
+                final = full_state(cpu)
+
+                cycle = end
+                for back in (1, 5, 8, 37, 60):  # dentro de un intervalo, en el borde y entre varios
+                    cycle -= back
+                    self.assertEqual(cpu.step_back(back), cycle)
+                    self.assertEqual(full_state(cpu), states[cycle])
+
+                # Avanzar de nuevo reproduce la misma ejecución
+                while not cpu.run_one_cycle():
+                    pass
+                self.assertEqual(cpu.metrics.ciclos_totales, end)
+                self.assertEqual(full_state(cpu), final)
+
+
+if __name__ == "__main__":
+    unittest.main()
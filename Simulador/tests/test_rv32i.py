@@ -0,0 +1,93 @@
+"""
+================================== LICENCIA ==============================
+MIT License
+Copyright (c) 2025 José Bernardo Barquero Bonilla,
+Jose Eduardo Campos Salazar,
+Jimmy Feng Feng,
+Alexander Montero Vargas
+Consulta el archivo LICENSE para más detalles.
+==========================================================================
+"""
+
+from bisect import bisect_right
+
+import unittest
+from core.instruction import Instruction, AluOp, ALU_FUNCTIONS
+from core.rv32i import encode, decode, NOP_WORD
+
+"""
+Module: test_rv32i
+Codificación y decodificación de palabras RV32I (core/rv32i.py): cada formato vuelve a los mismos
+campos, incluidos inmediatos negativos de tipo I/S/B/J y de tipo U.
+"""
+
+# Una instrucción por formato, con inmediatos en los extremos de su rango
+ROUND_TRIP = [
+    "add x1, x2, x3",
+    "sra x31, x30, x29",
+    "addi x1, x0, -1",
+    "addi x1, x2, -2048",
+    "andi x5, x6, 2047",
+    "slli x3, x4, 31",
+    "srai x3, x4, 5",
+    "lw x5, -4(x2)",
+    "lbu x5, 3(x2)",
+    "sw x7, -2048(x8)",
+    "sb x7, 2047(x8)",
+    "beq x1, x2, -8",
+    "bgeu x1, x2, 4094",
+    "jal x1, -1048576",
+    "jalr x0, -12(x1)",
+    "lui x5, 1048575",
+    "auipc x6, 524288",
+]
+
+
+def fields(instr: Instruction) -> tuple:
+    return instr.opcode, instr.type, instr.rd, instr.rs1, instr.rs2, instr.imm
+
+
+class RoundTripTest(unittest.TestCase):
+    def test_encode_decode_round_trip(self):
+        for text in ROUND_TRIP:
+            with self.subTest(text=text):
+                instr = Instruction(text, 8)
+                word = encode(instr)
+                decoded = decode(word, 8)
+                self.assertEqual(fields(decoded), fields(instr))
+                self.assertEqual(encode(decoded), word)
+
+    def test_negative_i_immediates(self):
+        for text, imm in (("addi x1, x0, -1", -1), ("lw x5, -4(x2)", -4), ("sw x7, -2048(x8)", -2048),
+                          ("beq x1, x2, -8", -8), ("jal x1, -1048576", -1048576)):
+            with self.subTest(text=text):
+                self.assertEqual(decode(encode(Instruction(text, 0))).imm, imm)
+
+    def test_negative_u_immediates(self):
+        # Un negativo de 20 bits es el mismo campo que su valor sin signo
+        for negative, unsigned in (("lui x5, -1", "lui x5, 1048575"), ("auipc x6, -524288", "auipc x6, 524288")):
+            with self.subTest(text=negative):
+                word = encode(Instruction(negative, 0))
+                self.assertEqual(word, encode(Instruction(unsigned, 0)))
+                self.assertEqual(fields(decode(word)), fields(Instruction(unsigned, 0)))
+        # El valor que escribe la ALU es el de 32 bits con signo
+        self.assertEqual(ALU_FUNCTIONS[AluOp.LUI](0, 0xFFFFF, 0), -4096)
+        self.assertEqual(ALU_FUNCTIONS[AluOp.AUIPC](0, 0x80000, 16), 16 - (1 << 31))
+
+    def test_nop(self):
+        self.assertEqual(encode(Instruction("nop", 0)), NOP_WORD)
+        self.assertEqual(decode(NOP_WORD).opcode, "nop")
+
+    def test_out_of_range_immediate(self):
+        for text in ("addi x1, x0, 2048", "beq x1, x2, 3", "lui x5, 1048576"):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    encode(Instruction(text, 0))
+
+    def test_undecodable_word(self):
+        with self.assertRaises(ValueError):
+            decode(0)
+
+
+if __name__ == "__main__":
+    unittest.main()